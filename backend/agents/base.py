@@ -4,13 +4,218 @@ All agents are stateless and communicate only through the Orchestrator.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
-from openai import OpenAI
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
+import hashlib
+import json
+import threading
+import time
+import httpx
+import numpy as np
+import openai
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import os
 from ..modules.rag import RAGModule
 from ..modules.logging import LoggingModule
 
 
+# One OpenAI client per API key, shared by every agent in the process so
+# they reuse the same HTTP/2 connection pool.
+HTTP_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=64)
+
+_clients: Dict[str, OpenAI] = {}
+_async_clients: Dict[str, AsyncOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(api_key: str) -> OpenAI:
+    """Get the shared sync OpenAI client for an API key."""
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = OpenAI(
+                api_key=api_key,
+                http_client=DefaultHttpxClient(http2=True, limits=HTTP_CONNECTION_LIMITS)
+            )
+        return client
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """Get the shared async OpenAI client for an API key."""
+
+    with _clients_lock:
+        client = _async_clients.get(api_key)
+        if client is None:
+            client = _async_clients[api_key] = AsyncOpenAI(
+                api_key=api_key,
+                http_client=DefaultAsyncHttpxClient(http2=True, limits=HTTP_CONNECTION_LIMITS)
+            )
+        return client
+
+
+# Transient OpenAI failures are retried with exponential backoff; everything
+# else (bad request, auth, ...) propagates immediately with its original type.
+RETRYABLE_OPENAI_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+)
+
+_retry_transient_errors = retry(
+    retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+
+
+# Requests-per-minute budget shared by all async calls to the same model
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+
+_rate_limiters: Dict[str, AsyncLimiter] = {}
+
+
+def _get_rate_limiter(model: str) -> AsyncLimiter:
+    """Get the token-bucket rate limiter for a model."""
+
+    limiter = _rate_limiters.get(model)
+    if limiter is None:
+        limiter = _rate_limiters[model] = AsyncLimiter(OPENAI_RPM_LIMIT, 60)
+    return limiter
+
+
+# OpenAI Batch API limits for non-interactive workloads
+BATCH_MAX_REQUESTS = 1000
+BATCH_POLL_INTERVAL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+# In-process response cache for low-temperature (near-deterministic) calls.
+# Higher temperatures are never cached: repeated calls are expected to vary.
+RESPONSE_CACHE_MAX_SIZE = 512
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    temperature: float,
+    response_format: Optional[Dict[str, Any]] = None
+) -> str:
+    """Hash everything that determines a response into a cache key."""
+
+    payload = json.dumps([model, messages, max_tokens, round(temperature, 2), response_format])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+    """Get a cached response, marking it as recently used."""
+
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+        return response
+
+
+def _response_cache_put(key: str, response: str) -> None:
+    """Cache a response, evicting the least recently used entry when full."""
+
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_MAX_SIZE:
+            _response_cache.popitem(last=False)
+
+
+class SemanticCache:
+    """
+    In-process cache keyed by normalized embeddings.
+
+    get() returns the value stored under the most similar embedding (cosine
+    similarity), if it reaches min_similarity. A `match` predicate restricts
+    the search to entries whose value it accepts, so callers can require an
+    exact key (user, role, ...) alongside the semantic one. Entries expire
+    after ttl_seconds and the oldest is evicted when the cache is full.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, min_similarity: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.min_similarity = min_similarity
+        self._entries: List[Tuple[np.ndarray, Any, float]] = []
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        embedding: np.ndarray,
+        match: Optional[Callable[[Any], bool]] = None
+    ) -> Optional[Any]:
+        """Get the value of the closest (matching) entry, if similar enough."""
+
+        with self._lock:
+            cutoff = time.monotonic() - self.ttl_seconds
+            self._entries = [entry for entry in self._entries if entry[2] >= cutoff]
+
+            candidates = [entry for entry in self._entries if match is None or match(entry[1])]
+            if not candidates:
+                return None
+
+            similarities = np.stack([entry[0] for entry in candidates]) @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.min_similarity:
+                return None
+
+            return candidates[best][1]
+
+    def put(self, embedding: np.ndarray, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+
+        with self._lock:
+            self._entries.append((embedding, value, time.monotonic()))
+            if len(self._entries) > self.max_size:
+                self._entries.pop(0)
+
+
+# Opt-in on-disk response cache for development and replay loops. Unlike the
+# in-process cache it keeps every temperature, so it must stay off in production.
+LLM_DISK_CACHE_ENABLED = os.getenv("SAPIENS_LLM_CACHE") == "1"
+LLM_DISK_CACHE_DETERMINISTIC = LLM_DISK_CACHE_ENABLED and os.getenv("SAPIENS_LLM_CACHE_DETERMINISTIC") == "1"
+LLM_DISK_CACHE_DIR = Path(os.getenv("SAPIENS_LLM_CACHE_DIR", "~/.cache/sapiens/llm")).expanduser()
+
+
+def _disk_cache_get(key: str) -> Optional[str]:
+    """Get a response from the disk cache."""
+
+    try:
+        return json.loads((LLM_DISK_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))["response"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _disk_cache_put(key: str, response: str) -> None:
+    """Write a response to the disk cache, atomically replacing any old entry."""
+
+    LLM_DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = LLM_DISK_CACHE_DIR / f"{key}.{threading.get_ident()}.tmp"
+    tmp_path.write_text(json.dumps({"response": response}), encoding="utf-8")
+    os.replace(tmp_path, LLM_DISK_CACHE_DIR / f"{key}.json")
+
+
+def _bullet_list(items: List[str]) -> str:
+    """Format items as a markdown bullet list."""
+
+    return "\n".join([f"- {item}" for item in items])
+
+
 class BaseAgent(ABC):
     """
     Base class for all agents.
@@ -50,7 +255,8 @@ class BaseAgent(ABC):
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
+        self.async_client = _get_async_client(api_key)
         self.model = model
 
     @abstractmethod
@@ -64,47 +270,411 @@ class BaseAgent(ABC):
 
         pass
 
+    @_retry_transient_errors
     def call_llm(
         self,
         system_prompt: str,
         user_prompt: str,
         max_tokens: int = 4096,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        user_preamble: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        bypass_cache: bool = False,
+        model: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Call OpenAI API with system and user prompts.
 
+        Static content (system prompt, user preamble) is always sent first so
+        the request prefix stays byte-identical and OpenAI prompt caching can
+        reuse it across calls. Rate limits, timeouts and connection errors
+        are retried with exponential backoff; other OpenAI errors propagate
+        unchanged.
+
         Args:
             system_prompt: System instructions
-            user_prompt: User message
+            user_prompt: User message (the variable part of the request)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            user_preamble: Optional static user message sent before user_prompt
+            prompt_cache_key: Optional key routing similar requests to the same cache
+            bypass_cache: Skip the response cache (e.g. for an explicit re-roll)
+            model: Model to use for this call instead of the agent's default
+            response_format: Optional OpenAI response_format (e.g. a JSON schema)
 
         Returns:
             Model's response text
         """
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+        model = model or self.model
+        messages = self._build_messages(system_prompt, user_prompt, user_preamble)
+        if LLM_DISK_CACHE_DETERMINISTIC:
+            temperature = 0.0
+
+        cache_key = self._response_cache_lookup_key(
+            model, messages, max_tokens, temperature, response_format, bypass_cache
+        )
+        disk_cache_key = self._disk_cache_lookup_key(
+            model, messages, max_tokens, temperature, response_format, bypass_cache
+        )
+        cached = self._cached_llm_response(model, cache_key, disk_cache_key)
+        if cached is not None:
+            return cached
+
+        request_kwargs = {}
+        if prompt_cache_key:
+            request_kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+        if response_format:
+            request_kwargs["response_format"] = response_format
+
+        response = self.client.chat.completions.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=messages,
+            **request_kwargs
+        )
+
+        content = response.choices[0].message.content
+
+        self._log_llm_call(model, cache_hit=False)
+        self._store_response(cache_key, disk_cache_key, content)
+
+        return content
+
+    def call_llm_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        user_preamble: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        model: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Stream an OpenAI completion, yielding text chunks as they arrive.
+
+        Streamed responses bypass the response cache and are not retried,
+        since part of the response may already have been consumed.
+
+        Yields:
+            Pieces of the model's response text
+        """
+
+        model = model or self.model
+
+        request_kwargs = {}
+        if prompt_cache_key:
+            request_kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+        if response_format:
+            request_kwargs["response_format"] = response_format
+
+        stream = self.client.chat.completions.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=self._build_messages(system_prompt, user_prompt, user_preamble),
+            stream=True,
+            **request_kwargs
+        )
+
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+        self._log_llm_call(model, cache_hit=False)
+
+    @_retry_transient_errors
+    async def acall_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        user_preamble: Optional[str] = None,
+        prompt_cache_key: Optional[str] = None,
+        bypass_cache: bool = False,
+        model: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async variant of call_llm.
+
+        Does not block the event loop, so independent agent calls can run
+        concurrently with asyncio.gather. Calls are throttled per model to
+        OPENAI_RPM_LIMIT requests per minute.
+
+        Returns:
+            Model's response text
+        """
+
+        model = model or self.model
+        messages = self._build_messages(system_prompt, user_prompt, user_preamble)
+        if LLM_DISK_CACHE_DETERMINISTIC:
+            temperature = 0.0
+
+        cache_key = self._response_cache_lookup_key(
+            model, messages, max_tokens, temperature, response_format, bypass_cache
+        )
+        disk_cache_key = self._disk_cache_lookup_key(
+            model, messages, max_tokens, temperature, response_format, bypass_cache
+        )
+        cached = self._cached_llm_response(model, cache_key, disk_cache_key)
+        if cached is not None:
+            return cached
+
+        request_kwargs = {}
+        if prompt_cache_key:
+            request_kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+        if response_format:
+            request_kwargs["response_format"] = response_format
+
+        async with _get_rate_limiter(model):
+            response = await self.async_client.chat.completions.create(
+                model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
+                messages=messages,
+                **request_kwargs
             )
 
-            return response.choices[0].message.content
+        content = response.choices[0].message.content
+
+        self._log_llm_call(model, cache_hit=False)
+        self._store_response(cache_key, disk_cache_key, content)
+
+        return content
+
+    def call_llm_batched(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = BATCH_POLL_INTERVAL_SECONDS
+    ) -> List[Optional[str]]:
+        """
+        Run many LLM calls through the OpenAI Batch API.
+
+        Batch calls are billed at a discount but may take up to 24 hours,
+        so this is only for non-interactive workloads. Requests are split
+        into chunks of BATCH_MAX_REQUESTS and each chunk is polled until done.
+
+        Args:
+            requests: call_llm keyword arguments, one dict per call
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Response texts in request order (None for requests that failed)
+        """
+
+        responses = []
+        for start in range(0, len(requests), BATCH_MAX_REQUESTS):
+            chunk = requests[start:start + BATCH_MAX_REQUESTS]
+            responses.extend(self._run_batch(chunk, poll_interval))
+
+        return responses
+
+    def _process_batched(
+        self,
+        input_list: List[Any],
+        request_builder: Callable[[Any], Dict[str, Any]],
+        output_parser: Callable[[str, Any], Any]
+    ) -> List[Any]:
+        """
+        Process agent inputs through one call_llm_batched job.
+
+        Args:
+            input_list: Agent inputs to process
+            request_builder: Maps an input to its call_llm keyword arguments
+            output_parser: Maps (response, input) to the agent's output
+
+        Returns:
+            Outputs in the same order as input_list. An input whose request
+            cannot be built, whose batch fails, or whose response is missing
+            or cannot be parsed gets the subclass's _error_output envelope.
+        """
+
+        outputs: List[Any] = [None] * len(input_list)
+        batched = []  # (index, input_data, llm request)
 
+        for i, input_data in enumerate(input_list):
+            try:
+                batched.append((i, input_data, request_builder(input_data)))
+            except Exception as e:
+                outputs[i] = self._error_output(input_data, e)
+
+        if not batched:
+            return outputs
+
+        try:
+            responses = self.call_llm_batched([request for _, _, request in batched])
         except Exception as e:
-            raise RuntimeError(f"OpenAI API call failed: {str(e)}")
+            for i, input_data, _ in batched:
+                outputs[i] = self._error_output(input_data, e)
+            return outputs
+
+        for (i, input_data, _), response in zip(batched, responses):
+            try:
+                if response is None:
+                    raise RuntimeError("No response returned for batched request")
+                outputs[i] = output_parser(response, input_data)
+            except Exception as e:
+                outputs[i] = self._error_output(input_data, e)
+
+        return outputs
+
+    def _run_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float
+    ) -> List[Optional[str]]:
+        """Submit one batch, wait for it to finish and collect the responses."""
+
+        lines = []
+        for i, request in enumerate(requests):
+            body = {
+                "model": request.get("model") or self.model,
+                "max_tokens": request.get("max_tokens", 4096),
+                "temperature": request.get("temperature", 0.7),
+                "messages": self._build_messages(
+                    request["system_prompt"],
+                    request["user_prompt"],
+                    request.get("user_preamble")
+                )
+            }
+            if request.get("prompt_cache_key"):
+                body["prompt_cache_key"] = request["prompt_cache_key"]
+            if request.get("response_format"):
+                body["response_format"] = request["response_format"]
+
+            lines.append(json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        output = self.client.files.content(batch.output_file_id).text
+
+        # Results are not guaranteed to be in input order
+        responses: List[Optional[str]] = [None] * len(requests)
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            result = json.loads(line)
+            index = int(result["custom_id"].rsplit("-", 1)[1])
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                responses[index] = response["body"]["choices"][0]["message"]["content"]
+
+        return responses
 
     # Alias for backward compatibility
     def call_claude(self, system_prompt: str, user_prompt: str,
-                    max_tokens: int = 4096, temperature: float = 0.7) -> str:
+                    max_tokens: int = 4096, temperature: float = 0.7, **kwargs) -> str:
         """Alias for call_llm for backward compatibility."""
-        return self.call_llm(system_prompt, user_prompt, max_tokens, temperature)
+        return self.call_llm(system_prompt, user_prompt, max_tokens, temperature, **kwargs)
+
+    def _build_messages(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        user_preamble: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages array, static content first."""
+
+        messages = [{"role": "system", "content": system_prompt}]
+        if user_preamble:
+            messages.append({"role": "user", "content": user_preamble})
+        messages.append({"role": "user", "content": user_prompt})
+
+        return messages
+
+    def _response_cache_lookup_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[Dict[str, Any]],
+        bypass_cache: bool
+    ) -> Optional[str]:
+        """Get the response cache key, or None if this call must not be cached."""
+
+        if bypass_cache or temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+
+        return _response_cache_key(model, messages, max_tokens, temperature, response_format)
+
+    def _disk_cache_lookup_key(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[Dict[str, Any]],
+        bypass_cache: bool
+    ) -> Optional[str]:
+        """Get the disk cache key, or None if the disk cache is off for this call."""
+
+        if bypass_cache or not LLM_DISK_CACHE_ENABLED:
+            return None
+
+        return _response_cache_key(model, messages, max_tokens, temperature, response_format)
+
+    def _cached_llm_response(
+        self,
+        model: str,
+        cache_key: Optional[str],
+        disk_cache_key: Optional[str]
+    ) -> Optional[str]:
+        """Get a response from the in-process cache, then the disk cache."""
+
+        cached = _response_cache_get(cache_key) if cache_key else None
+        if cached is None and disk_cache_key:
+            cached = _disk_cache_get(disk_cache_key)
+
+        if cached is not None:
+            self._log_llm_call(model, cache_hit=True)
+        return cached
+
+    def _store_response(
+        self,
+        cache_key: Optional[str],
+        disk_cache_key: Optional[str],
+        response: str
+    ) -> None:
+        """Store a fresh response in whichever caches apply to the call."""
+
+        if cache_key:
+            _response_cache_put(cache_key, response)
+        if disk_cache_key:
+            _disk_cache_put(disk_cache_key, response)
+
+    def _log_llm_call(self, model: str, cache_hit: bool) -> None:
+        """Record an LLM call through the logging module, if configured."""
+
+        if self.logging_module:
+            self.logging_module.log_llm_call(self.agent_name, model, cache_hit)
 
     def get_domain_context(self, domain: str, query: str) -> str:
         """
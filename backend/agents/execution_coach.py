@@ -4,14 +4,308 @@ Execution Coach Agent.
 Guides milestone creation, tracks progress, and always provides one clear next action.
 """
 
-import uuid
-from datetime import datetime, date, timedelta
-from typing import List
-from .base import BaseAgent
+import functools
+import json
+import re
+import secrets
+from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
+from .base import BaseAgent, _bullet_list
 from ..schemas.agent_io import ExecutionCoachInput, ExecutionCoachOutput
 from ..schemas.execution import Milestone, MilestoneStatus
 
 
+# Milestone headers and field lines, matched in one pass over the response
+_MILESTONE_LINE_RE = re.compile(
+    r'^[ \t]*(?:### Milestone(?P<header>[^\n]*)'
+    r'|(?P<field>Description|Deliverable|Estimated Days|Next Action):(?P<value>[^\n]*))',
+    re.MULTILINE
+)
+
+# Any markdown heading of level 2 or deeper
+_SECTION_HEADER_RE = re.compile(r'^[ \t]*##[ \t#]*(?P<title>[^\n]*?)[ \t\r]*$', re.MULTILINE)
+
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Non-blank lines and "- "/"* " bullet items within a section body, with
+# surrounding whitespace already excluded from the captured text
+_NONBLANK_LINE_RE = re.compile(r'^[ \t]*(\S[^\n]*?)[ \t\r]*$', re.MULTILINE)
+_BULLET_ITEM_RE = re.compile(r'^[ \t]*[-*] ([^\n]*\S)[ \t\r]*$', re.MULTILINE)
+
+# Field defaults for milestones created from a response header, and for the
+# placeholder milestones added when the response has fewer than three
+_PARSED_MILESTONE_DEFAULTS = {
+    "description": "",
+    "deliverable": "",
+    "estimated_days": 3.0,
+}
+_PADDING_MILESTONE_DEFAULTS = {
+    "description": "Project work",
+    "deliverable": "Progress deliverable",
+    "estimated_days": 3.0,
+    "next_action": "Continue project work",
+}
+
+
+def _new_milestone_id() -> str:
+    """Generate a milestone ID (random, no UUID object needed)."""
+
+    return f"ms_{secrets.token_hex(4)}"
+
+
+def _agent_safe(handler):
+    """Return the agent's error envelope instead of raising from an action handler."""
+
+    @functools.wraps(handler)
+    def wrapper(self, input_data):
+        try:
+            return handler(self, input_data)
+        except Exception as e:
+            return self._error_output(input_data, e)
+
+    return wrapper
+
+
+# Per-action model overrides. Progress evaluation is a short, templated
+# judgement that a smaller model handles well; actions not listed here use
+# the agent's configured model. get_next_action never calls the LLM.
+MODEL_FOR_ACTION = {
+    "update_progress": "gpt-4o-mini",
+}
+
+# System prompts and preambles are module-level constants so the request
+# prefix is byte-identical across calls and eligible for prompt caching.
+PLAN_CREATION_SYSTEM_PROMPT = """You are an expert execution coach helping users break down projects into achievable milestones.
+
+Your goal is to create a realistic, actionable execution plan that:
+1. Breaks the project into 4-7 concrete milestones
+2. Each milestone is completable in 2-5 days
+3. Each milestone has a clear, tangible deliverable
+4. Milestones are ordered logically with dependencies
+5. Total plan fits within 2-3 weeks
+
+Output format:
+
+# EXECUTION PLAN
+
+## Overview
+[Brief overview of the execution strategy]
+
+## Milestones
+
+### Milestone 1: [Title]
+Description: [What needs to be accomplished]
+Deliverable: [Concrete output]
+Estimated Days: [2-5]
+Dependencies: [None or list milestone numbers]
+Next Action: [ONE specific action to start]
+
+### Milestone 2: [Title]
+[Continue for all milestones]
+
+## Tips for Success
+- [Practical tip 1]
+- [Practical tip 2]
+- [Continue]
+
+## Motivation
+[Encouraging message about the journey ahead]
+
+Be specific, realistic, and motivating."""
+
+PLAN_CREATION_PREAMBLE = """Create an execution plan for the project described in the next message.
+
+Create a detailed execution plan with milestones following the specified format."""
+
+PROGRESS_EVALUATION_SYSTEM_PROMPT = """You are an execution coach evaluating user progress on a milestone.
+
+Your goals:
+1. Acknowledge and validate the user's work
+2. Assess if they're making meaningful progress
+3. Detect stagnation (stuck for >3 days, unclear progress, avoiding work)
+4. Provide ONE clear next action
+5. Give practical, actionable tips
+
+Respond with a JSON object with these fields:
+- status: Milestone status after this update: "not_started", "in_progress", "completed" or "blocked"
+- stagnation_detected: true if the user appears stuck, otherwise false
+- stagnation_reason: Why the user appears stuck, or null if no stagnation
+- acknowledgment: Validate their effort and progress
+- next_action: ONE specific, actionable next step
+- feedback: Constructive, encouraging feedback
+- tips: List of practical tips
+
+Be supportive, specific, and action-oriented."""
+
+PROGRESS_EVALUATION_PREAMBLE = """Evaluate the progress update described in the next message.
+
+Evaluate the progress and provide guidance as a JSON object with the specified fields."""
+
+# Structured output schema enforced by OpenAI for progress evaluations
+PROGRESS_EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "progress_evaluation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "status": {
+                    "type": "string",
+                    "enum": ["not_started", "in_progress", "completed", "blocked"]
+                },
+                "stagnation_detected": {"type": "boolean"},
+                "stagnation_reason": {"type": ["string", "null"]},
+                "acknowledgment": {"type": "string"},
+                "next_action": {"type": "string"},
+                "feedback": {"type": "string"},
+                "tips": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": [
+                "status",
+                "stagnation_detected",
+                "stagnation_reason",
+                "acknowledgment",
+                "next_action",
+                "feedback",
+                "tips"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+class MilestoneStreamParser:
+    """
+    Incremental milestone parser.
+
+    Feed response text as it streams in; each milestone is returned as soon
+    as the next milestone header arrives. Only complete lines are scanned,
+    so chunk boundaries may fall anywhere.
+    """
+
+    def __init__(self, project_id: str, user_id: str):
+        self.project_id = project_id
+        self.user_id = user_id
+        self.milestone_order = 0
+
+        self._base_ordinal = date.today().toordinal()
+        self._buffer = ""
+        self._current: Optional[Milestone] = None
+
+    def feed(self, chunk: str) -> List[Milestone]:
+        """Add response text and return milestones completed by it."""
+
+        self._buffer += chunk
+        cut = self._buffer.rfind('\n')
+        if cut < 0:
+            return []
+
+        text, self._buffer = self._buffer[:cut + 1], self._buffer[cut + 1:]
+        return self._scan(text)
+
+    def close(self) -> List[Milestone]:
+        """Flush remaining text and return the final milestone(s)."""
+
+        completed = self._scan(self._buffer)
+        self._buffer = ""
+
+        if self._current:
+            completed.append(self._current)
+            self._current = None
+
+        return completed
+
+    def _scan(self, text: str) -> List[Milestone]:
+        """Apply milestone header and field lines found in text."""
+
+        completed = []
+
+        for match in _MILESTONE_LINE_RE.finditer(text):
+            header = match.group("header")
+
+            if header is not None:
+                # Previous milestone is complete once the next header arrives
+                if self._current:
+                    completed.append(self._current)
+
+                self.milestone_order += 1
+                order = self.milestone_order
+                title = header.split(':', 1)[1].strip() if ':' in header else f"Milestone {order}"
+
+                self._current = Milestone(
+                    **_PARSED_MILESTONE_DEFAULTS,
+                    milestone_id=_new_milestone_id(),
+                    project_id=self.project_id,
+                    user_id=self.user_id,
+                    title=title,
+                    order=order,
+                    target_date=date.fromordinal(self._base_ordinal + order * 3)
+                )
+
+            elif self._current:
+                field = match.group("field")
+                value = match.group("value").strip()
+
+                if field == "Description":
+                    self._current.description = value
+                elif field == "Deliverable":
+                    self._current.deliverable = value
+                elif field == "Estimated Days":
+                    days_match = _NUMBER_RE.search(value)
+                    if days_match:
+                        self._current.estimated_days = max(1.0, min(7.0, float(days_match.group())))
+                elif field == "Next Action":
+                    self._current.next_action = value
+
+        return completed
+
+
+def parse_milestones(response: str, project_id: str, user_id: str) -> List[Milestone]:
+    """
+    Parse milestones from a complete execution plan response.
+
+    Needs no agent (or API key), so offline jobs can re-parse stored
+    responses in bulk.
+
+    Args:
+        response: Execution plan response text
+        project_id: Project the milestones belong to
+        user_id: User the milestones belong to
+
+    Returns:
+        At least 3 milestones, in order
+    """
+
+    parser = MilestoneStreamParser(project_id, user_id)
+    milestones = parser.feed(response) + parser.close()
+
+    return pad_milestones(milestones, parser.milestone_order, project_id, user_id)
+
+
+def pad_milestones(
+    milestones: List[Milestone],
+    milestone_order: int,
+    project_id: str,
+    user_id: str
+) -> List[Milestone]:
+    """Ensure we have at least 3 milestones."""
+
+    while len(milestones) < 3:
+        milestone_order += 1
+        milestones.append(Milestone(
+            **_PADDING_MILESTONE_DEFAULTS,
+            milestone_id=_new_milestone_id(),
+            project_id=project_id,
+            user_id=user_id,
+            title=f"Milestone {milestone_order}",
+            order=milestone_order
+        ))
+
+    return milestones
+
+
 class ExecutionCoachAgent(BaseAgent):
     """
     Execution coach that guides users through project implementation.
@@ -26,6 +320,13 @@ class ExecutionCoachAgent(BaseAgent):
 
     def __init__(self, **kwargs):
         super().__init__(agent_name="ExecutionCoach", **kwargs)
+        # LLM-backed actions: (request builder, output parser). Every entry
+        # point dispatches through this table; get_next_action is answered
+        # from the milestones alone.
+        self._actions = {
+            "create_plan": (self._plan_request, self._plan_output),
+            "update_progress": (self._progress_request, self._progress_output),
+        }
 
     def process(self, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
         """
@@ -38,71 +339,176 @@ class ExecutionCoachAgent(BaseAgent):
             ExecutionCoachOutput with guidance
         """
 
-        try:
-            if input_data.action == "create_plan":
-                return self._create_execution_plan(input_data)
-            elif input_data.action == "update_progress":
-                return self._update_progress(input_data)
-            elif input_data.action == "get_next_action":
-                return self._get_next_action(input_data)
-            else:
-                raise ValueError(f"Invalid action: {input_data.action}")
+        if input_data.action == "get_next_action":
+            return self._get_next_action(input_data)
 
+        try:
+            request_builder, output_parser = self._action(input_data)
+            response = self.call_claude(**request_builder(input_data))
+            return output_parser(response, input_data)
         except Exception as e:
-            return ExecutionCoachOutput(
-                request_id=input_data.request_id,
-                success=False,
-                action=input_data.action,
-                next_action="Please try your request again.",
-                feedback=f"An error occurred: {str(e)}"
-            )
+            return self._error_output(input_data, e)
+
+    async def aprocess(self, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
+        """
+        Async variant of process.
 
-    def _create_execution_plan(self, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
-        """Create a milestone-based execution plan."""
+        Uses the non-blocking OpenAI client so the caller can run several
+        coaching requests concurrently (e.g. with asyncio.gather).
 
-        problem = input_data.problem_definition
-        solution = input_data.solution_design
+        Args:
+            input_data: ExecutionCoachInput
 
-        if not problem or not solution:
-            raise ValueError("Problem and solution are required for plan creation")
+        Returns:
+            ExecutionCoachOutput with guidance
+        """
 
-        # Build system prompt
-        system_prompt = self._build_plan_creation_prompt()
+        if input_data.action == "get_next_action":
+            return self._get_next_action(input_data)
 
-        # Build user prompt
-        user_prompt = f"""Create an execution plan for this project:
+        try:
+            request_builder, output_parser = self._action(input_data)
+            response = await self.acall_llm(**request_builder(input_data))
+            return output_parser(response, input_data)
+        except Exception as e:
+            return self._error_output(input_data, e)
 
-PROBLEM:
-{problem.problem_statement}
+    def process_many(self, input_list: List[ExecutionCoachInput]) -> List[ExecutionCoachOutput]:
+        """
+        Process several coaching requests, batching the non-interactive ones.
 
-Target Audience: {problem.target_audience}
+        Requests with interactive=False that need the LLM are submitted
+        together through the OpenAI Batch API; everything else goes through
+        process() as usual.
 
-SUCCESS METRICS:
-{chr(10).join(f"- {metric}" for metric in problem.success_metrics)}
+        Args:
+            input_list: ExecutionCoachInputs to process
 
-SOLUTION APPROACH:
-{solution.solution_approach}
+        Returns:
+            ExecutionCoachOutputs in the same order as input_list
+        """
 
-KEY COMPONENTS:
-{chr(10).join(f"- {comp}" for comp in solution.key_components)}
+        outputs: List[Optional[ExecutionCoachOutput]] = [None] * len(input_list)
+        batched = []  # indexes of the requests sent through the Batch API
 
-METHODOLOGY:
-{solution.methodology}
+        for i, input_data in enumerate(input_list):
+            if input_data.interactive or input_data.action not in self._actions:
+                outputs[i] = self.process(input_data)
+            else:
+                batched.append(i)
 
-EXPECTED OUTCOMES:
-{chr(10).join(f"- {outcome}" for outcome in solution.expected_outcomes)}
+        batch_outputs = self._process_batched(
+            [input_list[i] for i in batched],
+            lambda input_data: self._action(input_data)[0](input_data),
+            lambda response, input_data: self._action(input_data)[1](response, input_data)
+        )
+        for i, output in zip(batched, batch_outputs):
+            outputs[i] = output
 
-Create a detailed execution plan with milestones following the specified format."""
+        return outputs
+
+    def _action(self, input_data: ExecutionCoachInput) -> Tuple[Callable, Callable]:
+        """Look up the (request builder, output parser) pair for an LLM-backed action."""
+
+        try:
+            return self._actions[input_data.action]
+        except KeyError:
+            raise ValueError(f"Invalid action: {input_data.action}") from None
 
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.5
+    def _error_output(self, input_data: ExecutionCoachInput, error: Exception) -> ExecutionCoachOutput:
+        """Build the error envelope returned when a request fails."""
+
+        return ExecutionCoachOutput(
+            request_id=input_data.request_id,
+            success=False,
+            action=input_data.action,
+            next_action="Please try your request again.",
+            feedback=f"An error occurred: {str(error)}"
         )
 
-        # Parse milestones
-        milestones = self._parse_milestones(response, input_data)
+    def stream_execution_plan(self, input_data: ExecutionCoachInput) -> Iterator[ExecutionCoachOutput]:
+        """
+        Create an execution plan, streaming milestones as they are generated.
+
+        Yields a partial output (metadata["partial"] is True) each time a
+        milestone completes, then the full output once the response ends.
+        Milestone IDs are stable between partial and final outputs.
+
+        Args:
+            input_data: ExecutionCoachInput with action "create_plan"
+
+        Yields:
+            ExecutionCoachOutput snapshots of the plan
+        """
+
+        try:
+            request = self._plan_request(input_data)
+            parser = MilestoneStreamParser(input_data.project_id, input_data.user_id)
+            chunks = []
+            milestones = []
+
+            for chunk in self.call_llm_stream(**request):
+                chunks.append(chunk)
+                completed = parser.feed(chunk)
+                if completed:
+                    milestones.extend(completed)
+                    yield ExecutionCoachOutput(
+                        request_id=input_data.request_id,
+                        success=True,
+                        action="create_plan",
+                        milestones=list(milestones),
+                        next_action=milestones[0].next_action or "Begin working on your first milestone.",
+                        feedback="Building your execution plan...",
+                        metadata={"partial": True}
+                    )
+
+            milestones.extend(parser.close())
+            milestones = pad_milestones(milestones, parser.milestone_order, input_data.project_id, input_data.user_id)
+
+            yield self._plan_output("".join(chunks), input_data, milestones)
+
+        except Exception as e:
+            yield self._error_output(input_data, e)
+
+    def _plan_request(self, input_data: ExecutionCoachInput) -> Dict[str, Any]:
+        """Build the LLM request for execution plan creation."""
+
+        problem = input_data.problem_definition
+        solution = input_data.solution_design
+
+        if not problem or not solution:
+            raise ValueError("Problem and solution are required for plan creation")
+
+        # Build user prompt (variable fields only; static preamble is sent first)
+        user_prompt = "".join([
+            "PROBLEM:\n", problem.problem_statement,
+            "\n\nTarget Audience: ", problem.target_audience,
+            "\n\nSUCCESS METRICS:\n", _bullet_list(problem.success_metrics),
+            "\n\nSOLUTION APPROACH:\n", solution.solution_approach,
+            "\n\nKEY COMPONENTS:\n", _bullet_list(solution.key_components),
+            "\n\nMETHODOLOGY:\n", solution.methodology,
+            "\n\nEXPECTED OUTCOMES:\n", _bullet_list(solution.expected_outcomes),
+        ])
+
+        return {
+            "system_prompt": self._build_plan_creation_prompt(),
+            "user_prompt": user_prompt,
+            "temperature": 0.5,
+            "user_preamble": PLAN_CREATION_PREAMBLE,
+            "prompt_cache_key": f"{self.agent_name}:create_plan"
+        }
+
+    def _plan_output(
+        self,
+        response: str,
+        input_data: ExecutionCoachInput,
+        milestones: Optional[List[Milestone]] = None
+    ) -> ExecutionCoachOutput:
+        """Parse an execution plan response into an ExecutionCoachOutput."""
+
+        # Parse milestones (unless already parsed while streaming)
+        if milestones is None:
+            milestones = self._parse_milestones(response, input_data)
 
         # Calculate total estimated days
         total_days = sum(m.estimated_days for m in milestones)
@@ -111,8 +517,9 @@ Create a detailed execution plan with milestones following the specified format.
         first_milestone = milestones[0] if milestones else None
         next_action = first_milestone.next_action if first_milestone else "Begin working on your first milestone."
 
-        feedback = self._extract_feedback(response)
-        tips = self._extract_tips(response)
+        sections = self._parse_sections(response)
+        feedback = self._extract_feedback(sections)
+        tips = self._extract_tips(sections)
 
         return ExecutionCoachOutput(
             request_id=input_data.request_id,
@@ -125,60 +532,67 @@ Create a detailed execution plan with milestones following the specified format.
             tips=tips
         )
 
-    def _update_progress(self, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
-        """Update progress on a milestone."""
+    def _find_current_milestone(self, input_data: ExecutionCoachInput) -> Milestone:
+        """Find the milestone a progress update refers to."""
 
         if not input_data.current_milestone_id:
             raise ValueError("Milestone ID is required for progress update")
 
-        # Find current milestone
-        current_milestone = None
-        for m in input_data.all_milestones:
-            if m.milestone_id == input_data.current_milestone_id:
-                current_milestone = m
-                break
+        current_milestone = input_data.milestones_by_id.get(input_data.current_milestone_id)
 
         if not current_milestone:
             raise ValueError(f"Milestone {input_data.current_milestone_id} not found")
 
-        # Build system prompt
-        system_prompt = self._build_progress_evaluation_prompt()
-
-        # Build user prompt
-        user_prompt = f"""Evaluate this progress update:
-
-CURRENT MILESTONE:
-{current_milestone.title}
-
-Description: {current_milestone.description}
-Expected Deliverable: {current_milestone.deliverable}
-
-USER'S PROGRESS UPDATE:
-{input_data.progress_update}
-
-BLOCKERS:
-{chr(10).join(f"- {blocker}" for blocker in input_data.blockers) if input_data.blockers else "None reported"}
-
-MILESTONE STATUS:
-Started: {current_milestone.started_at or "Not started"}
-Estimated days: {current_milestone.estimated_days}
+        return current_milestone
+
+    def _progress_request(self, input_data: ExecutionCoachInput) -> Dict[str, Any]:
+        """Build the LLM request for progress evaluation."""
+
+        current_milestone = self._find_current_milestone(input_data)
+        blockers = _bullet_list(input_data.blockers) if input_data.blockers else "None reported"
+
+        # Build user prompt (variable fields only; static preamble is sent first)
+        user_prompt = "".join([
+            "CURRENT MILESTONE:\n", current_milestone.title,
+            "\n\nDescription: ", current_milestone.description,
+            "\nExpected Deliverable: ", current_milestone.deliverable,
+            "\n\nUSER'S PROGRESS UPDATE:\n", str(input_data.progress_update),
+            "\n\nBLOCKERS:\n", blockers,
+            "\n\nMILESTONE STATUS:\nStarted: ", str(current_milestone.started_at or "Not started"),
+            "\nEstimated days: ", str(current_milestone.estimated_days),
+        ])
+
+        return {
+            "system_prompt": self._build_progress_evaluation_prompt(),
+            "user_prompt": user_prompt,
+            "temperature": 0.5,
+            "user_preamble": PROGRESS_EVALUATION_PREAMBLE,
+            "prompt_cache_key": f"{self.agent_name}:update_progress",
+            "model": MODEL_FOR_ACTION.get("update_progress", self.model),
+            "response_format": PROGRESS_EVALUATION_RESPONSE_FORMAT
+        }
+
+    def _progress_output(self, response: str, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
+        """Parse a progress evaluation response into an ExecutionCoachOutput."""
+
+        current_milestone = self._find_current_milestone(input_data)
+        data = json.loads(response)
 
-Evaluate the progress and provide guidance following the specified format."""
+        try:
+            milestone_status = MilestoneStatus(data.get("status"))
+        except ValueError:
+            milestone_status = current_milestone.status
 
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.5
-        )
+        stagnation_detected = bool(data.get("stagnation_detected"))
+        stagnation_reason = None
+        if stagnation_detected:
+            stagnation_reason = data.get("stagnation_reason") or "Progress appears to have slowed."
 
-        # Parse response
-        stagnation_detected = "STAGNATION DETECTED: YES" in response.upper()
-        milestone_status = self._parse_status_update(response, current_milestone)
-        next_action = self._extract_next_action(response)
-        feedback = self._extract_feedback(response)
-        tips = self._extract_tips(response)
-        stagnation_reason = self._extract_stagnation_reason(response) if stagnation_detected else None
+        next_action = data.get("next_action") or "Continue with your current milestone."
+        feedback = " ".join(
+            part for part in (data.get("acknowledgment"), data.get("feedback")) if part
+        ) or "Great work! Keep going."
+        tips = data.get("tips") or ["Take it one step at a time", "Set aside focused time daily"]
 
         return ExecutionCoachOutput(
             request_id=input_data.request_id,
@@ -193,23 +607,18 @@ Evaluate the progress and provide guidance following the specified format."""
             tips=tips
         )
 
+    @_agent_safe
     def _get_next_action(self, input_data: ExecutionCoachInput) -> ExecutionCoachOutput:
         """Get the next action for the user."""
 
         # Find current milestone
         current_milestone = None
         if input_data.current_milestone_id:
-            for m in input_data.all_milestones:
-                if m.milestone_id == input_data.current_milestone_id:
-                    current_milestone = m
-                    break
+            current_milestone = input_data.milestones_by_id.get(input_data.current_milestone_id)
 
         # If no current milestone, find the first not-started one
         if not current_milestone:
-            for m in input_data.all_milestones:
-                if m.status == MilestoneStatus.NOT_STARTED:
-                    current_milestone = m
-                    break
+            current_milestone = input_data.first_not_started
 
         if not current_milestone:
             next_action = "All milestones completed! Ready for review."
@@ -228,223 +637,56 @@ Evaluate the progress and provide guidance following the specified format."""
     def _build_plan_creation_prompt(self) -> str:
         """Build system prompt for execution plan creation."""
 
-        return """You are an expert execution coach helping users break down projects into achievable milestones.
-
-Your goal is to create a realistic, actionable execution plan that:
-1. Breaks the project into 4-7 concrete milestones
-2. Each milestone is completable in 2-5 days
-3. Each milestone has a clear, tangible deliverable
-4. Milestones are ordered logically with dependencies
-5. Total plan fits within 2-3 weeks
-
-Output format:
-
-# EXECUTION PLAN
-
-## Overview
-[Brief overview of the execution strategy]
-
-## Milestones
-
-### Milestone 1: [Title]
-Description: [What needs to be accomplished]
-Deliverable: [Concrete output]
-Estimated Days: [2-5]
-Dependencies: [None or list milestone numbers]
-Next Action: [ONE specific action to start]
-
-### Milestone 2: [Title]
-[Continue for all milestones]
-
-## Tips for Success
-- [Practical tip 1]
-- [Practical tip 2]
-- [Continue]
-
-## Motivation
-[Encouraging message about the journey ahead]
-
-Be specific, realistic, and motivating."""
+        return PLAN_CREATION_SYSTEM_PROMPT
 
     def _build_progress_evaluation_prompt(self) -> str:
         """Build system prompt for progress evaluation."""
 
-        return """You are an execution coach evaluating user progress on a milestone.
-
-Your goals:
-1. Acknowledge and validate the user's work
-2. Assess if they're making meaningful progress
-3. Detect stagnation (stuck for >3 days, unclear progress, avoiding work)
-4. Provide ONE clear next action
-5. Give practical, actionable tips
-
-Output format:
-
-# PROGRESS EVALUATION
-
-## Status Update
-[Should milestone status change? Options: NOT_STARTED, IN_PROGRESS, COMPLETED, BLOCKED]
-
-## Stagnation Detection
-[YES or NO]
-
-## Stagnation Reason
-[If yes, explain why]
-
-## Acknowledgment
-[Validate their effort and progress]
-
-## Next Action
-[ONE specific, actionable next step]
-
-## Feedback
-[Constructive, encouraging feedback]
-
-## Tips
-- [Practical tip 1]
-- [Practical tip 2]
-- [Continue]
-
-Be supportive, specific, and action-oriented."""
+        return PROGRESS_EVALUATION_SYSTEM_PROMPT
 
     def _parse_milestones(self, response: str, input_data: ExecutionCoachInput) -> List[Milestone]:
-        """Parse milestones from response."""
+        """Parse milestones from a complete response."""
 
-        milestones = []
-        lines = response.split('\n')
-
-        current_milestone = None
-        milestone_order = 0
+        return parse_milestones(response, input_data.project_id, input_data.user_id)
 
-        for line in lines:
-            line_stripped = line.strip()
-
-            if line_stripped.startswith('### Milestone'):
-                # Save previous milestone
-                if current_milestone:
-                    milestones.append(current_milestone)
+    def _parse_sections(self, response: str) -> Dict[str, str]:
+        """
+        Split a markdown response into sections in a single scan.
 
-                # Start new milestone
-                milestone_order += 1
-                title = line_stripped.split(':', 1)[1].strip() if ':' in line_stripped else f"Milestone {milestone_order}"
+        Maps each heading (without the leading #'s) to the text up to the
+        next heading. Only the first occurrence of a heading is kept.
+        """
 
-                current_milestone = Milestone(
-                    milestone_id=f"ms_{uuid.uuid4().hex[:8]}",
-                    project_id=input_data.project_id,
-                    user_id=input_data.user_id,
-                    title=title,
-                    description="",
-                    deliverable="",
-                    order=milestone_order,
-                    estimated_days=3.0,
-                    target_date=date.today() + timedelta(days=milestone_order * 3)
-                )
+        sections = {}
+        headers = list(_SECTION_HEADER_RE.finditer(response))
 
-            elif current_milestone:
-                if line_stripped.startswith('Description:'):
-                    current_milestone.description = line_stripped.split(':', 1)[1].strip()
-                elif line_stripped.startswith('Deliverable:'):
-                    current_milestone.deliverable = line_stripped.split(':', 1)[1].strip()
-                elif line_stripped.startswith('Estimated Days:'):
-                    try:
-                        days_str = line_stripped.split(':', 1)[1].strip()
-                        days = float(''.join(filter(lambda x: x.isdigit() or x == '.', days_str)))
-                        current_milestone.estimated_days = max(1.0, min(7.0, days))
-                    except:
-                        pass
-                elif line_stripped.startswith('Next Action:'):
-                    current_milestone.next_action = line_stripped.split(':', 1)[1].strip()
-
-        # Add last milestone
-        if current_milestone:
-            milestones.append(current_milestone)
-
-        # Ensure we have at least 3 milestones
-        if len(milestones) < 3:
-            while len(milestones) < 3:
-                milestone_order += 1
-                milestones.append(Milestone(
-                    milestone_id=f"ms_{uuid.uuid4().hex[:8]}",
-                    project_id=input_data.project_id,
-                    user_id=input_data.user_id,
-                    title=f"Milestone {milestone_order}",
-                    description="Project work",
-                    deliverable="Progress deliverable",
-                    order=milestone_order,
-                    estimated_days=3.0,
-                    next_action="Continue project work"
-                ))
-
-        return milestones
-
-    def _parse_status_update(self, response: str, current_milestone: Milestone) -> MilestoneStatus:
-        """Parse status update from response."""
-
-        response_upper = response.upper()
-
-        if "COMPLETED" in response_upper:
-            return MilestoneStatus.COMPLETED
-        elif "BLOCKED" in response_upper:
-            return MilestoneStatus.BLOCKED
-        elif "IN_PROGRESS" in response_upper or "IN PROGRESS" in response_upper:
-            return MilestoneStatus.IN_PROGRESS
-        else:
-            return current_milestone.status
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(response)
+            sections.setdefault(header.group("title"), response[header.end():end])
 
-    def _extract_next_action(self, response: str) -> str:
-        """Extract next action from response."""
+        return sections
 
-        lines = response.split('\n')
-        for i, line in enumerate(lines):
-            if "## Next Action" in line and i + 1 < len(lines):
-                return lines[i + 1].strip() or "Continue with your current milestone."
+    def _find_section(self, sections: Dict[str, str], *titles: str) -> Optional[str]:
+        """Get the body of the first section whose heading starts with one of titles."""
 
-        return "Continue with your current milestone."
+        for title, body in sections.items():
+            if title.startswith(titles):
+                return body
 
-    def _extract_feedback(self, response: str) -> str:
-        """Extract feedback from response."""
+        return None
 
-        lines = response.split('\n')
-        feedback_lines = []
-        in_feedback = False
+    def _extract_feedback(self, sections: Dict[str, str]) -> str:
+        """Extract feedback from response sections."""
 
-        for line in lines:
-            if "## Feedback" in line or "## Acknowledgment" in line or "## Motivation" in line:
-                in_feedback = True
-                continue
-            elif in_feedback and line.strip().startswith('##'):
-                break
-            elif in_feedback and line.strip():
-                feedback_lines.append(line.strip())
+        body = self._find_section(sections, "Feedback", "Acknowledgment", "Motivation")
+        feedback_lines = _NONBLANK_LINE_RE.findall(body) if body else []
 
         return ' '.join(feedback_lines) if feedback_lines else "Great work! Keep going."
 
-    def _extract_tips(self, response: str) -> List[str]:
-        """Extract tips from response."""
-
-        lines = response.split('\n')
-        tips = []
-        in_tips = False
+    def _extract_tips(self, sections: Dict[str, str]) -> List[str]:
+        """Extract tips from response sections."""
 
-        for line in lines:
-            if "## Tips" in line:
-                in_tips = True
-                continue
-            elif in_tips and line.strip().startswith('##'):
-                break
-            elif in_tips:
-                line_stripped = line.strip()
-                if line_stripped.startswith('- ') or line_stripped.startswith('* '):
-                    tips.append(line_stripped[2:])
+        body = self._find_section(sections, "Tips")
+        tips = _BULLET_ITEM_RE.findall(body) if body else []
 
         return tips if tips else ["Take it one step at a time", "Set aside focused time daily"]
-
-    def _extract_stagnation_reason(self, response: str) -> str:
-        """Extract stagnation reason from response."""
-
-        lines = response.split('\n')
-        for i, line in enumerate(lines):
-            if "## Stagnation Reason" in line and i + 1 < len(lines):
-                return lines[i + 1].strip()
-
-        return "Progress appears to have slowed."
@@ -5,8 +5,241 @@ The only agent that directly talks to the user.
 Never makes decisions - only relays Orchestrator instructions in natural language.
 """
 
+import io
+import re
 from typing import Dict, Any, Optional
-from .base import BaseAgent
+from .base import BaseAgent, _bullet_list
+from ..modules.rag import RAGModule
+from ..modules.logging import LoggingModule
+from ..schemas.agent_io import MainChatInput, MainChatOutput
+
+
+# Returned when generate_message gets a message type it has no handler for
+_DEFAULT_MESSAGE = "I'm here to help you with your project. What would you like to do?"
+
+# Approval keywords are matched as whole words so e.g. "notable" doesn't
+# count as "not"; multi-word phrases are matched as substrings
+_APPROVE_WORDS = frozenset({"yes", "approve", "proceed", "confirm"})
+_APPROVE_PHRASES = ("looks good",)
+_REJECT_WORDS = frozenset({"no", "reject", "change", "different", "not"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+# Templates for blocks repeated once per item in a message
+_DELIVERABLE_TEMPLATE = "\n{index}. **{name}**: {description}"
+_MILESTONE_TEMPLATE = """
+### {order}. {title}
+- **Goal**: {description}
+- **Deliverable**: {deliverable}
+- **Estimated Time**: {estimated_days} days
+- **Next Action**: {next_action}
+"""
+_RESUME_BULLET_TEMPLATE = "\n{index}. {text}\n   *Skills: {skills}*\n"
+
+# Tutor feedback layouts for passed and failed evaluations
+_PASSED_FEEDBACK_TEMPLATE = """{opening} Here's my evaluation:
+
+{overall}
+
+**Strengths:**
+{strengths}
+
+**Scores:**
+{scores}
+{closing}"""
+_FAILED_FEEDBACK_TEMPLATE = """{opening} Here's my feedback:
+
+{overall}
+
+**What's Working:**
+{strengths}
+
+**Suggestions for Improvement:**
+{suggestions}
+
+**Scores:**
+{scores}{examples}{closing}"""
+
+# Per (mode, passed): opening line, closing text, and what to show under
+# "What's Working" when the evaluation listed no strengths
+_FEEDBACK_TEXT = {
+    ("problem", True): (
+        "Excellent! Your problem definition is strong.",
+        "You're ready to move to solution design!",
+        "",
+    ),
+    ("problem", False): (
+        "Good start! Your problem definition needs some refinement.",
+        """
+
+---
+
+Please revise your problem definition based on this feedback. You can provide your complete revised problem definition addressing:
+
+1. **Problem Statement**: What specific problem are you solving?
+2. **Target Audience**: Who experiences this problem?
+3. **Key Pain Points**: What are the main challenges?
+4. **Success Metrics**: How will you measure success?
+
+Provide your revised problem definition:""",
+        "Getting your ideas down",
+    ),
+    ("solution", True): (
+        "Outstanding! Your solution design is solid.",
+        "You're ready to start execution! Let's create your milestone plan.",
+        "",
+    ),
+    ("solution", False): (
+        "Good thinking! Your solution design needs some refinement.",
+        "\n\nPlease revise your solution design based on this feedback.",
+        "Good initial thinking",
+    ),
+}
+
+
+def _render_feedback(mode: str, feedback: Dict[str, Any], passed: bool) -> str:
+    """Render tutor feedback for a problem or solution evaluation."""
+
+    passed = bool(passed)
+    opening, closing, strengths_fallback = _FEEDBACK_TEXT[(mode, passed)]
+    template = _PASSED_FEEDBACK_TEMPLATE if passed else _FAILED_FEEDBACK_TEMPLATE
+    examples = feedback.get('example_improvements')
+
+    return template.format(
+        opening=opening,
+        closing=closing,
+        overall=feedback.get('overall_feedback', ''),
+        strengths=_bullet_list(feedback.get('strengths') or []) or strengths_fallback,
+        suggestions=_bullet_list(feedback.get('improvement_suggestions') or []),
+        scores=''.join(
+            f"- {criterion.replace('_', ' ').title()}: {score}/10\n"
+            for criterion, score in feedback.get('scores', {}).items()
+        ),
+        examples=f"\n**Examples:**\n{examples}" if examples else ""
+    )
+
+
+# Static messages, built once at import rather than per call
+_WELCOME_MESSAGE = """Welcome to Sapiens! I'm here to guide you through building a portfolio project that will impress recruiters.
+
+Over the next 2-3 weeks, we'll work together to:
+1. Design a project tailored to your target role
+2. Define a meaningful problem to solve
+3. Create a solution strategy
+4. Execute and build real deliverables
+5. Generate resume-ready content
+
+Let's get started! To create the perfect project for you, I need to understand your goals.
+
+**What role are you targeting?** (e.g., Product Manager, Data Analyst, Marketing Associate)"""
+
+_PROBLEM_STATEMENT_PROMPT = """Now let's define the specific problem you'll address in this project.
+
+I'll guide you through this step by step. Let's start with the first question:
+
+**1. Problem Statement** (1-2 sentences)
+
+What specific problem are you solving? Be clear and concise.
+
+Example: "Many small business owners struggle to track their expenses efficiently, leading to poor financial decisions."
+
+Your answer:"""
+
+_PROBLEM_AUDIENCE_PROMPT = """Great! Now let's identify who experiences this problem.
+
+**2. Target Audience**
+
+Who specifically experiences this problem? Be as specific as possible about the group, their characteristics, or their situation.
+
+Example: "Small business owners with 1-10 employees who manage finances manually without dedicated accounting software."
+
+Your answer:"""
+
+_PROBLEM_PAIN_POINTS_PROMPT = """Perfect! Now let's understand the key pain points.
+
+**3. Key Pain Points**
+
+What are the main pain points or challenges your target audience faces related to this problem? You can list multiple points.
+
+Example: "Time-consuming manual entry, difficulty categorizing expenses, lack of visibility into spending patterns, missed tax deductions."
+
+Your answer:"""
+
+_PROBLEM_METRICS_PROMPT = """Excellent! Finally, let's define success metrics.
+
+**4. Success Metrics**
+
+How will you measure if you've addressed the problem well? What outcomes or metrics will demonstrate success? (You can list multiple metrics)
+
+Example: "Reduced time spent on expense tracking by 50%, improved expense categorization accuracy, increased visibility into spending patterns."
+
+Your answer:"""
+
+_PROBLEM_DEFINITION_PROMPT = """Now let's define the specific problem you'll address in this project.
+
+A strong problem definition should:
+- Identify a specific pain point or opportunity
+- Clarify who experiences this problem
+- Explain why it matters
+- Be addressable in 2-3 weeks
+
+Please provide your problem definition."""
+
+_PROBLEM_PROMPTS_BY_STEP = {
+    "intro": _PROBLEM_STATEMENT_PROMPT,
+    "statement": _PROBLEM_STATEMENT_PROMPT,
+    "audience": _PROBLEM_AUDIENCE_PROMPT,
+    "pain_points": _PROBLEM_PAIN_POINTS_PROMPT,
+    "metrics": _PROBLEM_METRICS_PROMPT,
+}
+
+_SOLUTION_PROMPT = """Great! Now let's design your solution approach.
+
+A strong solution design should:
+- Logically address the problem you defined
+- Be innovative or differentiated
+- Be feasible to implement in 2-3 weeks
+- Have clear, measurable outcomes
+
+Please provide:
+
+1. **Solution Approach** (2-3 sentences): What's your high-level approach?
+
+2. **Key Components**: What are the main elements or parts of your solution?
+
+3. **Methodology**: What methods, frameworks, or processes will you use?
+
+4. **Expected Outcomes**: What will this solution achieve?
+
+5. **Resource Requirements** (optional): What tools, data, or resources do you need?
+
+Think strategically about how to create maximum impact."""
+
+_REVIEW_REQUEST_MESSAGE = """Congratulations on completing your project work! Now it's time for the final review.
+
+Please submit your final artifacts:
+
+1. **Artifact Type** (e.g., Report, Presentation, Prototype)
+2. **Description** of what you've created
+3. **Link or file** (if available)
+
+Submit each deliverable, and I'll provide an objective evaluation based on the project criteria."""
+
+_COMPLETION_MESSAGE = """Congratulations! You've successfully completed your project journey with Sapiens.
+
+You now have:
+- A completed, recruiter-relevant project
+- Professional resume bullets grounded in real work
+- Interview talking points
+- Tangible deliverables to showcase
+
+**What's Next:**
+1. Update your resume with the bullets provided
+2. Add this project to your LinkedIn
+3. Prepare your portfolio artifacts for interviews
+4. Start applying to roles with confidence!
+
+Thank you for using Sapiens. Best of luck with your job search!"""
 
 
 class MainChatAgent(BaseAgent):
@@ -23,29 +256,55 @@ class MainChatAgent(BaseAgent):
     It only formats messages for the user.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(agent_name="MainChat", **kwargs)
+    def __init__(
+        self,
+        *,
+        rag_module: Optional[RAGModule] = None,
+        logging_module: Optional[LoggingModule] = None,
+        openai_api_key: Optional[str] = None,
+        model: str = "gpt-4o"
+    ):
+        super().__init__(
+            agent_name="MainChat",
+            rag_module=rag_module,
+            logging_module=logging_module,
+            openai_api_key=openai_api_key,
+            model=model
+        )
+        self._handlers = {
+            "welcome": self._generate_welcome,
+            "onboarding_question": self._generate_onboarding_question,
+            "project_proposal": self._generate_project_proposal,
+            "problem_prompt": self._generate_problem_prompt,
+            "problem_feedback": self._generate_problem_feedback,
+            "solution_prompt": self._generate_solution_prompt,
+            "solution_feedback": self._generate_solution_feedback,
+            "execution_plan": self._generate_execution_plan,
+            "milestone_update": self._generate_milestone_update,
+            "review_request": self._generate_review_request,
+            "review_feedback": self._generate_review_feedback,
+            "resume_delivery": self._generate_resume_delivery,
+            "completion": self._generate_completion,
+        }
 
-    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def process(self, input_data: MainChatInput) -> MainChatOutput:
         """
         Process input and generate appropriate output.
 
         Args:
-            input_data: Dictionary containing message_type, context, etc.
+            input_data: MainChatInput with message_type, context, etc.
 
         Returns:
-            Dictionary with generated message
+            MainChatOutput with generated message
         """
-        message_type = input_data.get("message_type", "")
-        context = input_data.get("context", {})
-        custom_message = input_data.get("custom_message")
 
-        message = self.generate_message(message_type, context, custom_message)
+        message = self.generate_message(
+            input_data.message_type,
+            input_data.context,
+            input_data.custom_message
+        )
 
-        return {
-            "message": message,
-            "message_type": message_type
-        }
+        return MainChatOutput(message=message, message_type=input_data.message_type)
 
     def generate_message(
         self,
@@ -66,36 +325,14 @@ class MainChatAgent(BaseAgent):
         """
 
         if custom_message:
-            return self._add_personality(custom_message)
-
-        if message_type == "welcome":
-            return self._generate_welcome()
-        elif message_type == "onboarding_question":
-            return self._generate_onboarding_question(context)
-        elif message_type == "project_proposal":
-            return self._generate_project_proposal(context)
-        elif message_type == "problem_prompt":
-            return self._generate_problem_prompt(context)
-        elif message_type == "problem_feedback":
-            return self._generate_problem_feedback(context)
-        elif message_type == "solution_prompt":
-            return self._generate_solution_prompt(context)
-        elif message_type == "solution_feedback":
-            return self._generate_solution_feedback(context)
-        elif message_type == "execution_plan":
-            return self._generate_execution_plan(context)
-        elif message_type == "milestone_update":
-            return self._generate_milestone_update(context)
-        elif message_type == "review_request":
-            return self._generate_review_request(context)
-        elif message_type == "review_feedback":
-            return self._generate_review_feedback(context)
-        elif message_type == "resume_delivery":
-            return self._generate_resume_delivery(context)
-        elif message_type == "completion":
-            return self._generate_completion(context)
-        else:
-            return "I'm here to help you with your project. What would you like to do?"
+            # Relayed verbatim; tone adjustment would go here
+            return custom_message
+
+        handler = self._handlers.get(message_type)
+        if handler is None:
+            return _DEFAULT_MESSAGE
+
+        return handler(context)
 
     def parse_user_input(
         self,
@@ -122,36 +359,20 @@ class MainChatAgent(BaseAgent):
         if expected_type == "approval":
             # Check for approval/rejection
             message_lower = user_message.lower()
-            if any(word in message_lower for word in ["yes", "approve", "looks good", "proceed", "confirm"]):
+            words = set(_WORD_RE.findall(message_lower))
+            if words & _APPROVE_WORDS or any(phrase in message_lower for phrase in _APPROVE_PHRASES):
                 parsed["approved"] = True
-            elif any(word in message_lower for word in ["no", "reject", "change", "different", "not"]):
+            elif words & _REJECT_WORDS:
                 parsed["approved"] = False
             else:
                 parsed["approved"] = None  # Unclear
 
         return parsed
 
-    def _add_personality(self, message: str) -> str:
-        """Add friendly, professional tone to message."""
-
-        # In production, could use Claude to enhance tone
-        return message
-
-    def _generate_welcome(self) -> str:
+    def _generate_welcome(self, context: Dict[str, Any]) -> str:
         """Generate welcome message."""
 
-        return """Welcome to Sapiens! I'm here to guide you through building a portfolio project that will impress recruiters.
-
-Over the next 2-3 weeks, we'll work together to:
-1. Design a project tailored to your target role
-2. Define a meaningful problem to solve
-3. Create a solution strategy
-4. Execute and build real deliverables
-5. Generate resume-ready content
-
-Let's get started! To create the perfect project for you, I need to understand your goals.
-
-**What role are you targeting?** (e.g., Product Manager, Data Analyst, Marketing Associate)"""
+        return _WELCOME_MESSAGE
 
     def _generate_onboarding_question(self, context: Dict[str, Any]) -> str:
         """Generate onboarding question."""
@@ -166,7 +387,7 @@ Let's get started! To create the perfect project for you, I need to understand y
         if not proposal:
             return "I'm working on generating a project proposal for you..."
 
-        message = f"""Great! I've designed a project specifically for you:
+        parts = [f"""Great! I've designed a project specifically for you:
 
 # {proposal.title}
 
@@ -179,15 +400,17 @@ Let's get started! To create the perfect project for you, I need to understand y
 {proposal.description}
 
 **Deliverables:**
-"""
+"""]
 
-        for i, deliverable in enumerate(proposal.deliverables, 1):
-            message += f"\n{i}. **{deliverable.name}**: {deliverable.description}"
+        parts.extend(
+            _DELIVERABLE_TEMPLATE.format(index=i, name=deliverable.name, description=deliverable.description)
+            for i, deliverable in enumerate(proposal.deliverables, 1)
+        )
 
-        message += f"""
+        parts.append(f"""
 
 **Skills You'll Demonstrate:**
-{chr(10).join(f"- {skill}" for skill in proposal.skills_demonstrated)}
+{_bullet_list(proposal.skills_demonstrated)}
 
 **Estimated Time:** {proposal.estimated_duration_weeks} weeks
 
@@ -196,232 +419,73 @@ Let's get started! To create the perfect project for you, I need to understand y
 
 ---
 
-What do you think? Does this project excite you? (Yes/No or request changes)"""
+What do you think? Does this project excite you? (Yes/No or request changes)""")
 
-        return message
+        return ''.join(parts)
 
     def _generate_problem_prompt(self, context: Dict[str, Any]) -> str:
         """Generate problem definition prompt - step by step."""
 
         step = context.get("step", "intro")
 
-        if step == "intro" or step == "statement":
-            return """Now let's define the specific problem you'll address in this project.
-
-I'll guide you through this step by step. Let's start with the first question:
-
-**1. Problem Statement** (1-2 sentences)
-
-What specific problem are you solving? Be clear and concise.
-
-Example: "Many small business owners struggle to track their expenses efficiently, leading to poor financial decisions."
-
-Your answer:"""
-
-        elif step == "audience":
-            return """Great! Now let's identify who experiences this problem.
-
-**2. Target Audience**
-
-Who specifically experiences this problem? Be as specific as possible about the group, their characteristics, or their situation.
-
-Example: "Small business owners with 1-10 employees who manage finances manually without dedicated accounting software."
-
-Your answer:"""
-
-        elif step == "pain_points":
-            return """Perfect! Now let's understand the key pain points.
-
-**3. Key Pain Points**
-
-What are the main pain points or challenges your target audience faces related to this problem? You can list multiple points.
-
-Example: "Time-consuming manual entry, difficulty categorizing expenses, lack of visibility into spending patterns, missed tax deductions."
-
-Your answer:"""
-
-        elif step == "metrics":
-            return """Excellent! Finally, let's define success metrics.
-
-**4. Success Metrics**
-
-How will you measure if you've addressed the problem well? What outcomes or metrics will demonstrate success? (You can list multiple metrics)
-
-Example: "Reduced time spent on expense tracking by 50%, improved expense categorization accuracy, increased visibility into spending patterns."
-
-Your answer:"""
-
-        else:
-            # Fallback to original prompt
-            return """Now let's define the specific problem you'll address in this project.
-
-A strong problem definition should:
-- Identify a specific pain point or opportunity
-- Clarify who experiences this problem
-- Explain why it matters
-- Be addressable in 2-3 weeks
-
-Please provide your problem definition."""
+        # Unknown steps fall back to the original single-prompt version
+        return _PROBLEM_PROMPTS_BY_STEP.get(step, _PROBLEM_DEFINITION_PROMPT)
 
     def _generate_problem_feedback(self, context: Dict[str, Any]) -> str:
         """Generate problem evaluation feedback."""
 
-        feedback = context.get("feedback")
-        passed = context.get("passed", False)
-
-        if passed:
-            message = f"""Excellent! Your problem definition is strong. Here's my evaluation:
-
-{feedback.get('overall_feedback', '')}
-
-**Strengths:**
-{chr(10).join(f"- {s}" for s in feedback.get('strengths', []))}
-
-**Scores:**
-"""
-            for criterion, score in feedback.get('scores', {}).items():
-                message += f"- {criterion.replace('_', ' ').title()}: {score}/10\n"
-
-            message += "\nYou're ready to move to solution design!"
-
-        else:
-            message = f"""Good start! Your problem definition needs some refinement. Here's my feedback:
-
-{feedback.get('overall_feedback', '')}
-
-**What's Working:**
-{chr(10).join(f"- {s}" for s in feedback.get('strengths', [])) if feedback.get('strengths') else 'Getting your ideas down'}
-
-**Suggestions for Improvement:**
-{chr(10).join(f"- {s}" for s in feedback.get('improvement_suggestions', []))}
-
-**Scores:**
-"""
-            for criterion, score in feedback.get('scores', {}).items():
-                message += f"- {criterion.replace('_', ' ').title()}: {score}/10\n"
-
-            if feedback.get('example_improvements'):
-                message += f"\n**Examples:**\n{feedback['example_improvements']}"
-
-            message += """
-
----
-
-Please revise your problem definition based on this feedback. You can provide your complete revised problem definition addressing:
-
-1. **Problem Statement**: What specific problem are you solving?
-2. **Target Audience**: Who experiences this problem?
-3. **Key Pain Points**: What are the main challenges?
-4. **Success Metrics**: How will you measure success?
-
-Provide your revised problem definition:"""
-
-        return message
+        return _render_feedback("problem", context.get("feedback"), context.get("passed", False))
 
     def _generate_solution_prompt(self, context: Dict[str, Any]) -> str:
         """Generate solution design prompt."""
 
-        return """Great! Now let's design your solution approach.
-
-A strong solution design should:
-- Logically address the problem you defined
-- Be innovative or differentiated
-- Be feasible to implement in 2-3 weeks
-- Have clear, measurable outcomes
-
-Please provide:
-
-1. **Solution Approach** (2-3 sentences): What's your high-level approach?
-
-2. **Key Components**: What are the main elements or parts of your solution?
-
-3. **Methodology**: What methods, frameworks, or processes will you use?
-
-4. **Expected Outcomes**: What will this solution achieve?
-
-5. **Resource Requirements** (optional): What tools, data, or resources do you need?
-
-Think strategically about how to create maximum impact."""
+        return _SOLUTION_PROMPT
 
     def _generate_solution_feedback(self, context: Dict[str, Any]) -> str:
         """Generate solution evaluation feedback."""
 
-        feedback = context.get("feedback")
-        passed = context.get("passed", False)
-
-        if passed:
-            message = f"""Outstanding! Your solution design is solid. Here's my evaluation:
-
-{feedback.get('overall_feedback', '')}
-
-**Strengths:**
-{chr(10).join(f"- {s}" for s in feedback.get('strengths', []))}
-
-**Scores:**
-"""
-            for criterion, score in feedback.get('scores', {}).items():
-                message += f"- {criterion.replace('_', ' ').title()}: {score}/10\n"
-
-            message += "\nYou're ready to start execution! Let's create your milestone plan."
-
-        else:
-            message = f"""Good thinking! Your solution design needs some refinement. Here's my feedback:
-
-{feedback.get('overall_feedback', '')}
-
-**What's Working:**
-{chr(10).join(f"- {s}" for s in feedback.get('strengths', [])) if feedback.get('strengths') else 'Good initial thinking'}
-
-**Suggestions for Improvement:**
-{chr(10).join(f"- {s}" for s in feedback.get('suggestions', []))}
-
-**Scores:**
-"""
-            for criterion, score in feedback.get('scores', {}).items():
-                message += f"- {criterion.replace('_', ' ').title()}: {score}/10\n"
-
-            if feedback.get('example_improvements'):
-                message += f"\n**Examples:**\n{feedback['example_improvements']}"
-
-            message += "\n\nPlease revise your solution design based on this feedback."
-
-        return message
+        return _render_feedback("solution", context.get("feedback"), context.get("passed", False))
 
     def _generate_execution_plan(self, context: Dict[str, Any]) -> str:
         """Generate execution plan presentation."""
 
         milestones = context.get("milestones", [])
         feedback = context.get("feedback", "")
+        first = milestones[0] if milestones else None
+        total_days = 0
 
-        message = f"""Excellent! Here's your execution plan:
+        buffer = io.StringIO()
+        write = buffer.write
+
+        write(f"""Excellent! Here's your execution plan:
 
 {feedback}
 
 **Your Milestones:**
-"""
+""")
 
         for milestone in milestones:
-            message += f"""
-### {milestone.order}. {milestone.title}
-- **Goal**: {milestone.description}
-- **Deliverable**: {milestone.deliverable}
-- **Estimated Time**: {milestone.estimated_days} days
-- **Next Action**: {milestone.next_action}
-"""
+            total_days += milestone.estimated_days
+            write(_MILESTONE_TEMPLATE.format_map(vars(milestone)))
 
-        message += f"""
+        write(f"""
 
-**Total Estimated Time:** {sum(m.estimated_days for m in milestones)} days
+**Total Estimated Time:** {total_days} days
 
 ---
+""")
 
-Ready to start? Your first milestone is: **{milestones[0].title}**
+        if first:
+            write(f"""
+Ready to start? Your first milestone is: **{first.title}**
 
-**Your next action:** {milestones[0].next_action}
+**Your next action:** {first.next_action}
+""")
 
-When you make progress, share an update and I'll guide you to the next step!"""
+        write("""
+When you make progress, share an update and I'll guide you to the next step!""")
 
-        return message
+        return buffer.getvalue()
 
     def _generate_milestone_update(self, context: Dict[str, Any]) -> str:
         """Generate milestone progress update."""
@@ -430,76 +494,69 @@ When you make progress, share an update and I'll guide you to the next step!"""
         next_action = context.get("next_action", "")
         stagnation = context.get("stagnation", False)
 
-        message = feedback
+        parts = [feedback]
 
         if stagnation:
-            message += "\n\n⚠️ I notice you might be stuck. Let's get you unstuck!"
+            parts.append("\n\n⚠️ I notice you might be stuck. Let's get you unstuck!")
 
-        message += f"\n\n**Your next action:** {next_action}"
+        parts.append(f"\n\n**Your next action:** {next_action}")
 
         if context.get("tips"):
-            message += f"\n\n**Tips:**\n"
-            for tip in context["tips"]:
-                message += f"- {tip}\n"
+            parts.append("\n\n**Tips:**\n")
+            parts.extend(f"- {tip}\n" for tip in context["tips"])
 
-        return message
+        return ''.join(parts)
 
     def _generate_review_request(self, context: Dict[str, Any]) -> str:
         """Generate review request."""
 
-        return """Congratulations on completing your project work! Now it's time for the final review.
-
-Please submit your final artifacts:
-
-1. **Artifact Type** (e.g., Report, Presentation, Prototype)
-2. **Description** of what you've created
-3. **Link or file** (if available)
-
-Submit each deliverable, and I'll provide an objective evaluation based on the project criteria."""
+        return _REVIEW_REQUEST_MESSAGE
 
     def _generate_review_feedback(self, context: Dict[str, Any]) -> str:
         """Generate review feedback."""
 
         review = context.get("review")
 
-        message = f"""# Project Review Complete
+        parts = [f"""# Project Review Complete
 
 {review.overall_feedback}
 
 **Overall Score:** {review.overall_score}/10
 
 **Criterion Scores:**
-"""
+"""]
 
-        for criterion, score in review.criterion_scores.items():
-            message += f"- {criterion}: {score}/10\n"
+        parts.extend(f"- {criterion}: {score}/10\n" for criterion, score in review.criterion_scores.items())
 
-        message += f"""
+        parts.append(f"""
 
 **Strengths:**
-{chr(10).join(f"- {s}" for s in review.strengths)}
+{_bullet_list(review.strengths)}
 
 **Areas for Improvement:**
-{chr(10).join(f"- {s}" for s in review.areas_for_improvement)}
+{_bullet_list(review.areas_for_improvement)}
 
 **Recruiter Perspective:**
 {review.recruiter_appeal_assessment}
 
 **Skills You Demonstrated:**
-{chr(10).join(f"- {s}" for s in review.skills_demonstrated)}
+{_bullet_list(review.skills_demonstrated)}
 
 ---
 
-Ready to generate your resume content? (Yes/No)"""
+Ready to generate your resume content? (Yes/No)""")
 
-        return message
+        return ''.join(parts)
 
     def _generate_resume_delivery(self, context: Dict[str, Any]) -> str:
         """Generate resume content delivery."""
 
         resume = context.get("resume")
 
-        message = f"""# Your Resume Content
+        buffer = io.StringIO()
+        write = buffer.write
+
+        write(f"""# Your Resume Content
 
 Here's your resume-ready content, grounded in the actual work you completed:
 
@@ -509,22 +566,21 @@ Here's your resume-ready content, grounded in the actual work you completed:
 {resume['project_one_liner']}
 
 ## Resume Bullets
-"""
+""")
 
         for i, bullet in enumerate(resume.get('bullets', []), 1):
-            message += f"\n{i}. {bullet.bullet_text}"
-            message += f"\n   *Skills: {', '.join(bullet.skills_highlighted)}*\n"
+            write(_RESUME_BULLET_TEMPLATE.format(index=i, text=bullet.bullet_text, skills=', '.join(bullet.skills_highlighted)))
 
-        message += f"""
+        write(f"""
 
 ## Cover Letter Description
 {resume.get('project_description', '')}
 
 ## Skills to Add to Resume
-{chr(10).join(f"- {s}" for s in resume.get('suggested_skills', []))}
+{_bullet_list(resume.get('suggested_skills', []))}
 
 ## Interview Talking Points
-{chr(10).join(f"- {p}" for p in resume.get('talking_points', []))}
+{_bullet_list(resume.get('talking_points', []))}
 
 ---
 
@@ -534,27 +590,11 @@ Here's your resume-ready content, grounded in the actual work you completed:
 3. Practice discussing your project using the talking points
 4. Keep your project artifacts accessible for portfolio
 
-Congratulations on completing your project!"""
+Congratulations on completing your project!""")
 
-        return message
+        return buffer.getvalue()
 
     def _generate_completion(self, context: Dict[str, Any]) -> str:
         """Generate completion message."""
 
-        return """Congratulations! You've successfully completed your project journey with Sapiens.
-
-You now have:
-- A completed, recruiter-relevant project
-- Professional resume bullets grounded in real work
-- Interview talking points
-- Tangible deliverables to showcase
-
-**What's Next:**
-1. Update your resume with the bullets provided
-2. Add this project to your LinkedIn
-3. Prepare your portfolio artifacts for interviews
-4. Start applying to roles with confidence!
-
-Thank you for using Sapiens. Best of luck with your job search!"""
-
-        return message
+        return _COMPLETION_MESSAGE
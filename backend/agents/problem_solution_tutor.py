@@ -5,14 +5,146 @@ Evaluates both problem definitions and solution designs.
 Uses different evaluation lenses for each.
 """
 
-from typing import Dict
+import re
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from .base import BaseAgent
+from ..modules.rag import RAGModule
+from ..modules.logging import LoggingModule
 from ..schemas.agent_io import (
     ProblemSolutionTutorInput,
     ProblemSolutionTutorOutput
 )
 
 
+# Evaluations run at low temperature for consistent scoring. This is within
+# BaseAgent's response cache limit, so resubmitting an unchanged definition
+# is answered from the cache instead of a new LLM call.
+EVALUATION_TEMPERATURE = 0.3
+
+# An evaluation passes when the average score reaches PASS_AVERAGE_SCORE and
+# every individual score reaches PASS_MIN_SCORE
+PASS_AVERAGE_SCORE = 7.0
+PASS_MIN_SCORE = 6.0
+
+# First number in a score value ("8", "7.5", "8/10")
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Score labels (lower-cased, as they appear in the EVALUATION SCORES section)
+# mapped to output keys, per mode. Labels are also matched as substrings, so
+# "1. Market Relevance" and "**Clarity**" still resolve.
+_SCORE_KEYS = {
+    "problem": {
+        "market relevance": "market_relevance",
+        "clarity": "clarity",
+        "feasibility": "feasibility",
+    },
+    "solution": {
+        "logical coherence": "logical_coherence",
+        "innovation": "innovation",
+        "implementation feasibility": "implementation_feasibility",
+        "impact potential": "impact_potential",
+    },
+}
+
+# System prompts are module-level constants so the request prefix is
+# byte-identical across calls and eligible for prompt caching.
+PROBLEM_EVALUATION_SYSTEM_PROMPT = """You are an expert tutor evaluating problem definitions using a market/research lens.
+
+Your goal is to help job seekers define problems that are:
+1. Relevant to the market or domain
+2. Clear and specific
+3. Feasible to address in 2-3 weeks
+
+Evaluation criteria (0-10 scale):
+- Market Relevance: How relevant is this problem to the target market/domain?
+- Clarity: How clearly and specifically is the problem defined?
+- Feasibility: How feasible is it to address this problem in 2-3 weeks?
+
+Output format:
+
+# EVALUATION SCORES
+Market Relevance: [0-10]
+Clarity: [0-10]
+Feasibility: [0-10]
+
+# FIELD-SPECIFIC FEEDBACK
+## Problem Statement
+[Detailed feedback on the problem statement - what's good, what needs improvement, specific suggestions]
+
+## Target Audience
+[Detailed feedback on the target audience - is it specific enough? Any gaps? Suggestions for refinement]
+
+## Key Pain Points
+[Detailed feedback on the pain points - are they concrete? Do they align with the problem? What's missing?]
+
+## Success Metrics
+[Detailed feedback on success metrics - are they measurable? Realistic for 2-3 weeks? Suggestions for better metrics]
+
+# OVERALL FEEDBACK
+[2-3 paragraphs of constructive feedback]
+
+# STRENGTHS
+- [Strength 1]
+- [Strength 2]
+- [Continue]
+
+# IMPROVEMENT SUGGESTIONS
+- [Specific, actionable suggestion 1]
+- [Specific, actionable suggestion 2]
+- [Continue]
+
+# EXAMPLES OF IMPROVEMENTS
+[Concrete examples of how to strengthen the problem definition]
+
+# NEXT STEPS
+[Clear guidance on what to do next]
+
+Be constructive, specific, and encouraging. Focus on helping the user improve."""
+
+SOLUTION_EVALUATION_SYSTEM_PROMPT = """You are an expert tutor evaluating solution designs using a VC/practitioner lens.
+
+Your goal is to help job seekers design solutions that are:
+1. Logically coherent and well-structured
+2. Innovative or differentiated
+3. Feasible to implement in 2-3 weeks
+4. High-impact and impressive
+
+Evaluation criteria (0-10 scale):
+- Logical Coherence: How logically sound is the solution approach?
+- Innovation: How innovative or differentiated is this solution?
+- Implementation Feasibility: How feasible is it to implement in 2-3 weeks?
+- Impact Potential: How impactful could this solution be if executed well?
+
+Output format:
+
+# EVALUATION SCORES
+Logical Coherence: [0-10]
+Innovation: [0-10]
+Implementation Feasibility: [0-10]
+Impact Potential: [0-10]
+
+# OVERALL FEEDBACK
+[2-3 paragraphs of constructive feedback]
+
+# STRENGTHS
+- [Strength 1]
+- [Strength 2]
+- [Continue]
+
+# IMPROVEMENT SUGGESTIONS
+- [Specific, actionable suggestion 1]
+- [Specific, actionable suggestion 2]
+- [Continue]
+
+# EXAMPLES OF IMPROVEMENTS
+[Concrete examples of how to strengthen the solution]
+
+# NEXT STEPS
+[Clear guidance on what to do next]
+
+Be constructive, specific, and encouraging. Focus on helping the user improve."""
+
+
 class ProblemSolutionTutorAgent(BaseAgent):
     """
     Evaluates problem definitions and solution designs.
@@ -29,8 +161,27 @@ class ProblemSolutionTutorAgent(BaseAgent):
     - Impact potential
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(agent_name="ProblemSolutionTutor", **kwargs)
+    def __init__(
+        self,
+        *,
+        rag_module: Optional[RAGModule] = None,
+        logging_module: Optional[LoggingModule] = None,
+        openai_api_key: Optional[str] = None,
+        model: str = "gpt-4o"
+    ):
+        super().__init__(
+            agent_name="ProblemSolutionTutor",
+            rag_module=rag_module,
+            logging_module=logging_module,
+            openai_api_key=openai_api_key,
+            model=model
+        )
+        # Each mode maps to (request builder, output parser); every entry
+        # point dispatches through this table
+        self._modes = {
+            "problem": (self._problem_request, self._problem_output),
+            "solution": (self._solution_request, self._solution_output),
+        }
 
     def process(self, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
         """
@@ -44,33 +195,81 @@ class ProblemSolutionTutorAgent(BaseAgent):
         """
 
         try:
-            if input_data.mode == "problem":
-                return self._evaluate_problem(input_data)
-            elif input_data.mode == "solution":
-                return self._evaluate_solution(input_data)
-            else:
-                raise ValueError(f"Invalid mode: {input_data.mode}")
+            request_builder, output_parser = self._mode(input_data)
+            response = self.call_claude(**request_builder(input_data))
+            return output_parser(response, input_data)
+        except Exception as e:
+            return self._error_output(input_data, e)
+
+    async def aprocess(self, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
+        """
+        Async variant of process.
+
+        Uses the non-blocking OpenAI client so the caller can evaluate a
+        problem and a solution (or several submissions) concurrently, e.g.
+        with asyncio.gather.
+
+        Args:
+            input_data: ProblemSolutionTutorInput
+
+        Returns:
+            ProblemSolutionTutorOutput with evaluation
+        """
 
+        try:
+            request_builder, output_parser = self._mode(input_data)
+            response = await self.acall_llm(**request_builder(input_data))
+            return output_parser(response, input_data)
         except Exception as e:
-            return ProblemSolutionTutorOutput(
-                request_id=input_data.request_id,
-                success=False,
-                mode=input_data.mode,
-                evaluation_passed=False,
-                overall_feedback=f"Evaluation failed: {str(e)}",
-                next_steps="Please try again."
-            )
-
-    def _evaluate_problem(self, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
-        """Evaluate problem definition using market/research lens."""
+            return self._error_output(input_data, e)
+
+    def process_many(self, input_list: List[ProblemSolutionTutorInput]) -> List[ProblemSolutionTutorOutput]:
+        """
+        Evaluate several submissions in one OpenAI Batch API job.
+
+        Meant for server-side grading of a cohort, where results are not
+        needed interactively; batch jobs are cheaper but can take hours.
+
+        Args:
+            input_list: ProblemSolutionTutorInputs to evaluate
+
+        Returns:
+            ProblemSolutionTutorOutputs in the same order as input_list
+        """
+
+        return self._process_batched(
+            input_list,
+            lambda input_data: self._mode(input_data)[0](input_data),
+            lambda response, input_data: self._mode(input_data)[1](response, input_data)
+        )
+
+    def _mode(self, input_data: ProblemSolutionTutorInput) -> Tuple[Callable, Callable]:
+        """Look up the (request builder, output parser) pair for an evaluation mode."""
+
+        try:
+            return self._modes[input_data.mode]
+        except KeyError:
+            raise ValueError(f"Invalid mode: {input_data.mode}") from None
+
+    def _error_output(self, input_data: ProblemSolutionTutorInput, error: Exception) -> ProblemSolutionTutorOutput:
+        """Build the error envelope returned when an evaluation fails."""
+
+        return ProblemSolutionTutorOutput(
+            request_id=input_data.request_id,
+            success=False,
+            mode=input_data.mode,
+            evaluation_passed=False,
+            overall_feedback=f"Evaluation failed: {str(error)}",
+            next_steps="Please try again."
+        )
+
+    def _problem_request(self, input_data: ProblemSolutionTutorInput) -> Dict[str, Any]:
+        """Build the call_llm arguments for a problem evaluation."""
 
         problem = input_data.problem_definition
         if not problem:
             raise ValueError("Problem definition is required for problem evaluation")
 
-        # Build system prompt
-        system_prompt = self._build_problem_evaluation_prompt()
-
         # Build user prompt
         user_prompt = f"""Evaluate this problem definition:
 
@@ -91,24 +290,26 @@ SUCCESS METRICS:
 
 Provide a thorough evaluation following the specified format."""
 
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.3  # Lower for consistent evaluation
-        )
+        return {
+            "system_prompt": self._build_problem_evaluation_prompt(),
+            "user_prompt": user_prompt,
+            "temperature": EVALUATION_TEMPERATURE,
+            "prompt_cache_key": f"{self.agent_name}:problem"
+        }
+
+    def _problem_output(self, response: str, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
+        """Parse a problem evaluation response into a ProblemSolutionTutorOutput."""
 
         # Parse evaluation
-        scores = self._parse_scores(response, "problem")
-        feedback = self._parse_feedback(response)
-        strengths = self._parse_strengths(response)
-        suggestions = self._parse_suggestions(response)
-        next_steps = self._parse_next_steps(response)
-        field_feedback = self._parse_field_feedback(response)
+        sections = self._parse_sections(response)
+        scores = self._parse_scores(sections, "problem")
+        feedback = self._parse_feedback(sections)
+        strengths = self._parse_strengths(sections)
+        suggestions = self._parse_suggestions(sections)
+        next_steps = self._parse_next_steps(sections)
+        field_feedback = self._parse_field_feedback(sections)
 
-        # Determine if passed
-        avg_score = sum(scores.values()) / len(scores)
-        passed = avg_score >= 7.0 and all(score >= 6.0 for score in scores.values())
+        passed = self._evaluation_passed(scores)
 
         # Include field feedback in overall feedback
         feedback_with_fields = feedback + "\n\n# FIELD-SPECIFIC FEEDBACK\n\n"
@@ -127,11 +328,11 @@ Provide a thorough evaluation following the specified format."""
             strengths=strengths,
             improvement_suggestions=suggestions,
             next_steps=next_steps,
-            example_improvements=self._generate_examples(response) if not passed else None
+            example_improvements=self._generate_examples(sections) if not passed else None
         )
 
-    def _evaluate_solution(self, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
-        """Evaluate solution design using VC/practitioner lens."""
+    def _solution_request(self, input_data: ProblemSolutionTutorInput) -> Dict[str, Any]:
+        """Build the call_llm arguments for a solution evaluation."""
 
         solution = input_data.solution_design
         problem = input_data.problem_context
@@ -139,9 +340,6 @@ Provide a thorough evaluation following the specified format."""
         if not solution:
             raise ValueError("Solution design is required for solution evaluation")
 
-        # Build system prompt
-        system_prompt = self._build_solution_evaluation_prompt()
-
         # Build user prompt
         user_prompt = f"""Evaluate this solution design:
 
@@ -165,23 +363,25 @@ RESOURCE REQUIREMENTS:
 
 Provide a thorough evaluation following the specified format."""
 
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.3
-        )
+        return {
+            "system_prompt": self._build_solution_evaluation_prompt(),
+            "user_prompt": user_prompt,
+            "temperature": EVALUATION_TEMPERATURE,
+            "prompt_cache_key": f"{self.agent_name}:solution"
+        }
+
+    def _solution_output(self, response: str, input_data: ProblemSolutionTutorInput) -> ProblemSolutionTutorOutput:
+        """Parse a solution evaluation response into a ProblemSolutionTutorOutput."""
 
         # Parse evaluation
-        scores = self._parse_scores(response, "solution")
-        feedback = self._parse_feedback(response)
-        strengths = self._parse_strengths(response)
-        suggestions = self._parse_suggestions(response)
-        next_steps = self._parse_next_steps(response)
+        sections = self._parse_sections(response)
+        scores = self._parse_scores(sections, "solution")
+        feedback = self._parse_feedback(sections)
+        strengths = self._parse_strengths(sections)
+        suggestions = self._parse_suggestions(sections)
+        next_steps = self._parse_next_steps(sections)
 
-        # Determine if passed
-        avg_score = sum(scores.values()) / len(scores)
-        passed = avg_score >= 7.0 and all(score >= 6.0 for score in scores.values())
+        passed = self._evaluation_passed(scores)
 
         return ProblemSolutionTutorOutput(
             request_id=input_data.request_id,
@@ -193,293 +393,159 @@ Provide a thorough evaluation following the specified format."""
             strengths=strengths,
             improvement_suggestions=suggestions,
             next_steps=next_steps,
-            example_improvements=self._generate_examples(response) if not passed else None
+            example_improvements=self._generate_examples(sections) if not passed else None
         )
 
-    def _build_problem_evaluation_prompt(self) -> str:
-        """Build system prompt for problem evaluation."""
+    def _evaluation_passed(self, scores: Dict[str, float]) -> bool:
+        """Pass if the average score is high enough and no single score is too low."""
 
-        return """You are an expert tutor evaluating problem definitions using a market/research lens.
+        values = list(scores.values())
 
-Your goal is to help job seekers define problems that are:
-1. Relevant to the market or domain
-2. Clear and specific
-3. Feasible to address in 2-3 weeks
-
-Evaluation criteria (0-10 scale):
-- Market Relevance: How relevant is this problem to the target market/domain?
-- Clarity: How clearly and specifically is the problem defined?
-- Feasibility: How feasible is it to address this problem in 2-3 weeks?
-
-Output format:
-
-# EVALUATION SCORES
-Market Relevance: [0-10]
-Clarity: [0-10]
-Feasibility: [0-10]
+        return sum(values) / len(values) >= PASS_AVERAGE_SCORE and min(values) >= PASS_MIN_SCORE
 
-# FIELD-SPECIFIC FEEDBACK
-## Problem Statement
-[Detailed feedback on the problem statement - what's good, what needs improvement, specific suggestions]
-
-## Target Audience
-[Detailed feedback on the target audience - is it specific enough? Any gaps? Suggestions for refinement]
-
-## Key Pain Points
-[Detailed feedback on the pain points - are they concrete? Do they align with the problem? What's missing?]
-
-## Success Metrics
-[Detailed feedback on success metrics - are they measurable? Realistic for 2-3 weeks? Suggestions for better metrics]
-
-# OVERALL FEEDBACK
-[2-3 paragraphs of constructive feedback]
-
-# STRENGTHS
-- [Strength 1]
-- [Strength 2]
-- [Continue]
-
-# IMPROVEMENT SUGGESTIONS
-- [Specific, actionable suggestion 1]
-- [Specific, actionable suggestion 2]
-- [Continue]
-
-# EXAMPLES OF IMPROVEMENTS
-[Concrete examples of how to strengthen the problem definition]
-
-# NEXT STEPS
-[Clear guidance on what to do next]
+    def _build_problem_evaluation_prompt(self) -> str:
+        """Build system prompt for problem evaluation."""
 
-Be constructive, specific, and encouraging. Focus on helping the user improve."""
+        return PROBLEM_EVALUATION_SYSTEM_PROMPT
 
     def _build_solution_evaluation_prompt(self) -> str:
         """Build system prompt for solution evaluation."""
 
-        return """You are an expert tutor evaluating solution designs using a VC/practitioner lens.
+        return SOLUTION_EVALUATION_SYSTEM_PROMPT
 
-Your goal is to help job seekers design solutions that are:
-1. Logically coherent and well-structured
-2. Innovative or differentiated
-3. Feasible to implement in 2-3 weeks
-4. High-impact and impressive
+    def _parse_sections(self, response: str) -> Dict[str, List[str]]:
+        """
+        Split a response into sections in a single pass.
+
+        Maps each heading (upper-cased, without the #'s, bold markers or a
+        trailing colon) to the non-blank lines up to the next heading. A line
+        that is bold on its own ("**Strengths:**") also counts as a heading.
+        "##" field headings get their own sections. Lines before the first
+        heading are kept under "". Only the first occurrence of a heading is
+        kept.
+        """
 
-Evaluation criteria (0-10 scale):
-- Logical Coherence: How logically sound is the solution approach?
-- Innovation: How innovative or differentiated is this solution?
-- Implementation Feasibility: How feasible is it to implement in 2-3 weeks?
-- Impact Potential: How impactful could this solution be if executed well?
+        sections = {}
+        current = sections.setdefault("", [])
 
-Output format:
+        for line in response.splitlines():
+            stripped = line.strip()
+            if self._is_heading(stripped):
+                current = sections.setdefault(stripped.strip('#*: \t').upper(), [])
+            elif stripped:
+                current.append(line)
 
-# EVALUATION SCORES
-Logical Coherence: [0-10]
-Innovation: [0-10]
-Implementation Feasibility: [0-10]
-Impact Potential: [0-10]
+        return sections
 
-# OVERALL FEEDBACK
-[2-3 paragraphs of constructive feedback]
+    def _is_heading(self, stripped: str) -> bool:
+        """Whether a stripped line is a markdown heading or a bold-only title line."""
 
-# STRENGTHS
-- [Strength 1]
-- [Strength 2]
-- [Continue]
+        if stripped.startswith('#'):
+            return True
 
-# IMPROVEMENT SUGGESTIONS
-- [Specific, actionable suggestion 1]
-- [Specific, actionable suggestion 2]
-- [Continue]
+        # "**Title**" or "**Title:**", but not a bold "**Clarity: 8**" score line
+        inner = stripped.rstrip(':')
+        return (
+            len(inner) > 4
+            and inner.startswith('**')
+            and inner.endswith('**')
+            and ':' not in inner.strip('*').rstrip(':')
+        )
 
-# EXAMPLES OF IMPROVEMENTS
-[Concrete examples of how to strengthen the solution]
+    def _section_text(self, sections: Dict[str, List[str]], title: str) -> str:
+        """Get the lines of a section as text."""
 
-# NEXT STEPS
-[Clear guidance on what to do next]
+        return '\n'.join(sections.get(title, [])).strip()
 
-Be constructive, specific, and encouraging. Focus on helping the user improve."""
+    def _parse_scores(self, sections: Dict[str, List[str]], mode: str) -> Dict[str, float]:
+        """
+        Parse evaluation scores from the EVALUATION SCORES section.
 
-    def _parse_scores(self, response: str, mode: str) -> Dict[str, float]:
-        """Parse evaluation scores from response."""
+        Falls back to scanning every section when the response has no
+        EVALUATION SCORES heading. The first score found for a label wins.
+        """
 
+        score_keys = _SCORE_KEYS[mode]
         scores = {}
-        lines = response.split('\n')
+
+        lines = sections.get("EVALUATION SCORES")
+        if lines is None:
+            lines = [line for section in sections.values() for line in section]
 
         for line in lines:
-            if ':' in line:
-                parts = line.split(':', 1)
-                key = parts[0].strip()
-                value_str = parts[1].strip()
-
-                # Extract number
-                try:
-                    value = float(''.join(filter(lambda x: x.isdigit() or x == '.', value_str)))
-                    value = max(0.0, min(10.0, value))
-
-                    if mode == "problem":
-                        if "Market Relevance" in key:
-                            scores["market_relevance"] = value
-                        elif "Clarity" in key:
-                            scores["clarity"] = value
-                        elif "Feasibility" in key:
-                            scores["feasibility"] = value
-                    elif mode == "solution":
-                        if "Logical Coherence" in key:
-                            scores["logical_coherence"] = value
-                        elif "Innovation" in key:
-                            scores["innovation"] = value
-                        elif "Implementation Feasibility" in key:
-                            scores["implementation_feasibility"] = value
-                        elif "Impact Potential" in key:
-                            scores["impact_potential"] = value
-                except:
-                    pass
+            label, sep, value_str = line.partition(':')
+            if not sep:
+                continue
+
+            key = self._score_key(label.strip(" \t-*").lower(), score_keys)
+            match = _NUMBER_RE.search(value_str)
+            if key and match:
+                scores.setdefault(key, max(0.0, min(10.0, float(match.group()))))
 
         # Ensure all scores are present with defaults
-        if mode == "problem":
-            scores.setdefault("market_relevance", 5.0)
-            scores.setdefault("clarity", 5.0)
-            scores.setdefault("feasibility", 5.0)
-        else:
-            scores.setdefault("logical_coherence", 5.0)
-            scores.setdefault("innovation", 5.0)
-            scores.setdefault("implementation_feasibility", 5.0)
-            scores.setdefault("impact_potential", 5.0)
+        for key in score_keys.values():
+            scores.setdefault(key, 5.0)
 
         return scores
 
-    def _parse_feedback(self, response: str) -> str:
-        """Parse overall feedback."""
+    def _score_key(self, label: str, score_keys: Dict[str, str]) -> Optional[str]:
+        """Map a lower-cased score label to its output key, exactly or by substring."""
 
-        lines = response.split('\n')
-        feedback = []
-        in_section = False
+        key = score_keys.get(label)
+        if key:
+            return key
 
-        for line in lines:
-            if "# OVERALL FEEDBACK" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('#'):
-                break
-            elif in_section and line.strip():
-                feedback.append(line)
+        for known_label, known_key in score_keys.items():
+            if known_label in label:
+                return known_key
 
-        return '\n'.join(feedback).strip() or "Evaluation completed."
+        return None
 
-    def _parse_strengths(self, response: str) -> list:
+    def _parse_feedback(self, sections: Dict[str, List[str]]) -> str:
+        """Parse overall feedback."""
+
+        return self._section_text(sections, "OVERALL FEEDBACK") or "Evaluation completed."
+
+    def _parse_strengths(self, sections: Dict[str, List[str]]) -> list:
         """Parse strengths."""
 
-        return self._parse_list_section(response, "# STRENGTHS")
+        return self._parse_list_section(sections, "STRENGTHS")
 
-    def _parse_suggestions(self, response: str) -> list:
+    def _parse_suggestions(self, sections: Dict[str, List[str]]) -> list:
         """Parse improvement suggestions."""
 
-        return self._parse_list_section(response, "# IMPROVEMENT SUGGESTIONS")
+        return self._parse_list_section(sections, "IMPROVEMENT SUGGESTIONS")
 
-    def _parse_next_steps(self, response: str) -> str:
+    def _parse_next_steps(self, sections: Dict[str, List[str]]) -> str:
         """Parse next steps."""
 
-        lines = response.split('\n')
-        next_steps = []
-        in_section = False
-
-        for line in lines:
-            if "# NEXT STEPS" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('#'):
-                break
-            elif in_section and line.strip():
-                next_steps.append(line)
+        return self._section_text(sections, "NEXT STEPS") or "Revise based on feedback and resubmit."
 
-        return '\n'.join(next_steps).strip() or "Revise based on feedback and resubmit."
-
-    def _parse_field_feedback(self, response: str) -> dict:
+    def _parse_field_feedback(self, sections: Dict[str, List[str]]) -> dict:
         """Parse field-specific feedback for each question."""
 
-        field_feedback = {
-            "problem_statement": "",
-            "target_audience": "",
-            "key_pain_points": "",
-            "success_metrics": ""
+        return {
+            "problem_statement": self._section_text(sections, "PROBLEM STATEMENT"),
+            "target_audience": self._section_text(sections, "TARGET AUDIENCE"),
+            "key_pain_points": self._section_text(sections, "KEY PAIN POINTS"),
+            "success_metrics": self._section_text(sections, "SUCCESS METRICS")
         }
 
-        lines = response.split('\n')
-        current_field = None
-        current_content = []
-
-        for line in lines:
-            # Check for field headers
-            if "## Problem Statement" in line:
-                if current_field and current_content:
-                    field_feedback[current_field] = '\n'.join(current_content).strip()
-                current_field = "problem_statement"
-                current_content = []
-            elif "## Target Audience" in line:
-                if current_field and current_content:
-                    field_feedback[current_field] = '\n'.join(current_content).strip()
-                current_field = "target_audience"
-                current_content = []
-            elif "## Key Pain Points" in line:
-                if current_field and current_content:
-                    field_feedback[current_field] = '\n'.join(current_content).strip()
-                current_field = "key_pain_points"
-                current_content = []
-            elif "## Success Metrics" in line:
-                if current_field and current_content:
-                    field_feedback[current_field] = '\n'.join(current_content).strip()
-                current_field = "success_metrics"
-                current_content = []
-            elif line.strip().startswith('# ') and current_field:
-                # New major section, save current field
-                if current_content:
-                    field_feedback[current_field] = '\n'.join(current_content).strip()
-                current_field = None
-                current_content = []
-            elif current_field and line.strip():
-                current_content.append(line)
-
-        # Save last field
-        if current_field and current_content:
-            field_feedback[current_field] = '\n'.join(current_content).strip()
-
-        return field_feedback
-
-    def _parse_list_section(self, response: str, header: str) -> list:
+    def _parse_list_section(self, sections: Dict[str, List[str]], title: str) -> list:
         """Parse a list section."""
 
-        lines = response.split('\n')
         items = []
-        in_section = False
 
-        for line in lines:
-            if header in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('#'):
-                break
-            elif in_section:
-                line = line.strip()
-                if line.startswith('- ') or line.startswith('* '):
-                    items.append(line[2:].strip())
-                elif line and line[0].isdigit() and '.' in line:
-                    items.append(line.split('.', 1)[1].strip())
+        for line in sections.get(title, []):
+            line = line.strip()
+            if line.startswith('- ') or line.startswith('* '):
+                items.append(line[2:].strip())
+            elif line and line[0].isdigit() and '.' in line:
+                items.append(line.split('.', 1)[1].strip())
 
         return items
 
-    def _generate_examples(self, response: str) -> str:
+    def _generate_examples(self, sections: Dict[str, List[str]]) -> str:
         """Extract example improvements."""
 
-        lines = response.split('\n')
-        examples = []
-        in_section = False
-
-        for line in lines:
-            if "# EXAMPLES OF IMPROVEMENTS" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('#'):
-                break
-            elif in_section and line.strip():
-                examples.append(line)
-
-        return '\n'.join(examples).strip() or None
+        return self._section_text(sections, "EXAMPLES OF IMPROVEMENTS") or None
@@ -4,83 +4,24 @@ Project Generator Agent.
 Generates role-aligned, recruiter-relevant projects completable in 2-3 weeks.
 """
 
+import asyncio
+import json
+import os
+import re
+import threading
 import uuid
-from typing import List
-from .base import BaseAgent
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import numpy as np
+from .base import BaseAgent, SemanticCache
 from ..schemas.agent_io import ProjectGeneratorInput, ProjectGeneratorOutput
 from ..schemas.project import ProjectProposal, ProjectType, DeliverableType
 
 
-class ProjectGeneratorAgent(BaseAgent):
-    """
-    Generates project proposals tailored to target role and domain.
-
-    Responsibilities:
-    - Analyze target role and domain
-    - Design 2-3 week projects
-    - Define deliverables and evaluation criteria
-    - Ensure recruiter appeal
-    """
-
-    def __init__(self, **kwargs):
-        super().__init__(agent_name="ProjectGenerator", **kwargs)
-
-    def process(self, input_data: ProjectGeneratorInput) -> ProjectGeneratorOutput:
-        """
-        Generate a project proposal.
-
-        Args:
-            input_data: ProjectGeneratorInput with role, domain, background
-
-        Returns:
-            ProjectGeneratorOutput with proposal
-        """
-
-        try:
-            # Get domain context if available
-            domain_context = ""
-            if self.rag_module:
-                domain_query = f"project ideas and best practices for {input_data.target_role} in {input_data.target_domain}"
-                domain_context = self.get_domain_context(
-                    input_data.target_domain,
-                    domain_query
-                )
-
-            # Build system prompt
-            system_prompt = self._build_system_prompt()
-
-            # Build user prompt
-            user_prompt = self._build_user_prompt(input_data, domain_context)
-
-            # Call Claude
-            response = self.call_claude(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.8  # Higher for creativity
-            )
-
-            # Parse response into structured proposal
-            proposal = self._parse_response(response, input_data)
-
-            return ProjectGeneratorOutput(
-                request_id=input_data.request_id,
-                success=True,
-                proposal=proposal,
-                reasoning=self._extract_reasoning(response),
-                alternative_options=self._extract_alternatives(response)
-            )
-
-        except Exception as e:
-            return ProjectGeneratorOutput(
-                request_id=input_data.request_id,
-                success=False,
-                message=f"Failed to generate project: {str(e)}"
-            )
-
-    def _build_system_prompt(self) -> str:
-        """Build system prompt for project generation."""
-
-        return """You are an expert career coach and project designer specializing in helping job seekers build impressive portfolio projects.
+# The system prompt and preamble are module-level constants so they are built
+# once and the request prefix is byte-identical across calls, which keeps it
+# eligible for prompt caching.
+PROJECT_GENERATION_SYSTEM_PROMPT = """You are an expert career coach and project designer specializing in helping job seekers build impressive portfolio projects.
 
 Your task is to design a project that:
 1. Can be completed by ONE person in 2-3 weeks
@@ -161,78 +102,467 @@ The roadmap must:
 - Make it clear what "done" looks like at each stage
 - Do NOT specify exact days or dates, just the sequence of milestones
 
-Output your response in this exact format:
+Respond with a JSON object with these fields:
+- title: Concise, professional project title
+- project_type: "research", "product", "campaign", "startup" or "marketing"
+- description: 2-3 paragraphs describing the project and its context. MUST emphasize real-world execution and tangible outcomes
+- why_relevant: Why this project is perfect for this role and domain
+- deliverables: The deliverables, each with name, description, format (specific format), real_world_outcome (what will actually be launched/published/executed) and evaluation_criteria (list). MUST include at least one deliverable that is live/public/real
+- roadmap: 4-6 milestones in order, each with milestone (name), tasks (what needs to be done) and expected_outcome (specific state or completion level). The final milestone is the launch/publication/completion with tangible proof
+- skills_demonstrated: List of skills demonstrated
+- recruiter_appeal: Why recruiters will be impressed by this project, emphasizing the real-world execution aspect
+- evaluation_criteria: List of criteria for evaluating project success
+- estimated_duration_weeks: Number of weeks, between 2.0 and 3.0
+- alternative_options: 3 alternatives considered, each as "Name: brief description"
+- reasoning: Why this project was selected over alternatives, and how it balances ambition with 2-3 week feasibility"""
+
+PROJECT_GENERATION_PREAMBLE = """Generate a project proposal for a job seeker with the profile described in the next message.
+
+Requirements:
+- Must be completable in 2-3 weeks by one person
+- Must produce tangible deliverables
+- Must demonstrate skills valuable for the target role
+- Must appeal to recruiters in this domain
+
+Generate a comprehensive project proposal following the specified format."""
 
-# PROJECT PROPOSAL
 
-## Title
-[Concise, professional project title]
+def _string_array() -> Dict[str, Any]:
+    """JSON schema for a list of strings."""
+
+    return {"type": "array", "items": {"type": "string"}}
+
+
+# Structured output schema enforced by OpenAI for project proposals
+PROJECT_PROPOSAL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "project_proposal",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "project_type": {
+                    "type": "string",
+                    "enum": ["research", "product", "campaign", "startup", "marketing"]
+                },
+                "description": {"type": "string"},
+                "why_relevant": {"type": "string"},
+                "deliverables": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "description": {"type": "string"},
+                            "format": {"type": "string"},
+                            "real_world_outcome": {"type": "string"},
+                            "evaluation_criteria": _string_array()
+                        },
+                        "required": ["name", "description", "format", "real_world_outcome", "evaluation_criteria"],
+                        "additionalProperties": False
+                    }
+                },
+                "roadmap": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "milestone": {"type": "string"},
+                            "tasks": {"type": "string"},
+                            "expected_outcome": {"type": "string"}
+                        },
+                        "required": ["milestone", "tasks", "expected_outcome"],
+                        "additionalProperties": False
+                    }
+                },
+                "skills_demonstrated": _string_array(),
+                "recruiter_appeal": {"type": "string"},
+                "evaluation_criteria": _string_array(),
+                "estimated_duration_weeks": {"type": "number"},
+                "alternative_options": _string_array(),
+                "reasoning": {"type": "string"}
+            },
+            "required": [
+                "title",
+                "project_type",
+                "description",
+                "why_relevant",
+                "deliverables",
+                "roadmap",
+                "skills_demonstrated",
+                "recruiter_appeal",
+                "evaluation_criteria",
+                "estimated_duration_weeks",
+                "alternative_options",
+                "reasoning"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+# "##" section headings (a "###" heading also ends the previous section), for
+# responses that came back as markdown instead of JSON
+_SECTION_HEADER_RE = re.compile(r'^[ \t]*##(?P<title>[^\n]*)$', re.MULTILINE)
+
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Markdown "## Type" values are matched on their first word, e.g. "RESEARCH"
+_PROJECT_TYPES = {project_type.name: project_type for project_type in ProjectType}
+_TYPE_WORD_RE = re.compile(r'[A-Z]+')
+
+# Semantic cache of generated proposals. A request for the same role and
+# domain whose background and interests embed close enough to a recent one
+# reuses that proposal instead of generating a new one. Needs the RAG
+# module's embedding model; requests that list rejected proposals always
+# generate.
+PROPOSAL_CACHE_MIN_SIMILARITY = float(os.getenv("PROPOSAL_CACHE_MIN_SIMILARITY", "0.92"))
+PROPOSAL_CACHE_MAX_SIZE = 256
+PROPOSAL_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Domain contexts kept per agent, keyed by (target_role, target_domain)
+DOMAIN_CONTEXT_CACHE_MAX_SIZE = 256
+
+
+_proposal_cache = SemanticCache(
+    PROPOSAL_CACHE_MAX_SIZE,
+    PROPOSAL_CACHE_TTL_SECONDS,
+    PROPOSAL_CACHE_MIN_SIMILARITY
+)
+
+
+class ProposalStreamParser:
+    """
+    Incremental parser for a streamed proposal JSON object.
 
-## Type
-[RESEARCH/PRODUCT/CAMPAIGN/STARTUP/MARKETING]
+    Feed response text as it streams in; each top-level field is returned
+    as soon as its value is complete, so callers can render the title and
+    description while the rest of the proposal is still generating.
+    """
 
-## Description
-[2-3 paragraphs describing the project and its context]
-[MUST emphasize real-world execution and tangible outcomes]
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """Add response text and return the top-level fields completed by it."""
+
+        self._text += chunk
+        completed: Dict[str, Any] = {}
+
+        for i in range(self._pos, len(self._text)):
+            char = self._text[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
 
-## Why Relevant
-[Explain why this project is perfect for this role and domain]
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = i + 1
+            elif char in '}]':
+                if self._depth == 1:
+                    completed.update(self._parse_member(i))
+                self._depth -= 1
+            elif char == ',' and self._depth == 1:
+                completed.update(self._parse_member(i))
+                self._member_start = i + 1
+
+        self._pos = len(self._text)
+        return completed
+
+    def _parse_member(self, end: int) -> Dict[str, Any]:
+        """Decode the `"key": value` member ending just before end."""
+
+        member = self._text[self._member_start:end].strip()
+        if not member:
+            return {}
 
-## Deliverables
-1. [Deliverable name]: [Description] - Format: [Specific format]
-   Real-world outcome: [What will actually be launched/published/executed]
-   Evaluation criteria: [criterion 1], [criterion 2], [criterion 3]
-2. [Continue for each deliverable]
-[MUST include at least one deliverable that is live/public/real]
+        try:
+            return json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return {}
 
-## Project Roadmap
-Milestone 1: [Milestone name]
-- Tasks: [What needs to be done]
-- Expected outcome: [Specific state or completion level]
 
-Milestone 2: [Milestone name]
-- Tasks: [What needs to be done]
-- Expected outcome: [Specific state or completion level]
+class ProjectGeneratorAgent(BaseAgent):
+    """
+    Generates project proposals tailored to target role and domain.
 
-Milestone 3: [Milestone name]
-- Tasks: [What needs to be done]
-- Expected outcome: [Specific state or completion level]
+    Responsibilities:
+    - Analyze target role and domain
+    - Design 2-3 week projects
+    - Define deliverables and evaluation criteria
+    - Ensure recruiter appeal
+    """
 
-Milestone 4: [Milestone name]
-- Tasks: [What needs to be done]
-- Expected outcome: [Specific state or completion level]
+    def __init__(self, **kwargs):
+        super().__init__(agent_name="ProjectGenerator", **kwargs)
+        self._domain_context_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._domain_context_lock = threading.Lock()
 
-[Continue for 4-6 milestones total]
+    def process(self, input_data: ProjectGeneratorInput) -> ProjectGeneratorOutput:
+        """
+        Generate a project proposal.
 
-Final Milestone: [Launch/Publication/Completion]
-- Tasks: [Final steps]
-- Expected outcome: [Live/Published/Launched with tangible proof]
+        Args:
+            input_data: ProjectGeneratorInput with role, domain, background
 
-## Skills Demonstrated
-- [Skill 1]
-- [Skill 2]
-- [Continue]
+        Returns:
+            ProjectGeneratorOutput with proposal
+        """
+
+        try:
+            # Reuse a proposal generated for a near-identical profile
+            cache_embedding = self._proposal_cache_embedding(input_data)
+            response = self._cached_response(input_data, cache_embedding)
+
+            if response is None:
+                response = self._generate_response(input_data)
+                self._cache_response(input_data, cache_embedding, response)
 
-## Recruiter Appeal
-[Why recruiters will be impressed by this project]
-[Emphasize the real-world execution aspect]
+            return self._proposal_output(response, input_data)
 
-## Evaluation Criteria
-1. [Criterion 1]
-2. [Criterion 2]
-3. [Continue]
+        except Exception as e:
+            return self._error_output(input_data, e)
 
-## Estimated Duration
-[2.0-3.0 weeks]
+    async def aprocess(self, input_data: ProjectGeneratorInput) -> ProjectGeneratorOutput:
+        """
+        Async variant of process.
 
-## Alternative Options Considered
-1. [Alternative 1]: [Brief description]
-2. [Alternative 2]: [Brief description]
-3. [Alternative 3]: [Brief description]
+        Uses the non-blocking OpenAI client; RAG retrieval and embedding run
+        in a worker thread so the event loop is not blocked.
 
-## Reasoning
-[Why this project was selected over alternatives]
-[Explain how it balances ambition with 2-3 week feasibility]"""
+        Args:
+            input_data: ProjectGeneratorInput with role, domain, background
+
+        Returns:
+            ProjectGeneratorOutput with proposal
+        """
+
+        try:
+            cache_embedding = await asyncio.to_thread(self._proposal_cache_embedding, input_data)
+            response = self._cached_response(input_data, cache_embedding)
+
+            if response is None:
+                request = await asyncio.to_thread(self._generation_request, input_data)
+                response = await self.acall_llm(**request)
+                self._cache_response(input_data, cache_embedding, response)
+
+            return self._proposal_output(response, input_data)
+
+        except Exception as e:
+            return self._error_output(input_data, e)
+
+    async def aprocess_many(self, input_list: List[ProjectGeneratorInput]) -> List[ProjectGeneratorOutput]:
+        """
+        Generate several proposals concurrently.
+
+        Each proposal is still its own LLM request (sharing the cached
+        prompt prefix); they are issued together instead of one after another.
+
+        Args:
+            input_list: ProjectGeneratorInputs to process
+
+        Returns:
+            ProjectGeneratorOutputs in the same order as input_list
+        """
+
+        return list(await asyncio.gather(*(self.aprocess(input_data) for input_data in input_list)))
+
+    def stream_proposal(self, input_data: ProjectGeneratorInput) -> Iterator[ProjectGeneratorOutput]:
+        """
+        Generate a project proposal, streaming fields as they are generated.
+
+        Yields a partial output (metadata["partial"] is True) each time
+        top-level proposal fields complete, with the fields so far in
+        metadata["fields"], then the full output once the response ends.
+
+        Args:
+            input_data: ProjectGeneratorInput with role, domain, background
+
+        Yields:
+            ProjectGeneratorOutput snapshots of the proposal
+        """
+
+        try:
+            cache_embedding = self._proposal_cache_embedding(input_data)
+            response = self._cached_response(input_data, cache_embedding)
+
+            if response is None:
+                parser = ProposalStreamParser()
+                chunks = []
+                fields: Dict[str, Any] = {}
+
+                for chunk in self.call_llm_stream(**self._generation_request(input_data)):
+                    chunks.append(chunk)
+                    completed = parser.feed(chunk)
+                    if completed:
+                        fields.update(completed)
+                        yield ProjectGeneratorOutput(
+                            request_id=input_data.request_id,
+                            success=True,
+                            reasoning=fields.get("reasoning", ""),
+                            metadata={"partial": True, "fields": dict(fields)}
+                        )
+
+                response = "".join(chunks)
+                self._cache_response(input_data, cache_embedding, response)
+
+            yield self._proposal_output(response, input_data)
+
+        except Exception as e:
+            yield self._error_output(input_data, e)
+
+    def _proposal_output(self, response: str, input_data: ProjectGeneratorInput) -> ProjectGeneratorOutput:
+        """Parse a proposal response into a ProjectGeneratorOutput."""
+
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            # Fall back to the markdown format
+            sections = self._parse_sections(response)
+
+            return ProjectGeneratorOutput(
+                request_id=input_data.request_id,
+                success=True,
+                proposal=self._parse_response(sections, input_data),
+                reasoning=self._extract_reasoning(sections),
+                alternative_options=self._extract_alternatives(sections)
+            )
+
+        return ProjectGeneratorOutput(
+            request_id=input_data.request_id,
+            success=True,
+            proposal=self._parse_proposal_json(data),
+            reasoning=data.get("reasoning", ""),
+            alternative_options=data.get("alternative_options", [])
+        )
+
+    def _error_output(self, input_data: ProjectGeneratorInput, error: Exception) -> ProjectGeneratorOutput:
+        """Build the error envelope returned when generation fails."""
+
+        return ProjectGeneratorOutput(
+            request_id=input_data.request_id,
+            success=False,
+            reasoning="",
+            message=f"Failed to generate project: {str(error)}"
+        )
+
+    def _cached_response(
+        self,
+        input_data: ProjectGeneratorInput,
+        cache_embedding: Optional[np.ndarray]
+    ) -> Optional[str]:
+        """Get a proposal cached for the same role and domain and a near-identical profile."""
+
+        if cache_embedding is None:
+            return None
+
+        key = (input_data.target_role.casefold(), input_data.target_domain.casefold())
+        cached = _proposal_cache.get(cache_embedding, match=lambda entry: entry[0] == key)
+        if not cached:
+            return None
+
+        self._log_llm_call(self.model, cache_hit=True)
+        return cached[1]
+
+    def _cache_response(
+        self,
+        input_data: ProjectGeneratorInput,
+        cache_embedding: Optional[np.ndarray],
+        response: str
+    ) -> None:
+        """Store a generated proposal in the proposal cache."""
+
+        if cache_embedding is not None:
+            key = (input_data.target_role.casefold(), input_data.target_domain.casefold())
+            _proposal_cache.put(cache_embedding, (key, response))
+
+    def _generate_response(self, input_data: ProjectGeneratorInput) -> str:
+        """Generate a proposal response with the LLM."""
+
+        return self.call_claude(**self._generation_request(input_data))
+
+    def _generation_request(self, input_data: ProjectGeneratorInput) -> Dict[str, Any]:
+        """Build the call_llm arguments for a proposal."""
+
+        domain_context = self._cached_domain_context(input_data)
+
+        # Build system prompt
+        system_prompt = self._build_system_prompt()
+
+        # Build user prompt
+        user_prompt = self._build_user_prompt(input_data, domain_context)
+
+        return {
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "temperature": 0.8,  # Higher for creativity
+            "user_preamble": PROJECT_GENERATION_PREAMBLE,
+            "prompt_cache_key": self.agent_name,
+            "response_format": PROJECT_PROPOSAL_RESPONSE_FORMAT
+        }
+
+    def _cached_domain_context(self, input_data: ProjectGeneratorInput) -> str:
+        """Get the RAG domain context, reusing it across regenerations."""
+
+        if not self.rag_module:
+            return ""
+
+        key = (input_data.target_role, input_data.target_domain)
+        with self._domain_context_lock:
+            domain_context = self._domain_context_cache.get(key)
+            if domain_context is not None:
+                self._domain_context_cache.move_to_end(key)
+                return domain_context
+
+        domain_query = f"project ideas and best practices for {input_data.target_role} in {input_data.target_domain}"
+        domain_context = self.get_domain_context(
+            input_data.target_domain,
+            domain_query
+        )
+
+        with self._domain_context_lock:
+            self._domain_context_cache[key] = domain_context
+            self._domain_context_cache.move_to_end(key)
+            if len(self._domain_context_cache) > DOMAIN_CONTEXT_CACHE_MAX_SIZE:
+                self._domain_context_cache.popitem(last=False)
+
+        return domain_context
+
+    def _proposal_cache_embedding(self, input_data: ProjectGeneratorInput) -> Optional[np.ndarray]:
+        """Embed the request profile for the proposal cache, or None if it can't be cached."""
+
+        if not self.rag_module or input_data.previous_proposals:
+            return None
+
+        profile = " | ".join([
+            input_data.target_role,
+            input_data.target_domain,
+            input_data.background or "",
+            input_data.interests or "",
+        ])
+
+        return self.rag_module.embedding_model.encode(profile, normalize_embeddings=True)
+
+    def _build_system_prompt(self) -> str:
+        """Build system prompt for project generation."""
+
+        return PROJECT_GENERATION_SYSTEM_PROMPT
 
     def _build_user_prompt(
         self,
@@ -241,64 +571,88 @@ Final Milestone: [Launch/Publication/Completion]
     ) -> str:
         """Build user prompt with specific requirements."""
 
-        prompt = f"""Generate a project proposal for a job seeker with the following profile:
+        # Variable fields only; the static preamble is sent first. Fields that
+        # depend only on role and domain (including the RAG context) come
+        # before per-user fields, so requests for the same role and domain
+        # share a longer cacheable prefix.
+        parts = [
+            f"Target Role: {input_data.target_role}\n",
+            f"Target Domain: {input_data.target_domain}\n"
+        ]
 
-Target Role: {input_data.target_role}
-Target Domain: {input_data.target_domain}
-"""
+        if domain_context:
+            parts.append(f"\n{domain_context}\n\n")
 
         if input_data.background:
-            prompt += f"Background: {input_data.background}\n"
+            parts.append(f"Background: {input_data.background}\n")
 
         if input_data.interests:
-            prompt += f"Interests: {input_data.interests}\n"
+            parts.append(f"Interests: {input_data.interests}\n")
 
         if input_data.previous_proposals:
-            prompt += f"\nAvoid projects similar to these previously rejected proposals: {', '.join(input_data.previous_proposals)}\n"
+            parts.append(f"\nAvoid projects similar to these previously rejected proposals: {', '.join(input_data.previous_proposals)}\n")
 
-        if domain_context:
-            prompt += f"\n{domain_context}\n"
+        return "".join(parts)
 
-        prompt += """
-Requirements:
-- Must be completable in 2-3 weeks by one person
-- Must produce tangible deliverables
-- Must demonstrate skills valuable for the target role
-- Must appeal to recruiters in this domain
+    def _parse_proposal_json(self, data: Dict[str, Any]) -> ProjectProposal:
+        """Build a ProjectProposal from a JSON proposal response."""
 
-Generate a comprehensive project proposal following the specified format."""
+        try:
+            project_type = ProjectType(data.get("project_type"))
+        except ValueError:
+            project_type = ProjectType.PRODUCT  # Default
+
+        deliverables = [
+            DeliverableType(
+                name=item["name"],
+                description=(
+                    f"{item['description']} Real-world outcome: {item['real_world_outcome']}"
+                    if item.get("real_world_outcome") else item["description"]
+                ),
+                format=item.get("format") or "Document",
+                evaluation_criteria=item.get("evaluation_criteria", [])
+            )
+            for item in data.get("deliverables", [])
+        ] or [self._default_deliverable()]
 
-        return prompt
+        try:
+            duration = max(2.0, min(3.0, float(data.get("estimated_duration_weeks"))))
+        except (TypeError, ValueError):
+            duration = 2.5  # Default
+
+        return ProjectProposal(
+            title=data.get("title", "").strip(),
+            project_type=project_type,
+            description=data.get("description", "").strip(),
+            why_relevant=data.get("why_relevant", "").strip(),
+            deliverables=deliverables,
+            estimated_duration_weeks=duration,
+            skills_demonstrated=data.get("skills_demonstrated", []),
+            recruiter_appeal=data.get("recruiter_appeal", "").strip(),
+            evaluation_criteria=data.get("evaluation_criteria", [])
+        )
 
     def _parse_response(
         self,
-        response: str,
+        sections: Dict[str, str],
         input_data: ProjectGeneratorInput
     ) -> ProjectProposal:
-        """Parse Claude's response into a ProjectProposal."""
-
-        # Simple parsing logic - in production, use more robust parsing
-        lines = response.split('\n')
+        """Parse Claude's response sections into a ProjectProposal."""
 
         # Extract sections
-        title = self._extract_section(lines, "## Title")
-        project_type_str = self._extract_section(lines, "## Type").strip().upper()
-        description = self._extract_section(lines, "## Description")
-        why_relevant = self._extract_section(lines, "## Why Relevant")
-        deliverables_text = self._extract_section(lines, "## Deliverables")
-        skills_text = self._extract_section(lines, "## Skills Demonstrated")
-        recruiter_appeal = self._extract_section(lines, "## Recruiter Appeal")
-        criteria_text = self._extract_section(lines, "## Evaluation Criteria")
-        duration_text = self._extract_section(lines, "## Estimated Duration")
+        title = self._extract_section(sections, "Title")
+        project_type_str = self._extract_section(sections, "Type").upper()
+        description = self._extract_section(sections, "Description")
+        why_relevant = self._extract_section(sections, "Why Relevant")
+        deliverables_text = self._extract_section(sections, "Deliverables")
+        skills_text = self._extract_section(sections, "Skills Demonstrated")
+        recruiter_appeal = self._extract_section(sections, "Recruiter Appeal")
+        criteria_text = self._extract_section(sections, "Evaluation Criteria")
+        duration_text = self._extract_section(sections, "Estimated Duration")
 
         # Parse project type
-        project_type = ProjectType.PRODUCT  # Default
-        if "RESEARCH" in project_type_str:
-            project_type = ProjectType.RESEARCH
-        elif "CAMPAIGN" in project_type_str:
-            project_type = ProjectType.CAMPAIGN
-        elif "STARTUP" in project_type_str:
-            project_type = ProjectType.STARTUP
+        type_word = _TYPE_WORD_RE.search(project_type_str)
+        project_type = _PROJECT_TYPES.get(type_word.group() if type_word else "", ProjectType.PRODUCT)
 
         # Parse deliverables
         deliverables = self._parse_deliverables(deliverables_text)
@@ -309,13 +663,9 @@ Generate a comprehensive project proposal following the specified format."""
         # Parse evaluation criteria
         evaluation_criteria = self._parse_list(criteria_text)
 
-        # Parse duration
-        duration = 2.5  # Default
-        try:
-            duration_num = float(''.join(filter(lambda x: x.isdigit() or x == '.', duration_text)))
-            duration = max(2.0, min(3.0, duration_num))
-        except:
-            pass
+        # Parse duration (first number, e.g. "2.5-3.0 weeks" -> 2.5)
+        duration_match = _NUMBER_RE.search(duration_text)
+        duration = max(2.0, min(3.0, float(duration_match.group()))) if duration_match else 2.5
 
         return ProjectProposal(
             title=title.strip(),
@@ -329,22 +679,31 @@ Generate a comprehensive project proposal following the specified format."""
             evaluation_criteria=evaluation_criteria
         )
 
-    def _extract_section(self, lines: List[str], header: str) -> str:
-        """Extract content of a section from markdown."""
+    def _parse_sections(self, response: str) -> Dict[str, str]:
+        """
+        Split a markdown response into "##" sections in a single scan.
 
-        content = []
-        in_section = False
+        Maps each heading (without the leading ##) to the stripped text up
+        to the next heading. Only the first occurrence of a heading is kept.
+        """
 
-        for line in lines:
-            if line.strip().startswith(header):
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith("##"):
-                break
-            elif in_section:
-                content.append(line)
+        sections = {}
+        headers = list(_SECTION_HEADER_RE.finditer(response))
+
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(response)
+            sections.setdefault(header.group("title").strip(), response[header.end():end].strip())
+
+        return sections
 
-        return '\n'.join(content).strip()
+    def _extract_section(self, sections: Dict[str, str], title: str) -> str:
+        """Get the body of the first section whose heading starts with title."""
+
+        for heading, body in sections.items():
+            if heading.startswith(title):
+                return body
+
+        return ""
 
     def _parse_deliverables(self, text: str) -> List[DeliverableType]:
         """Parse deliverables from text."""
@@ -393,15 +752,20 @@ Generate a comprehensive project proposal following the specified format."""
 
         # Ensure at least one deliverable
         if not deliverables:
-            deliverables.append(DeliverableType(
-                name="Final Report",
-                description="Comprehensive project documentation",
-                format="PDF document",
-                evaluation_criteria=["Clarity", "Depth", "Professionalism"]
-            ))
+            deliverables.append(self._default_deliverable())
 
         return deliverables
 
+    def _default_deliverable(self) -> DeliverableType:
+        """Deliverable used when a response lists none."""
+
+        return DeliverableType(
+            name="Final Report",
+            description="Comprehensive project documentation",
+            format="PDF document",
+            evaluation_criteria=["Clarity", "Depth", "Professionalism"]
+        )
+
     def _parse_list(self, text: str) -> List[str]:
         """Parse a bulleted or numbered list."""
 
@@ -423,15 +787,13 @@ Generate a comprehensive project proposal following the specified format."""
 
         return items
 
-    def _extract_reasoning(self, response: str) -> str:
-        """Extract reasoning from response."""
+    def _extract_reasoning(self, sections: Dict[str, str]) -> str:
+        """Extract reasoning from response sections."""
 
-        lines = response.split('\n')
-        return self._extract_section(lines, "## Reasoning")
+        return self._extract_section(sections, "Reasoning")
 
-    def _extract_alternatives(self, response: str) -> List[str]:
-        """Extract alternative options from response."""
+    def _extract_alternatives(self, sections: Dict[str, str]) -> List[str]:
+        """Extract alternative options from response sections."""
 
-        lines = response.split('\n')
-        alternatives_text = self._extract_section(lines, "## Alternative Options Considered")
+        alternatives_text = self._extract_section(sections, "Alternative Options Considered")
         return self._parse_list(alternatives_text)
@@ -4,134 +4,28 @@ Reviewer & Resume Agent.
 Objectively evaluates final artifacts and generates resume content grounded in actual work.
 """
 
+import re
 import uuid
-from typing import List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from .base import BaseAgent
 from ..schemas.agent_io import ReviewerInput, ReviewerOutput, ArtifactSubmission
 from ..schemas.review import ArtifactReview, ResumeBullet
 from ..schemas.project import ProjectProposal
 
 
-class ReviewerAgent(BaseAgent):
-    """
-    Reviews final artifacts and generates resume content.
-
-    Responsibilities:
-    - Objectively evaluate artifacts against criteria
-    - Generate resume bullets grounded in actual work
-    - Provide constructive feedback
-    - No grade inflation - honest assessment
-    """
-
-    def __init__(self, **kwargs):
-        super().__init__(agent_name="Reviewer", **kwargs)
-
-    def process(self, input_data: ReviewerInput) -> ReviewerOutput:
-        """
-        Process review request.
-
-        Args:
-            input_data: ReviewerInput
-
-        Returns:
-            ReviewerOutput with review or resume content
-        """
-
-        try:
-            if input_data.action == "review_artifacts":
-                return self._review_artifacts(input_data)
-            elif input_data.action == "generate_resume":
-                return self._generate_resume(input_data)
-            else:
-                raise ValueError(f"Invalid action: {input_data.action}")
-
-        except Exception as e:
-            return ReviewerOutput(
-                request_id=input_data.request_id,
-                success=False,
-                action=input_data.action,
-                next_steps=f"An error occurred: {str(e)}"
-            )
-
-    def _review_artifacts(self, input_data: ReviewerInput) -> ReviewerOutput:
-        """Review submitted artifacts."""
-
-        if not input_data.submitted_artifacts:
-            raise ValueError("No artifacts submitted for review")
+# First number in a score value ("8", "7.5", "7/10")
+_SCORE_RE = re.compile(r'\d+(?:\.\d+)?')
 
-        proposal = input_data.project_proposal
-
-        # Build system prompt
-        system_prompt = self._build_review_prompt()
-
-        # Build user prompt
-        user_prompt = self._build_review_user_prompt(input_data, proposal)
-
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.3  # Lower for objective evaluation
-        )
-
-        # Parse review
-        review = self._parse_review(response, input_data)
-
-        next_steps = self._extract_next_steps(response)
-
-        return ReviewerOutput(
-            request_id=input_data.request_id,
-            success=True,
-            action="review_artifacts",
-            review=review,
-            next_steps=next_steps
-        )
-
-    def _generate_resume(self, input_data: ReviewerInput) -> ReviewerOutput:
-        """Generate resume content from completed work."""
-
-        if not input_data.artifact_review:
-            raise ValueError("Artifact review is required for resume generation")
-
-        # Build system prompt
-        system_prompt = self._build_resume_prompt()
-
-        # Build user prompt
-        user_prompt = self._build_resume_user_prompt(input_data)
-
-        # Call Claude
-        response = self.call_claude(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.5
-        )
-
-        # Parse resume content
-        resume_bullets = self._parse_resume_bullets(response, input_data)
-        project_title = self._extract_project_title(response)
-        project_one_liner = self._extract_project_one_liner(response)
-        project_description = self._extract_project_description(response)
-        suggested_skills = self._extract_suggested_skills(response)
-        talking_points = self._extract_talking_points(response)
-        next_steps = self._extract_next_steps(response)
-
-        return ReviewerOutput(
-            request_id=input_data.request_id,
-            success=True,
-            action="generate_resume",
-            resume_bullets=resume_bullets,
-            project_title=project_title,
-            project_one_liner=project_one_liner,
-            project_description=project_description,
-            suggested_skills=suggested_skills,
-            interview_talking_points=talking_points,
-            next_steps=next_steps
-        )
+# List item ("- item", "* item", "1. item") on a stripped line
+_LIST_ITEM_RE = re.compile(r'(?:[-*]|\d+\.)\s+(.*)')
 
-    def _build_review_prompt(self) -> str:
-        """Build system prompt for artifact review."""
+# "### Bullet N" headings and their "Field: value" lines in the Resume Bullets section
+_BULLET_HEADING_RE = re.compile(r'^###[ \t]*Bullet\b.*$', re.MULTILINE)
+_BULLET_FIELD_RE = re.compile(r'^(Text|Skills|Evidence|Type):(.*)$', re.MULTILINE)
 
-        return """You are an objective evaluator reviewing project artifacts.
+# System prompts are module-level constants so the request prefix is
+# byte-identical across calls and eligible for prompt caching.
+REVIEW_SYSTEM_PROMPT = """You are an objective evaluator reviewing project artifacts.
 
 Your goals:
 1. Provide honest, constructive evaluation
@@ -191,10 +85,7 @@ Output format:
 
 Be honest, specific, and constructive."""
 
-    def _build_resume_prompt(self) -> str:
-        """Build system prompt for resume generation."""
-
-        return """You are a resume writer creating content grounded in actual completed work.
+RESUME_SYSTEM_PROMPT = """You are a resume writer creating content grounded in actual completed work.
 
 Critical rules:
 1. ONLY include claims supported by actual deliverables
@@ -250,98 +141,432 @@ Type: [research/analysis/design/execution]
 
 Be honest - only include what can be backed up by the actual work."""
 
+
+class SectionStreamParser:
+    """
+    Incremental section parser for review and resume responses.
+
+    Feed response text as it streams in; each section is complete once the
+    next "#" or "##" heading arrives. Only newly completed lines are
+    scanned, so chunk boundaries may fall anywhere and total work stays
+    linear in the response length.
+
+    sections maps each heading (upper-cased, without the leading #'s) to its
+    non-blank, stripped lines; completed holds only the finished sections.
+    Deeper headings ("### Bullet 1") stay inside their section as lines.
+    """
+
+    def __init__(self):
+        self.sections: Dict[str, List[str]] = {}
+        self.completed: Dict[str, List[str]] = {}
+
+        self._buffer = ""
+        self._current: Optional[str] = None
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add response text and return the titles of sections completed by it."""
+
+        self._buffer += chunk
+        cut = self._buffer.rfind('\n')
+        if cut < 0:
+            return []
+
+        text, self._buffer = self._buffer[:cut + 1], self._buffer[cut + 1:]
+        return self._scan(text)
+
+    def close(self) -> List[str]:
+        """Flush remaining text and return the titles of the final section(s)."""
+
+        completed = self._scan(self._buffer)
+        self._buffer = ""
+
+        if self._current is not None:
+            completed.append(self._complete(self._current))
+            self._current = None
+
+        return completed
+
+    def _scan(self, text: str) -> List[str]:
+        """Apply the heading and content lines found in text."""
+
+        completed = []
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith('#') and not stripped.startswith('###'):
+                # Previous section is complete once the next heading arrives
+                if self._current is not None:
+                    completed.append(self._complete(self._current))
+                self._current = stripped.lstrip('#').strip().upper()
+                self.sections.setdefault(self._current, [])
+            elif stripped and self._current is not None:
+                self.sections[self._current].append(stripped)
+
+        return completed
+
+    def _complete(self, title: str) -> str:
+        """Mark a section as complete."""
+
+        self.completed[title] = self.sections[title]
+        return title
+
+
+class ReviewerAgent(BaseAgent):
+    """
+    Reviews final artifacts and generates resume content.
+
+    Responsibilities:
+    - Objectively evaluate artifacts against criteria
+    - Generate resume bullets grounded in actual work
+    - Provide constructive feedback
+    - No grade inflation - honest assessment
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(agent_name="Reviewer", **kwargs)
+        # Each action maps to (request builder, output parser); every entry
+        # point dispatches through this table
+        self._actions = {
+            "review_artifacts": (self._review_request, self._review_output),
+            "generate_resume": (self._resume_request, self._resume_output),
+        }
+
+    def process(self, input_data: ReviewerInput) -> ReviewerOutput:
+        """
+        Process review request.
+
+        Args:
+            input_data: ReviewerInput
+
+        Returns:
+            ReviewerOutput with review or resume content
+        """
+
+        try:
+            request_builder, output_parser = self._action(input_data)
+            response = self.call_claude(**request_builder(input_data))
+            return output_parser(response, input_data)
+        except Exception as e:
+            return self._error_output(input_data, e)
+
+    async def aprocess(self, input_data: ReviewerInput) -> ReviewerOutput:
+        """
+        Async variant of process.
+
+        Uses the non-blocking OpenAI client so reviews for several users (or
+        a review alongside other agents' work) can run concurrently, e.g.
+        with asyncio.gather.
+
+        Args:
+            input_data: ReviewerInput
+
+        Returns:
+            ReviewerOutput with review or resume content
+        """
+
+        try:
+            request_builder, output_parser = self._action(input_data)
+            response = await self.acall_llm(**request_builder(input_data))
+            return output_parser(response, input_data)
+        except Exception as e:
+            return self._error_output(input_data, e)
+
+    def process_many(self, input_list: List[ReviewerInput]) -> List[ReviewerOutput]:
+        """
+        Run several review or resume requests in one OpenAI Batch API job.
+
+        Meant for non-interactive work such as regenerating resumes or
+        re-reviewing a cohort, where results are not needed right away;
+        batch jobs are cheaper but can take hours.
+
+        Args:
+            input_list: ReviewerInputs to process
+
+        Returns:
+            ReviewerOutputs in the same order as input_list
+        """
+
+        return self._process_batched(
+            input_list,
+            lambda input_data: self._action(input_data)[0](input_data),
+            lambda response, input_data: self._action(input_data)[1](response, input_data)
+        )
+
+    def _action(self, input_data: ReviewerInput) -> Tuple[Callable, Callable]:
+        """Look up the (request builder, output parser) pair for an action."""
+
+        try:
+            return self._actions[input_data.action]
+        except KeyError:
+            raise ValueError(f"Invalid action: {input_data.action}") from None
+
+    def _error_output(self, input_data: ReviewerInput, error: Exception) -> ReviewerOutput:
+        """Build the error envelope returned when a review request fails."""
+
+        return ReviewerOutput(
+            request_id=input_data.request_id,
+            success=False,
+            action=input_data.action,
+            next_steps=f"An error occurred: {str(error)}"
+        )
+
+    def stream_review(self, input_data: ReviewerInput) -> Iterator[ReviewerOutput]:
+        """
+        Review submitted artifacts, streaming the review as it is generated.
+
+        Yields a partial output (metadata["partial"] is True) each time a
+        review section completes, then the full output once the response
+        ends. The review ID is stable between partial and final outputs.
+
+        Args:
+            input_data: ReviewerInput with action "review_artifacts"
+
+        Yields:
+            ReviewerOutput snapshots of the review
+        """
+
+        try:
+            request = self._review_request(input_data)
+            review_id = f"rev_{uuid.uuid4().hex[:8]}"
+            parser = SectionStreamParser()
+            chunks = []
+
+            for chunk in self.call_llm_stream(**request):
+                chunks.append(chunk)
+                if parser.feed(chunk):
+                    yield ReviewerOutput(
+                        request_id=input_data.request_id,
+                        success=True,
+                        action="review_artifacts",
+                        review=self._parse_review(parser.completed, input_data, review_id),
+                        next_steps="Reviewing your work...",
+                        metadata={"partial": True, "completed_sections": list(parser.completed)}
+                    )
+
+            yield self._review_output("".join(chunks), input_data, review_id)
+
+        except Exception as e:
+            yield self._error_output(input_data, e)
+
+    def _review_request(self, input_data: ReviewerInput) -> Dict[str, Any]:
+        """Build the LLM request for an artifact review."""
+
+        if not input_data.submitted_artifacts:
+            raise ValueError("No artifacts submitted for review")
+
+        proposal = input_data.project_proposal
+
+        return {
+            "system_prompt": self._build_review_prompt(),
+            "user_prompt": self._build_review_user_prompt(input_data, proposal),
+            "temperature": 0.3,  # Lower for objective evaluation
+            "prompt_cache_key": f"{self.agent_name}:review"
+        }
+
+    def _review_output(
+        self,
+        response: str,
+        input_data: ReviewerInput,
+        review_id: Optional[str] = None
+    ) -> ReviewerOutput:
+        """Parse an artifact review response into a ReviewerOutput."""
+
+        # Parse review
+        sections = self._parse_sections(response)
+        review = self._parse_review(sections, input_data, review_id)
+
+        next_steps = self._extract_next_steps(sections)
+
+        return ReviewerOutput(
+            request_id=input_data.request_id,
+            success=True,
+            action="review_artifacts",
+            review=review,
+            next_steps=next_steps
+        )
+
+    def _resume_request(self, input_data: ReviewerInput) -> Dict[str, Any]:
+        """Build the LLM request for resume generation."""
+
+        if not input_data.artifact_review:
+            raise ValueError("Artifact review is required for resume generation")
+
+        return {
+            "system_prompt": self._build_resume_prompt(),
+            "user_prompt": self._build_resume_user_prompt(input_data),
+            "temperature": 0.5,
+            "prompt_cache_key": f"{self.agent_name}:resume"
+        }
+
+    def _resume_output(self, response: str, input_data: ReviewerInput) -> ReviewerOutput:
+        """Parse a resume generation response into a ReviewerOutput."""
+
+        # Parse resume content
+        sections = self._parse_sections(response)
+        resume_bullets = self._parse_resume_bullets(sections, input_data)
+        project_title = self._extract_project_title(sections)
+        project_one_liner = self._extract_project_one_liner(sections)
+        project_description = self._extract_project_description(sections)
+        suggested_skills = self._extract_suggested_skills(sections)
+        talking_points = self._extract_talking_points(sections)
+        next_steps = self._extract_next_steps(sections)
+
+        return ReviewerOutput(
+            request_id=input_data.request_id,
+            success=True,
+            action="generate_resume",
+            resume_bullets=resume_bullets,
+            project_title=project_title,
+            project_one_liner=project_one_liner,
+            project_description=project_description,
+            suggested_skills=suggested_skills,
+            interview_talking_points=talking_points,
+            next_steps=next_steps
+        )
+
+    def _build_review_prompt(self) -> str:
+        """Build system prompt for artifact review."""
+
+        return REVIEW_SYSTEM_PROMPT
+
+    def _build_resume_prompt(self) -> str:
+        """Build system prompt for resume generation."""
+
+        return RESUME_SYSTEM_PROMPT
+
     def _build_review_user_prompt(self, input_data: ReviewerInput, proposal) -> str:
         """Build user prompt for artifact review."""
 
-        prompt = "Review these submitted artifacts:\n\n"
+        parts = ["Review these submitted artifacts:\n\n"]
 
         # Add artifacts
-        prompt += "## SUBMITTED ARTIFACTS\n\n"
+        parts.append("## SUBMITTED ARTIFACTS\n\n")
         for i, artifact in enumerate(input_data.submitted_artifacts, 1):
-            prompt += f"### Artifact {i}: {artifact.artifact_type}\n"
-            prompt += f"Description: {artifact.artifact_description}\n"
+            parts.append(f"### Artifact {i}: {artifact.artifact_type}\n")
+            parts.append(f"Description: {artifact.artifact_description}\n")
             if artifact.artifact_url:
-                prompt += f"URL: {artifact.artifact_url}\n"
+                parts.append(f"URL: {artifact.artifact_url}\n")
             if artifact.file_name:
-                prompt += f"File: {artifact.file_name}\n"
-            prompt += "\n"
+                parts.append(f"File: {artifact.file_name}\n")
+            parts.append("\n")
 
         # Add evaluation criteria
         if proposal:
-            prompt += "\n## EVALUATION CRITERIA\n\n"
+            parts.append("\n## EVALUATION CRITERIA\n\n")
             if hasattr(proposal, 'evaluation_criteria'):
                 for i, criterion in enumerate(proposal.evaluation_criteria, 1):
-                    prompt += f"{i}. {criterion}\n"
+                    parts.append(f"{i}. {criterion}\n")
 
         # Add project context
         if input_data.problem_definition:
-            prompt += f"\n## PROJECT CONTEXT\n\n"
-            prompt += f"Problem: {input_data.problem_definition.problem_statement}\n"
+            parts.append("\n## PROJECT CONTEXT\n\n")
+            parts.append(f"Problem: {input_data.problem_definition.problem_statement}\n")
 
         if input_data.solution_design:
-            prompt += f"\nSolution Approach: {input_data.solution_design.solution_approach}\n"
+            parts.append(f"\nSolution Approach: {input_data.solution_design.solution_approach}\n")
 
-        prompt += "\n\nProvide a thorough, honest evaluation following the specified format."
+        parts.append("\n\nProvide a thorough, honest evaluation following the specified format.")
 
-        return prompt
+        return "".join(parts)
 
     def _build_resume_user_prompt(self, input_data: ReviewerInput) -> str:
         """Build user prompt for resume generation."""
 
-        prompt = "Generate resume content based on this completed project:\n\n"
+        parts = ["Generate resume content based on this completed project:\n\n"]
 
         # Add problem
         if input_data.problem_definition:
             problem = input_data.problem_definition
-            prompt += f"## PROBLEM ADDRESSED\n\n"
-            prompt += f"{problem.problem_statement}\n\n"
-            prompt += f"Target Audience: {problem.target_audience}\n\n"
+            parts.append("## PROBLEM ADDRESSED\n\n")
+            parts.append(f"{problem.problem_statement}\n\n")
+            parts.append(f"Target Audience: {problem.target_audience}\n\n")
 
         # Add solution
         if input_data.solution_design:
             solution = input_data.solution_design
-            prompt += f"## SOLUTION IMPLEMENTED\n\n"
-            prompt += f"Approach: {solution.solution_approach}\n\n"
-            prompt += f"Key Components:\n"
-            for comp in solution.key_components:
-                prompt += f"- {comp}\n"
-            prompt += f"\nMethodology: {solution.methodology}\n\n"
+            parts.append("## SOLUTION IMPLEMENTED\n\n")
+            parts.append(f"Approach: {solution.solution_approach}\n\n")
+            parts.append("Key Components:\n")
+            parts.extend(f"- {comp}\n" for comp in solution.key_components)
+            parts.append(f"\nMethodology: {solution.methodology}\n\n")
 
         # Add milestones completed
         if input_data.completed_milestones:
-            prompt += f"## WORK COMPLETED\n\n"
-            for milestone in input_data.completed_milestones:
-                prompt += f"- {milestone.title}: {milestone.deliverable}\n"
-            prompt += "\n"
+            parts.append("## WORK COMPLETED\n\n")
+            parts.extend(f"- {milestone.title}: {milestone.deliverable}\n" for milestone in input_data.completed_milestones)
+            parts.append("\n")
 
         # Add review
         if input_data.artifact_review:
             review = input_data.artifact_review
-            prompt += f"## ARTIFACT REVIEW\n\n"
-            prompt += f"Overall Score: {review.overall_score}/10\n\n"
-            prompt += f"Skills Demonstrated:\n"
-            for skill in review.skills_demonstrated:
-                prompt += f"- {skill}\n"
-            prompt += "\n"
+            parts.append("## ARTIFACT REVIEW\n\n")
+            parts.append(f"Overall Score: {review.overall_score}/10\n\n")
+            parts.append("Skills Demonstrated:\n")
+            parts.extend(f"- {skill}\n" for skill in review.skills_demonstrated)
+            parts.append("\n")
+
+        parts.append("\nGenerate resume content following the specified format. Only include claims supported by actual work.")
 
-        prompt += "\nGenerate resume content following the specified format. Only include claims supported by actual work."
+        return "".join(parts)
 
-        return prompt
+    def _parse_sections(self, response: str) -> Dict[str, List[str]]:
+        """
+        Split a response into sections in a single pass.
+
+        Maps each "#" or "##" heading (upper-cased, without the leading #'s)
+        to the non-blank lines up to the next such heading. Deeper headings
+        ("### Bullet 1") stay inside their section as ordinary lines.
+        """
+
+        parser = SectionStreamParser()
+        parser.feed(response)
+        parser.close()
 
-    def _parse_review(self, response: str, input_data: ReviewerInput) -> ArtifactReview:
-        """Parse review from response."""
+        return parser.sections
+
+    def _section_lines(self, sections: Dict[str, List[str]], title: str) -> List[str]:
+        """
+        Get the lines of the first section whose heading starts with title.
+
+        Prefix matching tolerates headings like "## Overall Score (0-10)".
+        """
 
-        overall_score = self._extract_overall_score(response)
-        overall_feedback = self._extract_overall_feedback(response)
-        criterion_scores = self._extract_criterion_scores(response)
-        criterion_feedback = self._extract_criterion_feedback(response)
-        strengths = self._extract_strengths(response)
-        improvements = self._extract_improvements(response)
-        recruiter_appeal = self._extract_recruiter_appeal(response)
-        skills = self._extract_skills_demonstrated(response)
+        for heading, lines in sections.items():
+            if heading.startswith(title):
+                return lines
+
+        return []
+
+    def _section_text(self, sections: Dict[str, List[str]], title: str) -> str:
+        """Get the lines of a section, before any sub-heading, as one paragraph."""
+
+        text = []
+        for line in self._section_lines(sections, title):
+            if line.startswith('#'):
+                break
+            text.append(line)
+
+        return ' '.join(text)
+
+    def _parse_review(
+        self,
+        sections: Dict[str, List[str]],
+        input_data: ReviewerInput,
+        review_id: Optional[str] = None
+    ) -> ArtifactReview:
+        """Parse review from response sections."""
+
+        overall_score = self._extract_overall_score(sections)
+        overall_feedback = self._extract_overall_feedback(sections)
+        criterion_scores = self._extract_criterion_scores(sections)
+        criterion_feedback = self._extract_criterion_feedback(sections)
+        strengths = self._extract_strengths(sections)
+        improvements = self._extract_improvements(sections)
+        recruiter_appeal = self._extract_recruiter_appeal(sections)
+        skills = self._extract_skills_demonstrated(sections)
 
         return ArtifactReview(
-            review_id=f"rev_{uuid.uuid4().hex[:8]}",
+            review_id=review_id or f"rev_{uuid.uuid4().hex[:8]}",
             project_id=input_data.project_id,
             user_id=input_data.user_id,
             submitted_artifacts=input_data.submitted_artifacts,
@@ -355,54 +580,22 @@ Be honest - only include what can be backed up by the actual work."""
             skills_demonstrated=skills
         )
 
-    def _parse_resume_bullets(self, response: str, input_data: ReviewerInput) -> List[ResumeBullet]:
-        """Parse resume bullets from response."""
-
-        bullets = []
-        lines = response.split('\n')
-
-        current_bullet = None
-        current_field = None
-
-        for line in lines:
-            line_stripped = line.strip()
-
-            if line_stripped.startswith('### Bullet'):
-                # Save previous bullet
-                if current_bullet:
-                    bullets.append(current_bullet)
-
-                # Start new bullet
-                current_bullet = {
-                    'text': '',
-                    'skills': [],
-                    'evidence': '',
-                    'type': 'execution'
-                }
-
-            elif current_bullet:
-                if line_stripped.startswith('Text:'):
-                    current_bullet['text'] = line_stripped.split(':', 1)[1].strip()
-                elif line_stripped.startswith('Skills:'):
-                    skills_str = line_stripped.split(':', 1)[1].strip()
-                    current_bullet['skills'] = [s.strip() for s in skills_str.split(',')]
-                elif line_stripped.startswith('Evidence:'):
-                    current_bullet['evidence'] = line_stripped.split(':', 1)[1].strip()
-                elif line_stripped.startswith('Type:'):
-                    current_bullet['type'] = line_stripped.split(':', 1)[1].strip()
-
-        # Add last bullet
-        if current_bullet and current_bullet['text']:
-            bullets.append(current_bullet)
-
-        # Convert to ResumeBullet objects
+    def _parse_resume_bullets(self, sections: Dict[str, List[str]], input_data: ReviewerInput) -> List[ResumeBullet]:
+        """Parse resume bullets from response sections."""
+
+        text = '\n'.join(self._section_lines(sections, "RESUME BULLETS"))
+
         resume_bullets = []
-        for b in bullets:
+        for chunk in _BULLET_HEADING_RE.split(text)[1:]:
+            fields = {name: value.strip() for name, value in _BULLET_FIELD_RE.findall(chunk)}
+            if not fields.get('Text'):
+                continue
+
             resume_bullets.append(ResumeBullet(
-                bullet_text=b['text'],
-                skills_highlighted=b['skills'],
-                evidence_source=b['evidence'],
-                bullet_type=b['type']
+                bullet_text=fields['Text'],
+                skills_highlighted=[skill.strip() for skill in fields['Skills'].split(',')] if 'Skills' in fields else [],
+                evidence_source=fields.get('Evidence', ''),
+                bullet_type=fields.get('Type') or 'execution'
             ))
 
         # Ensure we have at least 3 bullets
@@ -416,211 +609,119 @@ Be honest - only include what can be backed up by the actual work."""
 
         return resume_bullets[:5]  # Max 5 bullets
 
-    def _extract_overall_score(self, response: str) -> float:
+    def _extract_overall_score(self, sections: Dict[str, List[str]]) -> float:
         """Extract overall score."""
 
-        lines = response.split('\n')
-        for line in lines:
-            if "## Overall Score" in line:
-                idx = lines.index(line)
-                if idx + 1 < len(lines):
-                    score_line = lines[idx + 1].strip()
-                    try:
-                        score = float(''.join(filter(lambda x: x.isdigit() or x == '.', score_line)))
-                        return max(0.0, min(10.0, score))
-                    except:
-                        pass
-
-        return 7.0  # Default
-
-    def _extract_overall_feedback(self, response: str) -> str:
-        """Extract overall feedback."""
+        score_lines = self._section_lines(sections, "OVERALL SCORE")
+        match = _SCORE_RE.search(score_lines[0]) if score_lines else None
 
-        lines = response.split('\n')
-        feedback = []
-        in_section = False
+        return max(0.0, min(10.0, float(match.group()))) if match else 7.0  # Default
 
-        for line in lines:
-            if "## Overall Assessment" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
-                break
-            elif in_section and line.strip():
-                feedback.append(line.strip())
+    def _extract_overall_feedback(self, sections: Dict[str, List[str]]) -> str:
+        """Extract overall feedback."""
 
-        return ' '.join(feedback) if feedback else "Artifacts reviewed."
+        return self._section_text(sections, "OVERALL ASSESSMENT") or "Artifacts reviewed."
 
-    def _extract_criterion_scores(self, response: str) -> dict:
+    def _extract_criterion_scores(self, sections: Dict[str, List[str]]) -> dict:
         """Extract criterion scores."""
 
         scores = {}
-        lines = response.split('\n')
-        in_section = False
 
-        for line in lines:
-            if "## Criterion Scores" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
+        for line in self._section_lines(sections, "CRITERION SCORES"):
+            if line.startswith('#'):
                 break
-            elif in_section and ':' in line:
-                parts = line.split(':', 1)
-                criterion = parts[0].strip('- ').strip()
-                try:
-                    score = float(''.join(filter(lambda x: x.isdigit() or x == '.', parts[1])))
-                    scores[criterion] = max(0.0, min(10.0, score))
-                except:
-                    pass
+            elif ':' in line:
+                criterion, value = line.split(':', 1)
+                match = _SCORE_RE.search(value)
+                if match:
+                    scores[criterion.strip('- ').strip()] = max(0.0, min(10.0, float(match.group())))
 
         return scores
 
-    def _extract_criterion_feedback(self, response: str) -> dict:
+    def _extract_criterion_feedback(self, sections: Dict[str, List[str]]) -> dict:
         """Extract criterion feedback."""
 
         feedback = {}
-        lines = response.split('\n')
-        in_section = False
         current_criterion = None
         current_feedback = []
 
-        for line in lines:
-            if "## Criterion Feedback" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##') and "Criterion" not in line:
-                break
-            elif in_section:
-                if line.strip().startswith('###'):
-                    if current_criterion:
-                        feedback[current_criterion] = ' '.join(current_feedback)
-                    current_criterion = line.strip('#').strip()
-                    current_feedback = []
-                elif current_criterion and line.strip():
-                    current_feedback.append(line.strip())
+        for line in self._section_lines(sections, "CRITERION FEEDBACK"):
+            if line.startswith('###'):
+                if current_criterion:
+                    feedback[current_criterion] = ' '.join(current_feedback)
+                current_criterion = line.strip('#').strip()
+                current_feedback = []
+            elif current_criterion:
+                current_feedback.append(line)
 
         if current_criterion:
             feedback[current_criterion] = ' '.join(current_feedback)
 
         return feedback
 
-    def _extract_strengths(self, response: str) -> List[str]:
+    def _extract_strengths(self, sections: Dict[str, List[str]]) -> List[str]:
         """Extract strengths."""
 
-        return self._extract_list_section(response, "## Strengths")
+        return self._extract_list_section(sections, "STRENGTHS")
 
-    def _extract_improvements(self, response: str) -> List[str]:
+    def _extract_improvements(self, sections: Dict[str, List[str]]) -> List[str]:
         """Extract areas for improvement."""
 
-        return self._extract_list_section(response, "## Areas for Improvement")
+        return self._extract_list_section(sections, "AREAS FOR IMPROVEMENT")
 
-    def _extract_recruiter_appeal(self, response: str) -> str:
+    def _extract_recruiter_appeal(self, sections: Dict[str, List[str]]) -> str:
         """Extract recruiter appeal assessment."""
 
-        lines = response.split('\n')
-        appeal = []
-        in_section = False
+        return self._section_text(sections, "RECRUITER APPEAL") or "Work demonstrates relevant skills."
 
-        for line in lines:
-            if "## Recruiter Appeal" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
-                break
-            elif in_section and line.strip():
-                appeal.append(line.strip())
-
-        return ' '.join(appeal) if appeal else "Work demonstrates relevant skills."
-
-    def _extract_skills_demonstrated(self, response: str) -> List[str]:
+    def _extract_skills_demonstrated(self, sections: Dict[str, List[str]]) -> List[str]:
         """Extract skills demonstrated."""
 
-        return self._extract_list_section(response, "## Skills Demonstrated")
+        return self._extract_list_section(sections, "SKILLS DEMONSTRATED")
 
-    def _extract_project_title(self, response: str) -> str:
+    def _extract_project_title(self, sections: Dict[str, List[str]]) -> str:
         """Extract project title."""
 
-        lines = response.split('\n')
-        for i, line in enumerate(lines):
-            if "## Project Title" in line and i + 1 < len(lines):
-                return lines[i + 1].strip()
-
-        return "Project Completed"
+        lines = self._section_lines(sections, "PROJECT TITLE")
+        return lines[0] if lines else "Project Completed"
 
-    def _extract_project_one_liner(self, response: str) -> str:
+    def _extract_project_one_liner(self, sections: Dict[str, List[str]]) -> str:
         """Extract project one-liner."""
 
-        lines = response.split('\n')
-        for i, line in enumerate(lines):
-            if "## Project One-Liner" in line and i + 1 < len(lines):
-                return lines[i + 1].strip()
+        lines = self._section_lines(sections, "PROJECT ONE-LINER")
+        return lines[0] if lines else "Completed a project"
 
-        return "Completed a project"
-
-    def _extract_project_description(self, response: str) -> str:
+    def _extract_project_description(self, sections: Dict[str, List[str]]) -> str:
         """Extract project description."""
 
-        lines = response.split('\n')
-        desc = []
-        in_section = False
-
-        for line in lines:
-            if "## Project Description" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
-                break
-            elif in_section and line.strip():
-                desc.append(line.strip())
+        return self._section_text(sections, "PROJECT DESCRIPTION") or "Completed a project demonstrating relevant skills."
 
-        return ' '.join(desc) if desc else "Completed a project demonstrating relevant skills."
-
-    def _extract_suggested_skills(self, response: str) -> List[str]:
+    def _extract_suggested_skills(self, sections: Dict[str, List[str]]) -> List[str]:
         """Extract suggested skills."""
 
-        return self._extract_list_section(response, "## Skills Section")
+        return self._extract_list_section(sections, "SKILLS SECTION")
 
-    def _extract_talking_points(self, response: str) -> List[str]:
+    def _extract_talking_points(self, sections: Dict[str, List[str]]) -> List[str]:
         """Extract interview talking points."""
 
-        return self._extract_list_section(response, "## Interview Talking Points")
+        return self._extract_list_section(sections, "INTERVIEW TALKING POINTS")
 
-    def _extract_next_steps(self, response: str) -> str:
+    def _extract_next_steps(self, sections: Dict[str, List[str]]) -> str:
         """Extract next steps."""
 
-        lines = response.split('\n')
-        steps = []
-        in_section = False
-
-        for line in lines:
-            if "## Next Steps" in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
-                break
-            elif in_section and line.strip():
-                steps.append(line.strip())
+        return self._section_text(sections, "NEXT STEPS") or "Use this feedback to improve your work."
 
-        return ' '.join(steps) if steps else "Use this feedback to improve your work."
-
-    def _extract_list_section(self, response: str, header: str) -> List[str]:
+    def _extract_list_section(self, sections: Dict[str, List[str]], title: str) -> List[str]:
         """Extract a list section."""
 
-        lines = response.split('\n')
         items = []
-        in_section = False
 
-        for line in lines:
-            if header in line:
-                in_section = True
-                continue
-            elif in_section and line.strip().startswith('##'):
+        for line in self._section_lines(sections, title):
+            if line.startswith('#'):
                 break
-            elif in_section:
-                line_stripped = line.strip()
-                if line_stripped.startswith('- ') or line_stripped.startswith('* '):
-                    items.append(line_stripped[2:])
-                elif line_stripped and line_stripped[0].isdigit() and '.' in line_stripped:
-                    items.append(line_stripped.split('.', 1)[1].strip())
+
+            match = _LIST_ITEM_RE.match(line)
+            if match:
+                items.append(match.group(1))
 
         return items
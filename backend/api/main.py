@@ -8,7 +8,9 @@ import os
 from typing import Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import structlog
@@ -16,9 +18,16 @@ import structlog
 from ..orchestration.orchestrator import Orchestrator
 from ..modules.rag import RAGModule
 from ..modules.logging import LoggingModule
+from ..modules.embeddings import get_embedding_model
+from ..schemas.state import UserState, StateType
 
 logger = structlog.get_logger()
 
+# Load the embedding model at import time so a preloading server
+# (gunicorn --preload) shares one copy of the weights across workers
+if os.getenv("PRELOAD_EMBEDDING_MODEL") == "1":
+    get_embedding_model(os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"))
+
 # Global orchestrator instance
 orchestrator: Optional[Orchestrator] = None
 
@@ -59,16 +68,24 @@ app = FastAPI(
     title="Sapiens MVP API",
     description="Multi-agent system for project-based career guidance",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware. Explicit origins (comma-separated CORS_ORIGINS) are
+# required with credentials, and let preflights be answered from a fixed set.
+CORS_ORIGINS = sorted({
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
+    if origin.strip()
+})
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 
@@ -152,16 +169,20 @@ async def chat(request: ChatRequest):
             has_room_id=request.room_id is not None
         )
 
-        # Process message
-        response = orchestrator.process_user_message(
+        # Process message (blocking LLM calls run in a worker thread so the
+        # event loop keeps serving other requests)
+        response, user_state = await run_in_threadpool(
+            orchestrator.process_user_message_with_state,
             user_id=request.user_id,
             message=request.message,
             room_id=request.room_id
         )
 
-        # Get updated state (use room_id if provided)
-        state_key = f"{request.user_id}_{request.room_id}" if request.room_id else request.user_id
-        user_state = orchestrator.logging_module.load_user_state(state_key)
+        # On error the state was not returned; fall back to the stored one
+        if user_state is None:
+            user_state = orchestrator.logging_module.load_user_state(
+                UserState.make_key(request.user_id, request.room_id)
+            )
 
         return ChatResponse(
             user_id=request.user_id,
@@ -226,7 +247,8 @@ async def get_project(user_id: str):
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        return project.model_dump()
+        # Serialize straight to JSON instead of via an intermediate dict
+        return Response(content=project.model_dump_json(), media_type="application/json")
 
     except HTTPException:
         raise
@@ -274,8 +296,6 @@ async def create_user(user_id: str):
             return {"user_id": user_id, "status": "exists"}
 
         # Create new user state
-        from ..schemas.state import UserState, StateType
-
         user_state = UserState(
             user_id=user_id,
             current_state=StateType.ONBOARDING
@@ -309,9 +329,16 @@ async def global_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop and httptools ship with uvicorn[standard]. Auto-reload is for
+    # development only (and runs a single worker).
+    # WEB_CONCURRENCY > 1 also turns off LoggingModule's per-process user
+    # state cache, since several workers share the same state files.
     uvicorn.run(
         "backend.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=os.getenv("ENVIRONMENT", "development") == "development"
     )
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Import JSONL conversation logs into the conversation_logs table.
+
+Usage:
+    python backend/db/import_logs.py [storage_dir]
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.db.database import init_database
+
+# Rows sent per COPY
+IMPORT_BATCH_SIZE = 10_000
+
+
+def _conversation_records(storage_dir: Path):
+    """Yield conversation_logs rows from every user's conversation.jsonl."""
+
+    for conversation_file in sorted(storage_dir.glob("*/conversation.jsonl")):
+        user_id = conversation_file.parent.name
+
+        with open(conversation_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                entry = orjson.loads(line)
+
+                # Log timestamps are naive UTC
+                timestamp = datetime.fromisoformat(entry["timestamp"])
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+                yield (
+                    user_id,
+                    timestamp,
+                    entry["type"],
+                    entry.get("message"),
+                    entry.get("agent"),
+                    entry.get("response"),
+                    orjson.dumps(entry.get("metadata") or {}).decode()
+                )
+
+
+async def _import(db, storage_dir: Path) -> int:
+    """Copy all conversation records in batches; returns the row count."""
+
+    total = 0
+    batch = []
+
+    for record in _conversation_records(storage_dir):
+        batch.append(record)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await db.bulk_import_conversation(batch)
+            total += len(batch)
+            batch = []
+
+    if batch:
+        await db.bulk_import_conversation(batch)
+        total += len(batch)
+
+    await db.dispose()
+    return total
+
+
+def main():
+    """Import conversation logs."""
+
+    storage_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "./data/logs")
+
+    database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        print("ERROR: DATABASE_URL not set")
+        sys.exit(1)
+
+    if not storage_dir.is_dir():
+        print(f"ERROR: {storage_dir} is not a directory")
+        sys.exit(1)
+
+    print(f"Importing conversation logs from {storage_dir}...")
+
+    db = init_database(database_url)
+    total = asyncio.run(_import(db, storage_dir))
+
+    print(f"✅ Imported {total} conversation log rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Usage:
     python backend/db/init_db.py
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -40,7 +41,7 @@ def main():
 
     # Create tables
     print("Creating tables...")
-    db.create_tables()
+    asyncio.run(db.create_tables())
 
     print("✅ Database initialized successfully!")
     print("\nTables created:")
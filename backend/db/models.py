@@ -3,12 +3,12 @@ Database models for PostgreSQL.
 SQLAlchemy ORM models for production database.
 """
 
-from datetime import datetime
 from sqlalchemy import (
-    Column, String, Integer, Float, Boolean, DateTime, JSON, Text, Enum as SQLEnum
+    BigInteger, Column, String, Integer, Float, Boolean, DateTime, Text, Identity,
+    Index, DDL, event, func, text
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 import uuid
 
 from ..schemas.state import StateType
@@ -18,23 +18,76 @@ from ..schemas.execution import MilestoneStatus
 Base = declarative_base()
 
 
+def _enum_values(enum_class) -> list:
+    """Store enum values ("completed"), matching the JSON schemas, not member names."""
+
+    return [member.value for member in enum_class]
+
+
+# Named Postgres enum types shared by all columns. Tables never create them
+# implicitly; they are created once per metadata create/drop below.
+state_type_enum = ENUM(
+    StateType, name="state_type", values_callable=_enum_values, create_type=False
+)
+milestone_status_enum = ENUM(
+    MilestoneStatus, name="milestone_status", values_callable=_enum_values, create_type=False
+)
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_enum_types(target, connection, **kw):
+    for enum_type in (state_type_enum, milestone_status_enum):
+        enum_type.create(connection, checkfirst=True)
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_enum_types(target, connection, **kw):
+    for enum_type in (state_type_enum, milestone_status_enum):
+        enum_type.drop(connection, checkfirst=True)
+
+# Hash partitions per log table. Logs are always read per user, so each
+# query touches one partition and its (user_id, timestamp) index.
+LOG_TABLE_PARTITIONS = 16
+
+
+def _create_hash_partitions(table, partitions: int = LOG_TABLE_PARTITIONS) -> None:
+    """Create the hash partitions of a partitioned table right after the table."""
+
+    for remainder in range(partitions):
+        event.listen(
+            table,
+            "after_create",
+            DDL(
+                f"CREATE TABLE {table.name}_p{remainder} PARTITION OF {table.name} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            ).execute_if(dialect="postgresql")
+        )
+
+
 class UserStateModel(Base):
     """User state table."""
 
     __tablename__ = "user_states"
+    __table_args__ = (
+        # Active (not completed) users by recency
+        Index(
+            "ix_user_states_active",
+            "last_activity_at",
+            postgresql_where=text("current_state != 'completed'")
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String, unique=True, nullable=False, index=True)
+    user_id = Column(String, primary_key=True)
 
     # State
-    current_state = Column(SQLEnum(StateType), nullable=False)
-    previous_state = Column(SQLEnum(StateType), nullable=True)
+    current_state = Column(state_type_enum, nullable=False)
+    previous_state = Column(state_type_enum, nullable=True)
 
     # Timestamps
-    state_entered_at = Column(DateTime, default=datetime.utcnow)
-    last_activity_at = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    state_entered_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_activity_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Onboarding data
     target_role = Column(String, nullable=True)
@@ -53,7 +106,7 @@ class UserStateModel(Base):
     solution_approved = Column(Boolean, default=False)
 
     # Execution data
-    execution_started_at = Column(DateTime, nullable=True)
+    execution_started_at = Column(DateTime(timezone=True), nullable=True)
     current_milestone_id = Column(String, nullable=True)
     milestones_completed = Column(Integer, default=0)
     total_milestones = Column(Integer, default=0)
@@ -63,48 +116,53 @@ class UserStateModel(Base):
     resume_generated = Column(Boolean, default=False)
 
     # Context and metadata
-    context = Column(JSON, default=dict)
-    meta_data = Column(JSON, default=dict)
+    context = Column(JSONB, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class ProjectModel(Base):
     """Project table."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_user_status", "user_id", "status"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(String, unique=True, nullable=False, index=True)
-    user_id = Column(String, nullable=False, index=True)
+    project_id = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False)
 
     # Project data (stored as JSON)
-    proposal = Column(JSON, nullable=False)
+    proposal = Column(JSONB, nullable=False)
 
     status = Column(String, default="proposed")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    approved_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    approved_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
 
     problem_id = Column(String, nullable=True)
     solution_id = Column(String, nullable=True)
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class ProblemDefinitionModel(Base):
     """Problem definition table."""
 
     __tablename__ = "problem_definitions"
+    __table_args__ = (
+        Index("ix_problem_definitions_success_metrics_gin", "success_metrics", postgresql_using="gin"),
+        Index("ix_problem_definitions_meta_gin", "meta_data", postgresql_using="gin"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    problem_id = Column(String, unique=True, nullable=False, index=True)
+    problem_id = Column(String, primary_key=True)
     project_id = Column(String, nullable=False, index=True)
     user_id = Column(String, nullable=False, index=True)
 
     problem_statement = Column(Text, nullable=False)
     target_audience = Column(Text, nullable=False)
     problem_context = Column(Text, nullable=False)
-    success_metrics = Column(JSON, nullable=False)
+    success_metrics = Column(JSONB, nullable=False)
 
     # Evaluation
     evaluation_passed = Column(Boolean, default=False)
@@ -114,13 +172,13 @@ class ProblemDefinitionModel(Base):
     clarity_score = Column(Float, nullable=True)
     feasibility_score = Column(Float, nullable=True)
 
-    improvement_suggestions = Column(JSON, default=list)
+    improvement_suggestions = Column(JSONB, default=list)
 
     version = Column(Integer, default=1)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    approved_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    approved_at = Column(DateTime(timezone=True), nullable=True)
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class SolutionDesignModel(Base):
@@ -128,16 +186,15 @@ class SolutionDesignModel(Base):
 
     __tablename__ = "solution_designs"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    solution_id = Column(String, unique=True, nullable=False, index=True)
+    solution_id = Column(String, primary_key=True)
     problem_id = Column(String, nullable=False, index=True)
     project_id = Column(String, nullable=False, index=True)
     user_id = Column(String, nullable=False, index=True)
 
     solution_approach = Column(Text, nullable=False)
-    key_components = Column(JSON, nullable=False)
+    key_components = Column(JSONB, nullable=False)
     methodology = Column(Text, nullable=False)
-    expected_outcomes = Column(JSON, nullable=False)
+    expected_outcomes = Column(JSONB, nullable=False)
     resource_requirements = Column(Text, nullable=True)
 
     # Evaluation
@@ -149,55 +206,62 @@ class SolutionDesignModel(Base):
     implementation_feasibility_score = Column(Float, nullable=True)
     impact_potential_score = Column(Float, nullable=True)
 
-    improvement_suggestions = Column(JSON, default=list)
+    improvement_suggestions = Column(JSONB, default=list)
 
     version = Column(Integer, default=1)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    approved_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    approved_at = Column(DateTime(timezone=True), nullable=True)
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class MilestoneModel(Base):
     """Milestone table."""
 
     __tablename__ = "milestones"
+    __table_args__ = (
+        Index("ix_milestones_user_project", "user_id", "project_id"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    milestone_id = Column(String, unique=True, nullable=False, index=True)
+    milestone_id = Column(String, primary_key=True)
     project_id = Column(String, nullable=False, index=True)
-    user_id = Column(String, nullable=False, index=True)
+    user_id = Column(String, nullable=False)
 
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     deliverable = Column(Text, nullable=False)
 
     order = Column(Integer, nullable=False)
-    status = Column(SQLEnum(MilestoneStatus), default=MilestoneStatus.NOT_STARTED)
+    status = Column(milestone_status_enum, default=MilestoneStatus.NOT_STARTED)
 
     estimated_days = Column(Float, nullable=False)
-    target_date = Column(DateTime, nullable=True)
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
+    target_date = Column(DateTime(timezone=True), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
 
-    depends_on = Column(JSON, default=list)
+    depends_on = Column(JSONB, default=list)
     next_action = Column(Text, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class ConversationLogModel(Base):
     """Conversation log table."""
 
     __tablename__ = "conversation_logs"
+    __table_args__ = (
+        Index("ix_conversation_logs_user_timestamp", "user_id", "timestamp"),
+        {"postgresql_partition_by": "HASH (user_id)"},
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String, nullable=False, index=True)
+    # The partition key must be part of the primary key
+    id = Column(BigInteger, Identity(), primary_key=True)
+    user_id = Column(String, primary_key=True)
 
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     message_type = Column(String, nullable=False)  # user_message, agent_response
 
     # For user messages
@@ -207,50 +271,62 @@ class ConversationLogModel(Base):
     agent = Column(String, nullable=True)
     response = Column(Text, nullable=True)
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class ArtifactReviewModel(Base):
     """Artifact review table."""
 
     __tablename__ = "artifact_reviews"
+    __table_args__ = (
+        Index("ix_artifact_reviews_criterion_scores_gin", "criterion_scores", postgresql_using="gin"),
+        Index("ix_artifact_reviews_meta_gin", "meta_data", postgresql_using="gin"),
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    review_id = Column(String, unique=True, nullable=False, index=True)
+    review_id = Column(String, primary_key=True)
     project_id = Column(String, nullable=False, index=True)
     user_id = Column(String, nullable=False, index=True)
 
-    submitted_artifacts = Column(JSON, nullable=False)
+    submitted_artifacts = Column(JSONB, nullable=False)
 
     overall_score = Column(Float, nullable=False)
     overall_feedback = Column(Text, nullable=False)
 
-    criterion_scores = Column(JSON, nullable=False)
-    criterion_feedback = Column(JSON, nullable=False)
+    criterion_scores = Column(JSONB, nullable=False)
+    criterion_feedback = Column(JSONB, nullable=False)
 
-    strengths = Column(JSON, nullable=False)
-    areas_for_improvement = Column(JSON, nullable=False)
+    strengths = Column(JSONB, nullable=False)
+    areas_for_improvement = Column(JSONB, nullable=False)
 
     recruiter_appeal_assessment = Column(Text, nullable=False)
-    skills_demonstrated = Column(JSON, nullable=False)
+    skills_demonstrated = Column(JSONB, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    meta_data = Column(JSON, default=dict)
+    meta_data = Column(JSONB, default=dict)
 
 
 class StateTransitionModel(Base):
     """State transition log table."""
 
     __tablename__ = "state_transitions"
+    __table_args__ = (
+        Index("ix_state_transitions_user_timestamp", "user_id", "timestamp"),
+        {"postgresql_partition_by": "HASH (user_id)"},
+    )
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String, nullable=False, index=True)
+    # The partition key must be part of the primary key
+    id = Column(BigInteger, Identity(), primary_key=True)
+    user_id = Column(String, primary_key=True)
 
-    from_state = Column(SQLEnum(StateType), nullable=False)
-    to_state = Column(SQLEnum(StateType), nullable=False)
+    from_state = Column(state_type_enum, nullable=False)
+    to_state = Column(state_type_enum, nullable=False)
     reason = Column(Text, nullable=False)
 
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    data = Column(JSONB, default=dict)
+
 
-    data = Column(JSON, default=dict)
+_create_hash_partitions(ConversationLogModel.__table__)
+_create_hash_partitions(StateTransitionModel.__table__)
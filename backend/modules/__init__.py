@@ -1,6 +1,15 @@
 """Supporting modules for the Sapiens MVP system."""
 
-from .rag import RAGModule
-from .logging import LoggingModule
-
 __all__ = ["RAGModule", "LoggingModule"]
+
+
+def __getattr__(name):
+    # Imported on first use, so loading one submodule (e.g. embeddings)
+    # doesn't pull in chromadb and structlog as well
+    if name == "RAGModule":
+        from .rag import RAGModule
+        return RAGModule
+    if name == "LoggingModule":
+        from .logging import LoggingModule
+        return LoggingModule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,45 @@
+"""
+Shared sentence embedding models.
+
+Loading a SentenceTransformer takes seconds and ~90MB per copy, so each
+model is loaded once per process and shared by every RAGModule and agent.
+Loading it before workers fork (e.g. gunicorn --preload) lets workers
+share the weights copy-on-write.
+"""
+
+import os
+import platform
+from functools import lru_cache
+from sentence_transformers import SentenceTransformer
+
+
+def _default_onnx_file() -> str:
+    """Pick the int8 export matching this host's CPU architecture."""
+
+    # The AVX512-VNNI export runs poorly on hosts without VNNI (Graviton,
+    # many AMD and older Intel parts); the AVX2 one suits any x86-64 host
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    return "onnx/model_quint8_avx2.onnx"
+
+
+# Inference backend: "torch" (default) or "onnx" to run encode() through
+# ONNX Runtime with an int8-quantized export (needs onnxruntime/optimum)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE") or _default_onnx_file()
+
+
+@lru_cache(maxsize=None)
+def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
+    """Get the process-wide SentenceTransformer for a model name."""
+
+    if EMBEDDING_BACKEND != "onnx":
+        return SentenceTransformer(model_name)
+
+    # For a model that doesn't publish EMBEDDING_ONNX_FILE,
+    # sentence-transformers exports model.onnx itself instead of raising
+    return SentenceTransformer(
+        model_name,
+        backend="onnx",
+        model_kwargs={"file_name": EMBEDDING_ONNX_FILE}
+    )
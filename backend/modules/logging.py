@@ -3,10 +3,14 @@ Logging Module for comprehensive state and artifact tracking.
 Serves as the source of truth for resume generation.
 """
 
-import json
-from typing import List, Optional, Dict, Any, Type, TypeVar
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from typing import IO, List, Optional, Dict, Any, Type, TypeVar
 from datetime import datetime
 from pathlib import Path
+import orjson
 import structlog
 
 from ..schemas.state import UserState, StateTransition
@@ -15,18 +19,52 @@ from ..schemas.problem_solution import ProblemDefinition, SolutionDesign
 from ..schemas.execution import Milestone, ProgressUpdate, ExecutionPlan
 from ..schemas.review import ArtifactReview, ResumePackage
 
-# Configure structured logging
+# Configure structured logging. orjson renders straight to bytes for the
+# bytes logger, and the bound logger is built once instead of per call.
 structlog.configure(
     processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
-    ]
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
+    ],
+    logger_factory=structlog.BytesLoggerFactory(),
+    cache_logger_on_first_use=True
 )
 
 logger = structlog.get_logger()
 
 T = TypeVar('T')
 
+# User states kept in memory (write-through, per process). Only safe when
+# this process is the only writer of the storage directory, so the cache is
+# off when WEB_CONCURRENCY asks for more than one server worker; otherwise
+# workers would serve stale states and overwrite each other's state.json.
+USER_STATE_CACHE_MAX_SIZE = 10_000
+USER_STATE_CACHE_ENABLED = int(os.getenv("WEB_CONCURRENCY", "1")) <= 1
+
+# JSONL appends go through handles kept open per file. A background thread
+# flushes them every interval (and reads in this process flush first), so
+# other processes see new lines within about one interval and a crash can
+# lose at most that much.
+JSONL_BUFFER_SIZE = 1 << 16
+JSONL_MAX_OPEN_FILES = 256
+JSONL_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Initial read window when tailing a JSONL file; doubled until enough lines
+TAIL_READ_WINDOW = 1 << 16
+
+
+def _jsonl_line(data: Any) -> bytes:
+    """Serialize one JSONL record (Pydantic models in JSON mode)."""
+
+    if hasattr(data, 'model_dump'):
+        data = data.model_dump(mode='json')
+
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    )
+
 
 class LoggingModule:
     """
@@ -50,33 +88,132 @@ class LoggingModule:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        self.logger = logger
+        self._state_cache: "OrderedDict[str, UserState]" = OrderedDict()
+        self._state_cache_lock = threading.RLock()
+
+        # User directories already created by this process
+        self._user_dirs: set = set()
+
+        self._writers: "OrderedDict[Path, IO[bytes]]" = OrderedDict()
+        self._writers_lock = threading.Lock()
+        self._closed = threading.Event()
+        threading.Thread(
+            target=self._flush_periodically,
+            name="jsonl-flush",
+            daemon=True
+        ).start()
+        atexit.register(self.close)
 
     def _get_user_dir(self, user_id: str) -> Path:
         """Get storage directory for a user."""
 
         user_dir = self.storage_dir / user_id
-        user_dir.mkdir(parents=True, exist_ok=True)
+        if user_id not in self._user_dirs:
+            user_dir.mkdir(parents=True, exist_ok=True)
+            self._user_dirs.add(user_id)
         return user_dir
 
     def _save_json(self, file_path: Path, data: Any) -> None:
         """Save data as JSON."""
 
-        with open(file_path, 'w') as f:
-            if hasattr(data, 'model_dump'):
-                json.dump(data.model_dump(), f, indent=2, default=str)
+        if hasattr(data, 'model_dump'):
+            data = data.model_dump(mode='json')
+
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+
+    def _append_jsonl(self, file_path: Path, lines: bytes) -> None:
+        """Append newline-terminated JSON lines through a buffered, kept-open handle."""
+
+        with self._writers_lock:
+            writer = self._writers.get(file_path)
+            if writer is None:
+                writer = open(file_path, 'ab', buffering=JSONL_BUFFER_SIZE)
+                self._writers[file_path] = writer
+                if len(self._writers) > JSONL_MAX_OPEN_FILES:
+                    _, oldest = self._writers.popitem(last=False)
+                    oldest.close()
             else:
-                json.dump(data, f, indent=2, default=str)
+                self._writers.move_to_end(file_path)
+
+            writer.write(lines)
+
+    def _flush_periodically(self) -> None:
+        """Flush buffered appends every interval until the module is closed."""
+
+        while not self._closed.wait(JSONL_FLUSH_INTERVAL_SECONDS):
+            self.flush()
+
+    def _flush_jsonl(self, file_path: Path) -> None:
+        """Flush pending appends to a file before it is read."""
+
+        with self._writers_lock:
+            writer = self._writers.get(file_path)
+            if writer is not None:
+                writer.flush()
+
+    def flush(self) -> None:
+        """Flush all pending JSONL appends."""
+
+        with self._writers_lock:
+            for writer in self._writers.values():
+                writer.flush()
+
+    def close(self) -> None:
+        """Flush and close all open JSONL handles and stop the flush thread."""
+
+        self._closed.set()
+        with self._writers_lock:
+            while self._writers:
+                _, writer = self._writers.popitem(last=False)
+                writer.close()
+
+    def _cache_user_state(self, state_key: str, state: UserState) -> None:
+        """Store a copy of a user state, evicting the least recently used when full."""
+
+        if not USER_STATE_CACHE_ENABLED:
+            return
+
+        with self._state_cache_lock:
+            self._state_cache[state_key] = state.model_copy(deep=True)
+            self._state_cache.move_to_end(state_key)
+            if len(self._state_cache) > USER_STATE_CACHE_MAX_SIZE:
+                self._state_cache.popitem(last=False)
 
     def _load_json(self, file_path: Path, model_class: Type[T]) -> Optional[T]:
-        """Load JSON data into a Pydantic model."""
+        """Load JSON data into a Pydantic model (validated straight from bytes)."""
 
         if not file_path.exists():
             return None
 
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            return model_class(**data)
+        with open(file_path, 'rb') as f:
+            return model_class.model_validate_json(f.read())
+
+    def _tail_jsonl(self, file_path: Path, limit: int) -> List[bytes]:
+        """Read the last `limit` lines of a JSONL file without reading all of it."""
+
+        size = os.stat(file_path).st_size
+        window = TAIL_READ_WINDOW
+
+        with open(file_path, 'rb') as f:
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                lines = f.read(size - start).split(b'\n')
+
+                # The first line may be cut off by the window
+                if start > 0:
+                    lines = lines[1:]
+
+                lines = [line for line in lines if line.strip()]
+                if len(lines) >= limit or start == 0:
+                    return lines[-limit:]
+
+                window *= 2
 
     # ========================================================================
     # User State Management
@@ -85,18 +222,16 @@ class LoggingModule:
     def save_user_state(self, state: UserState) -> None:
         """Save user state. Automatically constructs composite key if room_id exists."""
 
-        # Construct state key - use composite key if room_id exists
-        if state.room_id:
-            state_key = f"{state.user_id}_{state.room_id}"
-        else:
-            state_key = state.user_id
+        # Composite key if room_id exists
+        state_key = state.state_key
 
         user_dir = self._get_user_dir(state_key)
         state_file = user_dir / "state.json"
 
         self._save_json(state_file, state)
+        self._cache_user_state(state_key, state)
 
-        self.logger.info(
+        logger.info(
             "user_state_saved",
             state_key=state_key,
             user_id=state.user_id,
@@ -111,8 +246,9 @@ class LoggingModule:
         state_file = user_dir / "state.json"
 
         self._save_json(state_file, state)
+        self._cache_user_state(state_key, state)
 
-        self.logger.info(
+        logger.info(
             "user_state_saved",
             state_key=state_key,
             user_id=state.user_id,
@@ -121,12 +257,27 @@ class LoggingModule:
         )
 
     def load_user_state(self, user_id: str) -> Optional[UserState]:
-        """Load user state."""
+        """
+        Load user state.
+
+        Served from the in-memory cache when possible. Callers get their own
+        copy, so unsaved changes never leak into the cache.
+        """
+
+        with self._state_cache_lock:
+            state = self._state_cache.get(user_id)
+            if state is not None:
+                self._state_cache.move_to_end(user_id)
+                return state.model_copy(deep=True)
 
         user_dir = self._get_user_dir(user_id)
         state_file = user_dir / "state.json"
 
-        return self._load_json(state_file, UserState)
+        state = self._load_json(state_file, UserState)
+        if state is not None:
+            self._cache_user_state(user_id, state)
+
+        return state
 
     def log_state_transition(self, transition: StateTransition, user_id: str) -> None:
         """Log a state transition."""
@@ -135,10 +286,9 @@ class LoggingModule:
         transitions_file = user_dir / "transitions.jsonl"
 
         # Append to JSONL file
-        with open(transitions_file, 'a') as f:
-            f.write(json.dumps(transition.model_dump(), default=str) + '\n')
+        self._append_jsonl(transitions_file, _jsonl_line(transition))
 
-        self.logger.info(
+        logger.info(
             "state_transition",
             user_id=user_id,
             from_state=transition.from_state,
@@ -158,7 +308,7 @@ class LoggingModule:
 
         self._save_json(project_file, project)
 
-        self.logger.info(
+        logger.info(
             "project_saved",
             user_id=project.user_id,
             project_id=project.project_id,
@@ -185,7 +335,7 @@ class LoggingModule:
 
         self._save_json(problem_file, problem)
 
-        self.logger.info(
+        logger.info(
             "problem_saved",
             user_id=problem.user_id,
             problem_id=problem.problem_id,
@@ -212,7 +362,7 @@ class LoggingModule:
 
         self._save_json(solution_file, solution)
 
-        self.logger.info(
+        logger.info(
             "solution_saved",
             user_id=solution.user_id,
             solution_id=solution.solution_id,
@@ -243,7 +393,7 @@ class LoggingModule:
 
         self._save_json(plan_file, plan)
 
-        self.logger.info(
+        logger.info(
             "execution_plan_saved",
             user_id=plan.user_id,
             plan_id=plan.plan_id,
@@ -258,6 +408,17 @@ class LoggingModule:
 
         self._save_json(milestone_file, milestone)
 
+    def save_milestones(self, milestones: List[Milestone]) -> None:
+        """Save several milestones, resolving each user's directory once."""
+
+        user_dirs: Dict[str, Path] = {}
+        for milestone in milestones:
+            if milestone.user_id not in user_dirs:
+                user_dirs[milestone.user_id] = self._get_user_dir(milestone.user_id)
+
+            milestone_file = user_dirs[milestone.user_id] / f"milestone_{milestone.milestone_id}.json"
+            self._save_json(milestone_file, milestone)
+
     def load_milestone(self, user_id: str, milestone_id: str) -> Optional[Milestone]:
         """Load milestone."""
 
@@ -273,15 +434,35 @@ class LoggingModule:
         updates_file = user_dir / f"progress_updates_{update.milestone_id}.jsonl"
 
         # Append to JSONL file
-        with open(updates_file, 'a') as f:
-            f.write(json.dumps(update.model_dump(), default=str) + '\n')
+        self._append_jsonl(updates_file, _jsonl_line(update))
 
-        self.logger.info(
+        logger.info(
             "progress_update_saved",
             user_id=update.user_id,
             milestone_id=update.milestone_id
         )
 
+    def save_progress_updates(self, updates: List[ProgressUpdate]) -> None:
+        """Save several progress updates with one append per milestone file."""
+
+        grouped: Dict[tuple, List[bytes]] = {}
+        for update in updates:
+            key = (update.user_id, update.milestone_id)
+            grouped.setdefault(key, []).append(_jsonl_line(update))
+
+        for (user_id, milestone_id), lines in grouped.items():
+            user_dir = self._get_user_dir(user_id)
+            updates_file = user_dir / f"progress_updates_{milestone_id}.jsonl"
+
+            self._append_jsonl(updates_file, b''.join(lines))
+
+            logger.info(
+                "progress_updates_saved",
+                user_id=user_id,
+                milestone_id=milestone_id,
+                count=len(lines)
+            )
+
     # ========================================================================
     # Review and Resume
     # ========================================================================
@@ -294,7 +475,7 @@ class LoggingModule:
 
         self._save_json(review_file, review)
 
-        self.logger.info(
+        logger.info(
             "review_saved",
             user_id=review.user_id,
             review_id=review.review_id,
@@ -321,13 +502,27 @@ class LoggingModule:
 
         self._save_json(resume_file, resume)
 
-        self.logger.info(
+        logger.info(
             "resume_saved",
             user_id=resume.user_id,
             resume_id=resume.resume_id,
             num_bullets=len(resume.resume_bullets)
         )
 
+    # ========================================================================
+    # LLM Call Tracking
+    # ========================================================================
+
+    def log_llm_call(self, agent_name: str, model: str, cache_hit: bool) -> None:
+        """Log an LLM call and whether it was served from the response cache."""
+
+        logger.info(
+            "llm_call",
+            agent=agent_name,
+            model=model,
+            cache_hit=cache_hit
+        )
+
     # ========================================================================
     # Conversation Logging
     # ========================================================================
@@ -345,8 +540,7 @@ class LoggingModule:
             "metadata": metadata or {}
         }
 
-        with open(conversation_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self._append_jsonl(conversation_file, _jsonl_line(log_entry))
 
     def log_agent_response(
         self,
@@ -368,8 +562,7 @@ class LoggingModule:
             "metadata": metadata or {}
         }
 
-        with open(conversation_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self._append_jsonl(conversation_file, _jsonl_line(log_entry))
 
     def get_conversation_history(self, user_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get conversation history."""
@@ -380,12 +573,14 @@ class LoggingModule:
         if not conversation_file.exists():
             return []
 
-        history = []
-        with open(conversation_file, 'r') as f:
-            for line in f:
-                history.append(json.loads(line))
+        self._flush_jsonl(conversation_file)
 
         if limit:
-            history = history[-limit:]
+            return [orjson.loads(line) for line in self._tail_jsonl(conversation_file, limit)]
+
+        history = []
+        with open(conversation_file, 'rb') as f:
+            for line in f:
+                history.append(orjson.loads(line))
 
         return history
@@ -9,7 +9,12 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import chromadb
 from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
+from .embeddings import get_embedding_model
+
+
+# Documents per forward pass when indexing. SentenceTransformer.encode
+# already sorts each call's inputs by length, so batches pad little.
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
 
 
 @dataclass
@@ -68,8 +73,8 @@ class RAGModule:
             )
         )
 
-        # Initialize embedding model
-        self.embedding_model = SentenceTransformer(embedding_model)
+        # Shared embedding model (loaded once per process)
+        self.embedding_model = get_embedding_model(embedding_model)
         self.collection_name = collection_name
 
         # Get or create collection
@@ -114,7 +119,12 @@ class RAGModule:
             metadatas[i]["source"] = source
 
         # Generate embeddings
-        embeddings = self.embedding_model.encode(documents).tolist()
+        embeddings = self.embedding_model.encode(
+            documents,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).tolist()
 
         # Add to collection
         self.collection.add(
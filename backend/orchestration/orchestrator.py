@@ -118,9 +118,33 @@ class Orchestrator:
             Response message for user
         """
 
+        response, _ = self.process_user_message_with_state(user_id, message, room_id)
+        return response
+
+    def process_user_message_with_state(
+        self,
+        user_id: str,
+        message: str,
+        room_id: Optional[str] = None
+    ) -> Tuple[str, Optional[UserState]]:
+        """
+        Process a user message and also return the updated user state.
+
+        Lets callers that need the new state (e.g. the chat endpoint) avoid
+        reloading it from storage.
+
+        Args:
+            user_id: User ID
+            message: User's message
+            room_id: Optional room ID for conversation separation
+
+        Returns:
+            (response message for user, saved user state or None on error)
+        """
+
         try:
             # Create state key - use composite key if room_id provided
-            state_key = f"{user_id}_{room_id}" if room_id else user_id
+            state_key = UserState.make_key(user_id, room_id)
 
             # Log user message
             self.logging_module.log_user_message(state_key, message)
@@ -144,11 +168,11 @@ class Orchestrator:
                 response
             )
 
-            return response
+            return response, user_state
 
         except Exception as e:
             logger.error("Error processing message", user_id=user_id, room_id=room_id, error=str(e))
-            return f"I encountered an error processing your message. Please try again. Error: {str(e)}"
+            return f"I encountered an error processing your message. Please try again. Error: {str(e)}", None
 
     def _create_new_user_state(self, state_key: str, user_id: str, room_id: Optional[str] = None) -> UserState:
         """Create new user state.
@@ -281,7 +305,8 @@ class Orchestrator:
                 target_role=user_state.target_role,
                 target_domain=user_state.target_domain,
                 background=user_state.background,
-                interests=user_state.interests
+                interests=user_state.interests,
+                previous_proposals=user_state.context.get("rejected_proposals", [])
             )
 
             output = self.project_generator.process(project_input)
@@ -320,6 +345,11 @@ class Orchestrator:
                 return self._transition_to_problem_definition(user_state)
 
             elif parsed["approved"] is False:
+                # Remember the rejected proposal so the next one differs
+                rejected = self.logging_module.load_project(user_state.user_id, user_state.project_id)
+                if rejected:
+                    user_state.context.setdefault("rejected_proposals", []).append(rejected.proposal.title)
+
                 # Generate new proposal
                 user_state.project_id = None
                 self.logging_module.save_user_state(user_state)
@@ -793,8 +823,7 @@ Only return the JSON object, nothing else."""
             return "I had trouble creating your execution plan. Let me try again..."
 
         # Save milestones
-        for milestone in coach_output.milestones:
-            self.logging_module.save_milestone(milestone)
+        self.logging_module.save_milestones(coach_output.milestones)
 
         # Update state
         user_state.context["execution_plan_created"] = True
@@ -1041,9 +1070,8 @@ Only return the JSON object, nothing else."""
             reason=reason
         )
 
-        # Construct state key for logging
-        state_key = f"{user_state.user_id}_{user_state.room_id}" if user_state.room_id else user_state.user_id
-        self.logging_module.log_state_transition(transition, state_key)
+        # Log under the state key (room-specific if room_id is set)
+        self.logging_module.log_state_transition(transition, user_state.state_key)
 
         # Update state
         user_state.previous_state = user_state.current_state
@@ -17,6 +17,8 @@ from .agent_io import (
     ExecutionCoachOutput,
     ReviewerInput,
     ReviewerOutput,
+    MainChatInput,
+    MainChatOutput,
 )
 
 __all__ = [
@@ -51,4 +53,6 @@ __all__ = [
     "ExecutionCoachOutput",
     "ReviewerInput",
     "ReviewerOutput",
+    "MainChatInput",
+    "MainChatOutput",
 ]
@@ -3,12 +3,14 @@ Agent input/output schemas.
 Each agent has explicit input and output contracts.
 """
 
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from .project import ProjectType, ProjectProposal
 from .problem_solution import ProblemDefinition, SolutionDesign
 from .execution import Milestone, MilestoneStatus
-from .review import ArtifactReview, ResumeBullet
+from .review import ArtifactReview, ArtifactSubmission, ResumeBullet
 
 
 # ============================================================================
@@ -66,7 +68,7 @@ class ProjectGeneratorInput(AgentInput):
 
     previous_proposals: List[str] = Field(
         default_factory=list,
-        description="IDs of previously rejected proposals (to avoid duplicates)"
+        description="Titles of previously rejected proposals (to avoid duplicates)"
     )
 
 
@@ -174,6 +176,11 @@ class ExecutionCoachInput(AgentInput):
         description="Action type: 'create_plan', 'update_progress', 'get_next_action'"
     )
 
+    interactive: bool = Field(
+        True,
+        description="False for background jobs that can go through the Batch API"
+    )
+
     # For plan creation
     problem_definition: Optional[ProblemDefinition] = None
     solution_design: Optional[SolutionDesign] = None
@@ -187,6 +194,21 @@ class ExecutionCoachInput(AgentInput):
     completed_milestones: List[str] = Field(default_factory=list)
     all_milestones: List[Milestone] = Field(default_factory=list)
 
+    @cached_property
+    def milestones_by_id(self) -> Dict[str, Milestone]:
+        """Index of all_milestones by milestone_id."""
+
+        return {m.milestone_id: m for m in self.all_milestones}
+
+    @cached_property
+    def first_not_started(self) -> Optional[Milestone]:
+        """First milestone in all_milestones that has not been started."""
+
+        return next(
+            (m for m in self.all_milestones if m.status == MilestoneStatus.NOT_STARTED),
+            None
+        )
+
 
 class ExecutionCoachOutput(AgentOutput):
     """
@@ -233,15 +255,6 @@ class ExecutionCoachOutput(AgentOutput):
 # Reviewer & Resume Agent
 # ============================================================================
 
-class ArtifactSubmission(BaseModel):
-    """A submitted artifact for review."""
-
-    artifact_type: str
-    artifact_url: Optional[str] = None
-    artifact_description: str
-    file_name: Optional[str] = None
-
-
 class ReviewerInput(AgentInput):
     """
     Input for Reviewer & Resume agent.
@@ -308,3 +321,27 @@ class ReviewerOutput(AgentOutput):
         ...,
         description="What the user should do next with this feedback"
     )
+
+
+# ============================================================================
+# Main Chat Agent
+# ============================================================================
+
+# Main chat runs on every user turn and never calls the LLM, so its I/O
+# uses slotted dataclasses rather than validated pydantic models.
+
+@dataclass(slots=True)
+class MainChatInput:
+    """Input for Main Chat agent: which message to render, and its context."""
+
+    message_type: str = ""
+    context: Dict[str, Any] = field(default_factory=dict)
+    custom_message: Optional[str] = None
+
+
+@dataclass(slots=True)
+class MainChatOutput:
+    """Output from Main Chat agent."""
+
+    message: str
+    message_type: str
@@ -13,6 +13,7 @@ class ProjectType(str, Enum):
     PRODUCT = "product"  # Product spec, feature design, prototype
     CAMPAIGN = "campaign"  # Marketing campaign, content strategy
     STARTUP = "startup"  # Business plan, MVP, go-to-market
+    MARKETING = "marketing"  # Growth strategy, positioning, channel experiments
 
 
 class DeliverableType(BaseModel):
@@ -66,6 +66,18 @@ class UserState(BaseModel):
     class Config:
         use_enum_values = True
 
+    @staticmethod
+    def make_key(user_id: str, room_id: Optional[str] = None) -> str:
+        """Storage key for a user's state: "<user_id>_<room_id>" in a room, else the user ID."""
+
+        return f"{user_id}_{room_id}" if room_id else user_id
+
+    @property
+    def state_key(self) -> str:
+        """Storage key for this state."""
+
+        return self.make_key(self.user_id, self.room_id)
+
 
 class StateTransition(BaseModel):
     """Represents a state transition decision."""
@@ -34,10 +34,17 @@ print("\nPress Ctrl+C to stop the server\n")
 # Run uvicorn
 import uvicorn
 
+# uvloop and httptools ship with uvicorn[standard]. Auto-reload is for
+# development only (and runs a single worker).
+# WEB_CONCURRENCY > 1 also turns off LoggingModule's per-process user
+# state cache, since several workers share the same state files.
 uvicorn.run(
     "backend.api.main:app",
     host="0.0.0.0",
     port=8000,
-    reload=True,
+    loop="uvloop",
+    http="httptools",
+    workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    reload=os.getenv("ENVIRONMENT", "development") == "development",
     log_level="info"
 )
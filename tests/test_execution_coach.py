@@ -0,0 +1,146 @@
+"""
+Tests for ExecutionCoachAgent action dispatch and milestone streaming.
+
+Run with: pytest tests/test_execution_coach.py
+"""
+
+import asyncio
+import json
+
+import pytest
+from backend.agents.execution_coach import ExecutionCoachAgent, MilestoneStreamParser
+from backend.schemas.agent_io import ExecutionCoachInput
+from backend.schemas.execution import Milestone
+
+
+PROGRESS_RESPONSE = json.dumps({
+    "status": "in_progress",
+    "stagnation_detected": False,
+    "stagnation_reason": None,
+    "acknowledgment": "Nice progress.",
+    "next_action": "Draft the interview script",
+    "feedback": "Keep going.",
+    "tips": ["Timebox it"]
+})
+
+
+PLAN_RESPONSE = """## Overview
+A three-step plan.
+
+### Milestone 1: Customer interviews
+Description: Talk to five target users
+Deliverable: Interview notes
+Estimated Days: 3
+Next Action: Book the first interview
+
+### Milestone 2: Prototype
+Description: Build a clickable prototype
+Deliverable: Figma link
+Estimated Days: 4.5
+Next Action: Sketch the main screen
+
+### Milestone 3: Launch plan
+Description: Plan the pilot
+Deliverable: One-page launch plan
+Estimated Days: 12
+Next Action: List pilot users
+"""
+
+
+def chunked(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture
+def agent():
+    return ExecutionCoachAgent(openai_api_key="test-key")
+
+
+def progress_input(**overrides) -> ExecutionCoachInput:
+    milestone = Milestone(
+        milestone_id="ms_1",
+        project_id="proj_1",
+        user_id="user_1",
+        title="Customer interviews",
+        description="Talk to five users",
+        deliverable="Interview notes",
+        order=1,
+        estimated_days=3
+    )
+    fields = {
+        "user_id": "user_1",
+        "request_id": "req_1",
+        "project_id": "proj_1",
+        "action": "update_progress",
+        "current_milestone_id": "ms_1",
+        "progress_update": "Booked three interviews",
+        "all_milestones": [milestone]
+    }
+    fields.update(overrides)
+    return ExecutionCoachInput(**fields)
+
+
+class TestActionDispatch:
+    """process, aprocess and process_many share one action table."""
+
+    def test_process(self, agent, monkeypatch):
+        monkeypatch.setattr(ExecutionCoachAgent, "call_claude", lambda self, **kwargs: PROGRESS_RESPONSE)
+
+        output = agent.process(progress_input())
+
+        assert output.success
+        assert output.next_action == "Draft the interview script"
+
+    def test_aprocess(self, agent, monkeypatch):
+        async def fake_acall(self, **kwargs):
+            return PROGRESS_RESPONSE
+
+        monkeypatch.setattr(ExecutionCoachAgent, "acall_llm", fake_acall)
+
+        output = asyncio.run(agent.aprocess(progress_input()))
+
+        assert output.success
+        assert output.next_action == "Draft the interview script"
+
+    def test_process_many(self, agent, monkeypatch):
+        monkeypatch.setattr(
+            ExecutionCoachAgent, "call_llm_batched", lambda self, requests: [PROGRESS_RESPONSE] * len(requests)
+        )
+
+        outputs = agent.process_many([
+            progress_input(interactive=False),
+            progress_input(action="get_next_action"),
+            progress_input(interactive=False, current_milestone_id="ms_missing")
+        ])
+
+        assert [output.action for output in outputs] == ["update_progress", "get_next_action", "update_progress"]
+        assert [output.success for output in outputs] == [True, True, False]
+
+    def test_invalid_action(self, agent):
+        output = agent.process(progress_input(action="unknown"))
+
+        assert not output.success
+        assert "Invalid action" in output.feedback
+
+
+class TestMilestoneStreamParser:
+    """Milestones parse the same however the response is chunked."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(PLAN_RESPONSE)])
+    def test_chunk_boundaries(self, chunk_size):
+        parser = MilestoneStreamParser("proj_1", "user_1")
+        milestones = []
+        for chunk in chunked(PLAN_RESPONSE, chunk_size):
+            milestones.extend(parser.feed(chunk))
+        milestones.extend(parser.close())
+
+        assert [m.title for m in milestones] == ["Customer interviews", "Prototype", "Launch plan"]
+        assert [m.estimated_days for m in milestones] == [3.0, 4.5, 7.0]
+        assert milestones[1].next_action == "Sketch the main screen"
+
+    def test_milestone_completes_when_next_header_arrives(self):
+        parser = MilestoneStreamParser("proj_1", "user_1")
+        first_header = PLAN_RESPONSE.index("### Milestone 2")
+
+        assert parser.feed(PLAN_RESPONSE[:first_header]) == []
+        assert [m.title for m in parser.feed("### Milestone 2: Prototype\n")] == ["Customer interviews"]
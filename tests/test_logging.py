@@ -0,0 +1,127 @@
+"""
+Tests for LoggingModule persistence.
+
+Run with: pytest tests/test_logging.py
+"""
+
+import time
+
+import orjson
+import pytest
+from backend.modules import logging as logging_module
+from backend.modules.logging import LoggingModule
+from backend.schemas.state import StateType, UserState
+
+
+@pytest.fixture
+def logs(tmp_path, monkeypatch):
+    """LoggingModule with a short flush interval, closed after the test."""
+
+    monkeypatch.setattr(logging_module, "JSONL_FLUSH_INTERVAL_SECONDS", 0.05)
+    module = LoggingModule(storage_dir=str(tmp_path))
+    yield module
+    module.close()
+
+
+def read_lines(path):
+    """Read a JSONL file directly, bypassing the module's own flush-before-read."""
+
+    with open(path, 'rb') as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+class TestBufferedJsonl:
+    """Test the kept-open, buffered JSONL writers."""
+
+    def test_line_reaches_disk_without_further_writes(self, logs, tmp_path):
+        logs.log_user_message("user_1", "hello")
+
+        conversation_file = tmp_path / "user_1" / "conversation.jsonl"
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline and not read_lines(conversation_file):
+            time.sleep(0.02)
+
+        assert [entry["message"] for entry in read_lines(conversation_file)] == ["hello"]
+
+    def test_close_flushes_pending_lines(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(logging_module, "JSONL_FLUSH_INTERVAL_SECONDS", 3600)
+        module = LoggingModule(storage_dir=str(tmp_path))
+
+        module.log_user_message("user_1", "hello")
+        module.close()
+
+        assert len(read_lines(tmp_path / "user_1" / "conversation.jsonl")) == 1
+
+
+class TestTailJsonl:
+    """Test reading the end of a conversation log."""
+
+    @pytest.fixture
+    def history(self, logs, monkeypatch):
+        # A window smaller than the log forces the reader to grow it
+        monkeypatch.setattr(logging_module, "TAIL_READ_WINDOW", 64)
+        for i in range(50):
+            logs.log_user_message("user_1", f"message {i}")
+        return logs
+
+    def test_limit_returns_last_lines(self, history):
+        tail = history.get_conversation_history("user_1", limit=7)
+
+        assert [entry["message"] for entry in tail] == [f"message {i}" for i in range(43, 50)]
+
+    def test_limit_beyond_file_returns_everything(self, history):
+        tail = history.get_conversation_history("user_1", limit=500)
+
+        assert tail == history.get_conversation_history("user_1")
+        assert len(tail) == 50
+
+
+class TestUserStateCache:
+    """Test the in-memory LRU in front of state.json."""
+
+    @pytest.fixture
+    def small_cache(self, logs, monkeypatch):
+        monkeypatch.setattr(logging_module, "USER_STATE_CACHE_MAX_SIZE", 2)
+        return logs
+
+    def save_state(self, logs, user_id):
+        logs.save_user_state(UserState(user_id=user_id, current_state=StateType.ONBOARDING))
+
+    def test_least_recently_used_state_is_evicted(self, small_cache):
+        self.save_state(small_cache, "user_a")
+        self.save_state(small_cache, "user_b")
+        small_cache.load_user_state("user_a")
+        self.save_state(small_cache, "user_c")
+
+        assert list(small_cache._state_cache) == ["user_a", "user_c"]
+
+    def test_evicted_state_reloads_from_disk(self, small_cache):
+        for user_id in ["user_a", "user_b", "user_c"]:
+            self.save_state(small_cache, user_id)
+
+        state = small_cache.load_user_state("user_a")
+
+        assert state.user_id == "user_a"
+        assert "user_a" in small_cache._state_cache
+
+    def test_unsaved_changes_do_not_leak_into_cache(self, small_cache):
+        self.save_state(small_cache, "user_a")
+
+        state = small_cache.load_user_state("user_a")
+        state.target_role = "Product Manager"
+
+        assert small_cache.load_user_state("user_a").target_role is None
+
+    def test_cache_disabled_reads_state_from_disk(self, logs, tmp_path, monkeypatch):
+        # As when WEB_CONCURRENCY > 1: another worker may have written state.json
+        monkeypatch.setattr(logging_module, "USER_STATE_CACHE_ENABLED", False)
+        self.save_state(logs, "user_a")
+
+        other_worker = LoggingModule(storage_dir=str(tmp_path))
+        state = other_worker.load_user_state("user_a")
+        state.target_role = "Product Manager"
+        other_worker.save_user_state(state)
+        other_worker.close()
+
+        assert logs.load_user_state("user_a").target_role == "Product Manager"
+        assert not logs._state_cache
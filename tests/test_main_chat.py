@@ -0,0 +1,47 @@
+"""
+Tests for MainChatAgent message rendering.
+
+Run with: pytest tests/test_main_chat.py
+"""
+
+import pytest
+from backend.agents.main_chat import MainChatAgent
+from backend.schemas.execution import Milestone
+
+
+@pytest.fixture
+def agent():
+    return MainChatAgent(openai_api_key="test-key")
+
+
+def make_milestone(order: int, estimated_days: float) -> Milestone:
+    return Milestone(
+        milestone_id=f"ms_{order}",
+        project_id="proj_1",
+        user_id="user_1",
+        title=f"Milestone {order}",
+        description="Do the work",
+        deliverable="A document",
+        order=order,
+        estimated_days=estimated_days,
+        next_action=f"Start milestone {order}"
+    )
+
+
+class TestExecutionPlanMessage:
+    """Test the execution plan presentation."""
+
+    def test_totals_days_and_names_first_milestone(self, agent):
+        milestones = [make_milestone(1, 2), make_milestone(2, 3.5)]
+
+        message = agent.generate_message("execution_plan", {"milestones": milestones, "feedback": "Good plan."})
+
+        assert "**Total Estimated Time:** 5.5 days" in message
+        assert "Your first milestone is: **Milestone 1**" in message
+        assert "**Your next action:** Start milestone 1" in message
+
+    def test_empty_plan_renders_without_first_milestone(self, agent):
+        message = agent.generate_message("execution_plan", {"milestones": []})
+
+        assert "**Total Estimated Time:** 0 days" in message
+        assert "Ready to start?" not in message
@@ -0,0 +1,168 @@
+"""
+Tests for ProblemSolutionTutorAgent response parsing and batching.
+
+Run with: pytest tests/test_problem_solution_tutor.py
+"""
+
+import pytest
+from backend.agents.problem_solution_tutor import ProblemSolutionTutorAgent
+from backend.schemas.agent_io import ProblemSolutionTutorInput
+from backend.schemas.problem_solution import ProblemDefinition
+
+
+SCORES_RESPONSE = """# EVALUATION SCORES
+Market Relevance: {score}
+Clarity: {score}
+Feasibility: {score}
+
+# OVERALL FEEDBACK
+Evaluated.
+"""
+
+
+@pytest.fixture
+def agent():
+    return ProblemSolutionTutorAgent(openai_api_key="test-key")
+
+
+def problem_input(statement: str, mode: str = "problem") -> ProblemSolutionTutorInput:
+    return ProblemSolutionTutorInput(
+        user_id="user_1",
+        request_id=f"req_{statement}",
+        project_id="proj_1",
+        mode=mode,
+        problem_definition=ProblemDefinition(
+            problem_id="prob_1",
+            project_id="proj_1",
+            user_id="user_1",
+            problem_statement=statement,
+            target_audience="Students",
+            problem_context="Budgeting is hard",
+            success_metrics=["Retention"]
+        )
+    )
+
+
+def parse_scores(agent, response: str, mode: str = "problem"):
+    return agent._parse_scores(agent._parse_sections(response), mode)
+
+
+class TestParseScores:
+    """Test score parsing across the heading and label variants models produce."""
+
+    def test_documented_format(self, agent):
+        response = """# EVALUATION SCORES
+Market Relevance: 8
+Clarity: 7.5
+Feasibility: 9/10
+"""
+
+        assert parse_scores(agent, response) == {
+            "market_relevance": 8.0,
+            "clarity": 7.5,
+            "feasibility": 9.0
+        }
+
+    def test_heading_with_trailing_colon(self, agent):
+        response = """## EVALUATION SCORES:
+Market Relevance: 8
+Clarity: 7
+Feasibility: 6
+"""
+
+        assert parse_scores(agent, response)["market_relevance"] == 8.0
+
+    def test_bold_heading_and_numbered_labels(self, agent):
+        response = """**EVALUATION SCORES**
+1. Market Relevance: 8
+2. **Clarity**: 7
+3. Feasibility: 6
+
+**Strengths:**
+- Clear audience
+"""
+
+        sections = agent._parse_sections(response)
+
+        assert agent._parse_scores(sections, "problem") == {
+            "market_relevance": 8.0,
+            "clarity": 7.0,
+            "feasibility": 6.0
+        }
+        assert agent._parse_strengths(sections) == ["Clear audience"]
+
+    def test_missing_section_falls_back_to_all_lines(self, agent):
+        response = """Here is my evaluation.
+
+Logical Coherence: 8
+Innovation: 6
+Implementation Feasibility: 7
+Impact Potential: 9
+
+# OVERALL FEEDBACK
+Strong design.
+"""
+
+        assert parse_scores(agent, response, "solution") == {
+            "logical_coherence": 8.0,
+            "innovation": 6.0,
+            "implementation_feasibility": 7.0,
+            "impact_potential": 9.0
+        }
+
+    def test_missing_scores_default_and_values_are_clamped(self, agent):
+        response = """# EVALUATION SCORES
+Market Relevance: 12
+"""
+
+        assert parse_scores(agent, response) == {
+            "market_relevance": 10.0,
+            "clarity": 5.0,
+            "feasibility": 5.0
+        }
+
+
+class TestParseSections:
+    """Test splitting a response into sections."""
+
+    def test_bold_score_line_is_not_a_heading(self, agent):
+        sections = agent._parse_sections("# EVALUATION SCORES\n**Clarity: 8**\n")
+
+        assert sections["EVALUATION SCORES"] == ["**Clarity: 8**"]
+
+
+class TestProcessMany:
+    """Test batched evaluation through BaseAgent._process_batched."""
+
+    def test_outputs_keep_input_order_and_failures_get_error_envelopes(self, agent, monkeypatch):
+        def fake_batched(self, requests):
+            # Score each submission by its position; the second response is missing
+            responses = [SCORES_RESPONSE.format(score=i + 6) for i in range(len(requests))]
+            responses[1] = None
+            return responses
+
+        monkeypatch.setattr(ProblemSolutionTutorAgent, "call_llm_batched", fake_batched)
+
+        outputs = agent.process_many([
+            problem_input("first"),
+            problem_input("bad mode", mode="unknown"),
+            problem_input("second"),
+            problem_input("third")
+        ])
+
+        assert [output.request_id for output in outputs] == ["req_first", "req_bad mode", "req_second", "req_third"]
+        assert [output.success for output in outputs] == [True, False, False, True]
+        assert outputs[0].scores["clarity"] == 6.0
+        assert outputs[3].scores["clarity"] == 8.0
+        assert "Invalid mode" in outputs[1].overall_feedback
+
+    def test_failed_batch_fails_every_batched_input(self, agent, monkeypatch):
+        def failing_batched(self, requests):
+            raise RuntimeError("batch expired")
+
+        monkeypatch.setattr(ProblemSolutionTutorAgent, "call_llm_batched", failing_batched)
+
+        outputs = agent.process_many([problem_input("first"), problem_input("second")])
+
+        assert [output.success for output in outputs] == [False, False]
+        assert all("batch expired" in output.overall_feedback for output in outputs)
@@ -0,0 +1,257 @@
+"""
+Tests for ProjectGeneratorAgent proposal caching, regeneration and streaming.
+
+Run with: pytest tests/test_project_generator.py
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from backend.agents import project_generator
+from backend.agents.base import SemanticCache
+from backend.agents.project_generator import ProjectGeneratorAgent, ProposalStreamParser
+from backend.modules.logging import LoggingModule
+from backend.orchestration.orchestrator import Orchestrator
+from backend.schemas.agent_io import ProjectGeneratorInput
+
+
+class ConstantEmbeddingModel:
+    """Embeds every text to the same vector, so only exact cache keys tell requests apart."""
+
+    def encode(self, text, normalize_embeddings=False):
+        return np.ones(4) / 2.0
+
+
+class FakeRAGModule:
+    """RAG module stand-in with a fixed embedding model and one canned retrieval."""
+
+    embedding_model = ConstantEmbeddingModel()
+
+    def retrieve(self, query, top_k=5, domain_filter=None):
+        return SimpleNamespace(context_summary="Payments basics", sources=["fintech.md"])
+
+
+class FakeCompletions:
+    """Stands in for client.chat.completions, returning a fixed response."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def fake_client(content: str) -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(content)))
+
+
+def proposal_json(title: str) -> str:
+    """A minimal valid proposal response."""
+
+    return json.dumps({
+        "title": title,
+        "project_type": "product",
+        "description": f"{title} description",
+        "why_relevant": "Relevant to the role",
+        "deliverables": [{"name": "Spec", "description": "A product spec"}],
+        "estimated_duration_weeks": 2,
+        "skills_demonstrated": ["Prioritization"],
+        "recruiter_appeal": "Shows product sense",
+        "evaluation_criteria": ["Clarity"],
+        "reasoning": "Fits the profile",
+        "alternative_options": []
+    })
+
+
+def chunked(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture(autouse=True)
+def fresh_proposal_cache(monkeypatch):
+    """Isolate the module-level proposal cache per test."""
+
+    monkeypatch.setattr(project_generator, "_proposal_cache", SemanticCache(16, 3600, 0.92))
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """Replace LLM generation with numbered proposals; returns the inputs seen."""
+
+    seen = []
+
+    def fake_generate(self, input_data):
+        seen.append(input_data)
+        return proposal_json(f"Proposal {len(seen)}")
+
+    monkeypatch.setattr(ProjectGeneratorAgent, "_generate_response", fake_generate)
+    monkeypatch.setattr(ProjectGeneratorAgent, "_cached_domain_context", lambda self, input_data: "")
+    return seen
+
+
+@pytest.fixture
+def agent():
+    return ProjectGeneratorAgent(rag_module=FakeRAGModule(), openai_api_key="test-key")
+
+
+def make_input(**overrides) -> ProjectGeneratorInput:
+    fields = {
+        "user_id": "user_1",
+        "request_id": "req_1",
+        "target_role": "Product Manager",
+        "target_domain": "FinTech"
+    }
+    fields.update(overrides)
+    return ProjectGeneratorInput(**fields)
+
+
+class TestProposalCache:
+    """Test the semantic proposal cache."""
+
+    def test_same_profile_hits_cache(self, agent, generated):
+        first = agent.process(make_input())
+        second = agent.process(make_input(user_id="user_2"))
+
+        assert len(generated) == 1
+        assert second.proposal.title == first.proposal.title
+
+    def test_different_role_or_domain_misses_cache(self, agent, generated):
+        agent.process(make_input())
+        other_domain = agent.process(make_input(target_domain="Healthcare"))
+        other_role = agent.process(make_input(target_role="Data Analyst"))
+
+        assert len(generated) == 3
+        assert other_domain.proposal.title == "Proposal 2"
+        assert other_role.proposal.title == "Proposal 3"
+
+    def test_cached_proposal_is_not_rewritten(self, agent, generated):
+        agent.process(make_input(target_role="PM", target_domain="AI"))
+        cached = agent.process(make_input(target_role="pm", target_domain="ai"))
+
+        assert len(generated) == 1
+        assert cached.proposal.description == "Proposal 1 description"
+
+    def test_rejected_proposals_bypass_cache(self, agent, generated):
+        first = agent.process(make_input())
+        second = agent.process(make_input(previous_proposals=[first.proposal.title]))
+
+        assert len(generated) == 2
+        assert second.proposal.title != first.proposal.title
+
+
+class TestProcessEndToEnd:
+    """Run process() through the real request building and call_llm path."""
+
+    def test_process_with_mocked_openai_client(self, agent, monkeypatch):
+        monkeypatch.setattr(agent, "client", fake_client(proposal_json("Payments dashboard")))
+
+        output = agent.process(make_input())
+
+        assert output.success
+        assert output.proposal.title == "Payments dashboard"
+
+        (request,) = agent.client.chat.completions.calls
+        assert request["response_format"] == project_generator.PROJECT_PROPOSAL_RESPONSE_FORMAT
+        assert "Payments basics" in request["messages"][-1]["content"]
+
+
+class TestGenerationErrors:
+    """A failed generation comes back as a success=False output on every entry point."""
+
+    @pytest.fixture
+    def failing(self, monkeypatch):
+        def fail(self, *args, **kwargs):
+            raise RuntimeError("upstream unavailable")
+
+        monkeypatch.setattr(ProjectGeneratorAgent, "_generate_response", fail)
+        monkeypatch.setattr(ProjectGeneratorAgent, "_generation_request", fail)
+        monkeypatch.setattr(ProjectGeneratorAgent, "_cached_domain_context", lambda self, input_data: "")
+
+    def test_process(self, agent, failing):
+        output = agent.process(make_input())
+
+        assert not output.success
+        assert "upstream unavailable" in output.message
+
+    def test_aprocess_many(self, agent, failing):
+        outputs = asyncio.run(agent.aprocess_many([make_input(), make_input(user_id="user_2")]))
+
+        assert [output.success for output in outputs] == [False, False]
+
+    def test_stream_proposal(self, agent, failing):
+        outputs = list(agent.stream_proposal(make_input()))
+
+        assert len(outputs) == 1
+        assert not outputs[0].success
+
+
+class TestCallLlm:
+    """The generator must not shadow BaseAgent's LLM call plumbing."""
+
+    def test_call_llm_returns_completion(self, agent, monkeypatch):
+        monkeypatch.setattr(agent, "client", fake_client("hello"))
+
+        assert agent.call_llm("system", "user") == "hello"
+        assert len(agent.client.chat.completions.calls) == 1
+
+
+class TestProposalRejection:
+    """Test regenerating a proposal after the user rejects it."""
+
+    def test_rejecting_returns_a_different_proposal(self, tmp_path, generated):
+        orchestrator = Orchestrator(
+            rag_module=FakeRAGModule(),
+            logging_module=LoggingModule(storage_dir=str(tmp_path)),
+            openai_api_key="test-key"
+        )
+        user_id = "reject_user"
+
+        for message in ["Product Manager", "FinTech", "Economics graduate", "Payments"]:
+            orchestrator.process_user_message(user_id, message)
+
+        first_project_id = orchestrator.logging_module.load_user_state(user_id).project_id
+        first = orchestrator.logging_module.load_project(user_id, first_project_id)
+
+        orchestrator.process_user_message(user_id, "No")
+
+        state = orchestrator.logging_module.load_user_state(user_id)
+        second = orchestrator.logging_module.load_project(user_id, state.project_id)
+
+        assert state.project_id != first_project_id
+        assert second.proposal.title != first.proposal.title
+        assert generated[-1].previous_proposals == [first.proposal.title]
+
+
+class TestProposalStreamParser:
+    """Top-level fields parse the same however the response is chunked."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 10_000])
+    def test_chunk_boundaries(self, chunk_size):
+        # Braces, brackets, commas and escaped quotes inside strings must not split fields
+        response = json.dumps({
+            **json.loads(proposal_json("Budget {app}, \"v2\"")),
+            "reasoning": "Covers [payments], {ledgers} and \\ escapes"
+        }, indent=2)
+
+        parser = ProposalStreamParser()
+        fields = {}
+        for chunk in chunked(response, chunk_size):
+            fields.update(parser.feed(chunk))
+
+        assert fields == json.loads(response)
+
+    def test_fields_arrive_as_soon_as_they_complete(self):
+        parser = ProposalStreamParser()
+
+        assert parser.feed('{"title": "Budget app", "descr') == {"title": "Budget app"}
+        assert parser.feed('iption": "Track spend"') == {}
+        assert parser.feed(', "deliverables": [{"name": "Spec"}]}') == {
+            "description": "Track spend",
+            "deliverables": [{"name": "Spec"}]
+        }
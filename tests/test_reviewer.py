@@ -0,0 +1,197 @@
+"""
+Tests for ReviewerAgent review handling and response parsing.
+
+Run with: pytest tests/test_reviewer.py
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from backend.agents.reviewer import ReviewerAgent, SectionStreamParser
+from backend.schemas.agent_io import ArtifactSubmission, ReviewerInput
+
+
+REVIEW_RESPONSE = """# ARTIFACT REVIEW
+
+## Overall Assessment
+Solid, well-scoped work with clear reasoning.
+
+## Overall Score
+8
+
+## Criterion Scores
+Clarity: 8
+Impact: 7
+
+## Criterion Feedback
+### Clarity
+Easy to follow.
+
+### Impact
+Metrics are plausible.
+
+## Strengths
+- Clear problem framing
+- Concrete metrics
+
+## Areas for Improvement
+- Add user interviews
+
+## Recruiter Appeal
+Recruiters would see strong product sense.
+
+## Skills Demonstrated
+- Prioritization
+- Data analysis
+
+## Next Steps
+Polish the deck.
+"""
+
+
+def chunked(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class ConstantEmbeddingModel:
+    """Embeds every text to the same vector."""
+
+    def encode(self, text, normalize_embeddings=False):
+        return np.ones(4) / 2.0
+
+
+class FakeRAGModule:
+    """RAG module stand-in with a fixed embedding model and no documents."""
+
+    embedding_model = ConstantEmbeddingModel()
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    """Replace review generation with a fixed response; returns the prompts seen."""
+
+    calls = []
+
+    def fake_call(self, system_prompt, user_prompt, **kwargs):
+        calls.append(user_prompt)
+        return REVIEW_RESPONSE
+
+    monkeypatch.setattr(ReviewerAgent, "call_claude", fake_call)
+    return calls
+
+
+@pytest.fixture
+def agent():
+    return ReviewerAgent(rag_module=FakeRAGModule(), openai_api_key="test-key")
+
+
+def review_input(user_id: str, artifact_url: str) -> ReviewerInput:
+    return ReviewerInput(
+        user_id=user_id,
+        request_id=f"req_{user_id}",
+        project_id=f"proj_{user_id}",
+        action="review_artifacts",
+        submitted_artifacts=[
+            ArtifactSubmission(
+                artifact_type="document",
+                artifact_url=artifact_url,
+                artifact_description="Product spec for a budgeting app"
+            )
+        ]
+    )
+
+
+class TestReviewCaching:
+    """Reviews must never be shared between users or artifact revisions."""
+
+    def test_similar_artifacts_from_different_users_are_reviewed_separately(self, agent, llm_calls):
+        first = agent.process(review_input("user_a", "https://example.com/a.pdf"))
+        second = agent.process(review_input("user_b", "https://example.com/b.pdf"))
+
+        assert first.success and second.success
+        assert len(llm_calls) == 2
+
+    def test_revised_artifacts_are_reviewed_again(self, agent, llm_calls):
+        agent.process(review_input("user_a", "https://example.com/v1.pdf"))
+        agent.process(review_input("user_a", "https://example.com/v2.pdf"))
+
+        assert len(llm_calls) == 2
+
+
+class TestReviewParsing:
+    """Test parsing review responses into an ArtifactReview."""
+
+    def test_documented_format(self, agent):
+        sections = agent._parse_sections(REVIEW_RESPONSE)
+        review = agent._parse_review(sections, review_input("user_a", "https://example.com/a.pdf"))
+
+        assert review.overall_score == 8.0
+        assert review.criterion_scores == {"Clarity": 8.0, "Impact": 7.0}
+        assert review.strengths == ["Clear problem framing", "Concrete metrics"]
+
+    def test_headings_with_qualifiers_match_by_prefix(self, agent):
+        response = (
+            REVIEW_RESPONSE
+            .replace("## Overall Score", "## Overall Score (0-10)")
+            .replace("## Criterion Scores", "## Criterion Scores (each 0-10)")
+            .replace("## Strengths", "## Strengths:")
+        )
+
+        sections = agent._parse_sections(response)
+        review = agent._parse_review(sections, review_input("user_a", "https://example.com/a.pdf"))
+
+        assert review.overall_score == 8.0
+        assert review.criterion_scores == {"Clarity": 8.0, "Impact": 7.0}
+        assert review.strengths == ["Clear problem framing", "Concrete metrics"]
+
+
+class TestActionDispatch:
+    """process, aprocess and process_many share one action table."""
+
+    def test_aprocess(self, agent, monkeypatch):
+        async def fake_acall(self, **kwargs):
+            return REVIEW_RESPONSE
+
+        monkeypatch.setattr(ReviewerAgent, "acall_llm", fake_acall)
+
+        output = asyncio.run(agent.aprocess(review_input("user_a", "https://example.com/a.pdf")))
+
+        assert output.success
+        assert output.review.overall_score == 8.0
+
+    def test_process_many(self, agent, monkeypatch):
+        monkeypatch.setattr(
+            ReviewerAgent, "call_llm_batched", lambda self, requests: [REVIEW_RESPONSE] * len(requests)
+        )
+        invalid = review_input("user_b", "https://example.com/b.pdf").model_copy(update={"action": "unknown"})
+
+        outputs = agent.process_many([review_input("user_a", "https://example.com/a.pdf"), invalid])
+
+        assert outputs[0].success and outputs[0].review.overall_score == 8.0
+        assert not outputs[1].success
+        assert "Invalid action" in outputs[1].next_steps
+
+
+class TestSectionStreamParser:
+    """Sections parse the same however the response is chunked."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(REVIEW_RESPONSE)])
+    def test_chunk_boundaries(self, agent, chunk_size):
+        parser = SectionStreamParser()
+        completed = []
+        for chunk in chunked(REVIEW_RESPONSE, chunk_size):
+            completed.extend(parser.feed(chunk))
+        completed.extend(parser.close())
+
+        assert parser.sections == agent._parse_sections(REVIEW_RESPONSE)
+        assert completed == list(parser.sections)
+        assert parser.sections["CRITERION FEEDBACK"] == ["### Clarity", "Easy to follow.", "### Impact", "Metrics are plausible."]
+
+    def test_section_completes_when_next_heading_arrives(self):
+        parser = SectionStreamParser()
+
+        assert parser.feed("## Overall Score\n8\n") == []
+        assert parser.feed("## Criterion") == []
+        assert parser.feed(" Scores\n") == ["OVERALL SCORE"]
+        assert parser.completed == {"OVERALL SCORE": ["8"]}